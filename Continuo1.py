@@ -1,137 +1,71 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import os
+from importlib.util import find_spec
+
+from continuo import (
+    AJUSTAVEIS,
+    CAMADAS,
+    CINETICAS,
+    DISTRIBUICOES,
+    FORMATOS,
+    ajustar,
+    blocos_dinamico,
+    blocos_resultado,
+    calcular_bandas_cache,
+    calcular_dados_padrao_cache,
+    calcular_dados_reciclo_cache,
+    calcular_dados_serie_cache,
+    calcular_produtividade,
+    calcular_serie,
+    consultar,
+    continuar_estacionario_cache,
+    dcritico_cinetica,
+    dcritico_padrao,
+    dcritico_reciclo,
+    d_otimo,
+    dcritico_serie,
+    exportar_bytes,
+    faixas,
+    fator_reciclo,
+    ler_mapa,
+    mapa_A_B_cache,
+    mapa_D_Sin_cache,
+    n_paginas,
+    pagina,
+    rendimento_aparente,
+    resumo,
+    simular_dinamico,
+)
+from continuo.graficos import (
+    grafico_continuacao_png,
+    grafico_dinamico_png,
+    grafico_estacionario_png,
+    grafico_lineweaver_burk_png,
+    grafico_mapa_png,
+    grafico_produtividade_png,
+    pre_carregar,
+)
+from continuo.imagens import DIAGRAMAS, PASTA_IMAGENS, imagem_exibicao, recorte_ampliado
+from continuo.interativo import dados_estacionario, especificacao_estacionario
+from continuo.instrumentacao import (
+    MedidorReexecucao,
+    configurar_log,
+    historico_tempos,
+    iniciar_perfil,
+    texto_perfil,
+)
+
+# O matplotlib é carregado em segundo plano enquanto o topo da página é montado
+pre_carregar()
+
+# Instrumentação: cronometra as etapas desta reexecução
+configurar_log()
+perfil = iniciar_perfil() if st.session_state.pop('perfilar_proxima', False) else None
+medidor = MedidorReexecucao()
 
 st.set_page_config(layout="wide")
 
-def calcular_dados_padrao(Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step):
-    """
-    Calcula os valores de diluição, biomassa, substrato e produto
-    para diferentes modalidades de associação em um reator contínuo.
-
-    Parâmetros:
-        Dil_min (float): Diluição mínima (1/h)
-        Dil_max (float): Diluição máxima (1/h)
-        u_max (float): Velocidade máxima específica de crescimento (1/h)
-        Ks (float): Constante de saturação (g/L)
-        Sin (float): Concentração de substrato na entrada (g/L)
-        Yx_s (float): Rendimento de biomassa por substrato (g/g)
-        Alfa (float): Coeficiente de associação
-        Beta (float): Coeficiente de não associação
-        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
-
-    Retorna:
-        dict: Dicionário com listas de Diluição, Biomassa, Substrato e Produto
-    """
-
-    # Cálculo de D crítico
-    Dcritico = u_max * Sin / (Ks + Sin)
-
-    # Intervalo de diluição
-    Dil = np.arange(Dil_min, Dil_max, step)
-
-    # Listas de resultados
-    Diluicao, Biomassa, Substrato, Produto = [], [], [], []
-    Produto_sa, Produto_na = [], []
-
-    for d in Dil:
-        s = (Ks * d) / (u_max - d)
-        b = Yx_s * (Sin - s)
-        if modalidade_associacao == 'Associado':
-            p = Alfa * (Sin - s)
-            eq_p=fr"""P = Alfa * (Sin - D)"""
-        elif modalidade_associacao == 'Semi Associado':
-            p = b * (Alfa + Beta / d)
-            eq_p=fr"""P = Alfa * (Sin - D)"""
-        else:  # Não Associado
-            p = b * (Beta / d)
-            eq_p=fr"""P = X * (Beta / D)"""
-        eq_s=fr"""S = \frac{Ks * d}{u_max-d}"""
-        eq_b=fr"""X = Yx_s*(Sin - s)"""
-        # Aqui você pode calcular Produto_sa e Produto_na se quiser diferenciá-los
-
-        # Armazenar resultados
-        Diluicao.append(d)
-        Biomassa.append(b)
-        Substrato.append(s)
-        Produto.append(p)
-
-    dados = {
-        'Diluição (1/h)': Diluicao,
-        'Biomassa (g/L)': Biomassa,
-        'Substrato (g/L)': Substrato,
-        'Produto (g/L)': Produto,
-    }
-
-    return dados, Dcritico
-
-def calcular_dados_reciclo(A,B,Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step):
-    """
-    Calcula os valores de diluição, biomassa, substrato e produto
-    para diferentes modalidades de associação em um reator contínuo.
-
-    Parâmetros:
-        Dil_min (float): Diluição mínima (1/h)
-        Dil_max (float): Diluição máxima (1/h)
-        u_max (float): Velocidade máxima específica de crescimento (1/h)
-        Ks (float): Constante de saturação (g/L)
-        Sin (float): Concentração de substrato na entrada (g/L)
-        Yx_s (float): Rendimento de biomassa por substrato (g/g)
-        Alfa (float): Coeficiente de associação
-        Beta (float): Coeficiente de não associação
-        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
-
-    Retorna:
-        dict: Dicionário com listas de Diluição, Biomassa, Substrato e Produto
-    """
-    
-    # Cálculo da fração de reciclo
-    E=(1+A-A*B)
-    # Cálculo de D crítico
-    Dcritico = u_max /E
-
-    # Intervalo de diluição
-    Dil = np.arange(Dil_min, Dil_max, step)
-
-    # Listas de resultados
-    Diluicao, Biomassa, Substrato, Produto = [], [], [], []
-    Produto_sa, Produto_na = [], []
-
-    for d in Dil:
-        s = (Ks * d*E) / (u_max - d*E)
-        b = Yx_s * (Sin - s)/E
-        if modalidade_associacao == 'Associado':
-            p = Alfa * (Sin - s)
-        elif modalidade_associacao == 'Semi Associado':
-            p = b * (Alfa + Beta / d)
-        else:  # Não Associado
-            p = b * (Beta / d)
-
-        # Aqui você pode calcular Produto_sa e Produto_na se quiser diferenciá-los
-        p_sa = 0.0
-        p_na = 0.0
-
-        # Armazenar resultados
-        Diluicao.append(d)
-        Biomassa.append(b)
-        Substrato.append(s)
-        Produto.append(p)
-        Produto_sa.append(p_sa)
-        Produto_na.append(p_na)
-
-    dados = {
-        'Diluição (1/h)': Diluicao,
-        'Biomassa (g/L)': Biomassa,
-        'Substrato (g/L)': Substrato,
-        'Produto (g/L)': Produto,
-        'Produto semi associado (g/L)': Produto_sa,
-        'Produto não associado (g/L)': Produto_na,
-    }
-
-    return dados, Dcritico
-
 st.sidebar.header("Controles")
 
 st.header('Processo Contínuo')
@@ -149,10 +83,9 @@ with c1:
     ##### Modalidade de processo
     - Original  
     - Com reciclo  
-    - Reator em série (Não Implementado)
+    - Reatores em série
     """)
     modalidade_processo=st.selectbox('**Modalidade de processo:**',['Padrão','Reciclo','Série'])
-    if modalidade_processo=='Série':st.warning('Em construção')
 with c2:
     st.subheader('Legenda')
     st.write('**VC**: Volume de controle do sistema')
@@ -168,43 +101,37 @@ with c2:
         st.write('**B**: Fator de concentração da biomassa (adm)')
         st.write('**Fr = F*A**: Vazão volumétrica do reciclo (L/h)')        
         st.write('**Xr = X*B**: Concentração de biomassa na corrente de reciclo (g/L)')        
+    if modalidade_processo=='Série':
+        st.write('**N**: Número de reatores em série')
+        st.write('**Vi**: Volume do reator i (L)')
+        st.write('**Fi**: Alimentação extra no reator i (L/h)')
+        st.write('**D = F/V1**: Taxa de diluição do primeiro reator (1/h)')
 
-# 1. Pega o diretório onde este arquivo .py está rodando
-diretorio_atual = os.path.dirname(os.path.abspath(__file__))
-
-# Função auxiliar para montar o caminho (evita repetição de código)
-def pegar_caminho_imagem(nome_arquivo):
-    return os.path.join(diretorio_atual, "Imagens", nome_arquivo)        
+medidor.iniciar('imagens')
 with c3:
     st.subheader('Representação do Processo')
-    
-    # Variável para guardar o caminho final
-    caminho_final = None 
 
-    if modalidade_processo == 'Padrão':
-        caminho_final = pegar_caminho_imagem('Dia_p_continuo.png')
-        
-    elif modalidade_processo == 'Reciclo':
-        caminho_final = pegar_caminho_imagem('Dia_p_cont_reciclo.png')
+    if modalidade_processo == 'Reciclo':
         st.warning('Imagem desatualizada')
-        
-    elif modalidade_processo == 'Série':
-        caminho_final = pegar_caminho_imagem('Dia_p_cont_serie.png')
-        # Nota: Você tinha um st.image e st.stop aqui dentro no código original. 
-        # Mantive a lógica abaixo para exibir.
-        
-    else:
-        st.warning('Nenhuma opção selecionada')
 
-    # Exibição da Imagem (Só tenta mostrar se o caminho foi definido)
-    if caminho_final:
-        # Verificação extra de segurança (opcional, mas recomendada)
-        if os.path.exists(caminho_final):
-            st.image(caminho_final, width=400)
+    # Diagrama já reduzido para a largura de exibição (cache do processo)
+    nome_imagem = DIAGRAMAS.get(modalidade_processo)
+    if nome_imagem is None:
+        st.warning('Nenhuma opção selecionada')
+    else:
+        imagem = imagem_exibicao(nome_imagem, 400)
+        if imagem is not None:
+            st.image(imagem, width=400)
         else:
-            st.error(f"Erro: Imagem não encontrada no caminho: {caminho_final}")
-            # Se quiser usar a URL do GitHub como backup, o 'try/except' entraria aqui.
-    st.warning('Adicionar uma segunda imagem com zoom no ''filtro'' de reciclo')
+            st.error(f"Erro: Imagem não encontrada no caminho: {os.path.join(PASTA_IMAGENS, nome_imagem)}")
+
+    # Detalhe ampliado do filtro de reciclo
+    if modalidade_processo == 'Reciclo':
+        detalhe = recorte_ampliado('Filtro de reciclo', 400)
+        if detalhe is not None:
+            st.image(detalhe, width=400, caption='Detalhe: filtro de reciclo')
+
+medidor.parar()
 
 st.divider()
 st.subheader('Teoria e Fórmulas')
@@ -219,6 +146,12 @@ with c1:
 with c2:    
     Ks=st.number_input('**Ks (g/L):**',value=1.0)
     Yx_s=st.number_input('**Yx_s (g/g):**',value=0.5)
+    # Manutenção de Pirt (rs = rsm + rsg); a cascata em série ainda não a considera
+    m_s=st.number_input('**m_s (g/g.h):**',min_value=0.0,value=0.0,format="%0.4f",
+                        help='Coeficiente de manutenção: rs = mu*X/Yx_s + m_s*X',
+                        disabled=modalidade_processo=='Série')
+    if modalidade_processo=='Série':
+        m_s=0.0
 with c3:    
     Alfa=st.number_input('**Alfa (g/g):**',value=1.83)
     Beta=st.number_input('**Beta (g/gh):**',value=0.155)
@@ -228,50 +161,110 @@ with c4:
         B=st.number_input('**Fator de concentração da biomassa (adm):**',value=2.0)
         Fr=st.number_input('**Vazão volumétrica do reciclo (L/h):**',value=2.0)
         Fr=st.number_input('**Concentração de biomassa na corrente de reciclo (g/L):**',value=2.0)
+    elif modalidade_processo=='Série':
+        n_estagios=int(st.number_input('**Número de reatores:**',min_value=1,max_value=500,value=2,step=1))
+        razao_volume=st.number_input('**Volume dos demais reatores (V/V1):**',min_value=0.001,value=1.0)
+        vazao_extra=st.number_input('**Alimentação extra por reator (fração de F):**',min_value=0.0,value=0.0)
+        Sin_extra=st.number_input('**Sin da alimentação extra (g/L):**',value=Sin)
+        # Tuplas para servirem de chave do cache
+        volumes=(1.0,)+(razao_volume,)*(n_estagios-1)
+        vazoes_extras=(0.0,)+(vazao_extra,)*(n_estagios-1)
+        Sin_extras=(0.0,)+(Sin_extra,)*(n_estagios-1)
     else:
         st.warning('Dados para processo com reciclo')
 
-if modalidade_processo=='Padrão':
-    Dcritico=u_max * Sin / (Ks + Sin)
+# --- Modelo cinético (Monod por padrão) ---
+with st.expander('Modelo cinético', expanded=False):
+    cinetica=st.selectbox('**Modelo cinético:**',list(CINETICAS),key='cinetica')
+    modelo_cinetico=CINETICAS[cinetica]
+    st.latex(modelo_cinetico.latex)
+    # Tupla de pares (nome, valor) para servir de chave do cache
+    parametros_cineticos=()
+    if modelo_cinetico.parametros:
+        colunas_cinetica=st.columns(len(modelo_cinetico.parametros))
+        for coluna, (nome, (descricao, padrao)) in zip(colunas_cinetica, modelo_cinetico.parametros.items()):
+            with coluna:
+                valor=st.number_input(f'**{descricao}:**',value=float(padrao),key=f'cinetica_{cinetica}_{nome}')
+            parametros_cineticos+=((nome, valor),)
+    if cinetica!='Monod':
+        st.caption('Estados estacionários obtidos numericamente; produtividade máxima buscada na malha de D')
+
+# --- Incerteza dos parâmetros (Monte Carlo) ---
+incerteza=None
+if modalidade_processo in ('Padrão','Reciclo') and cinetica=='Monod':
+    with st.expander('Incerteza dos parâmetros (Monte Carlo)', expanded=False):
+        if st.checkbox('Propagar incerteza e mostrar faixas de 5–95% no gráfico', key='incerteza'):
+            distribuicoes=['fixo', *DISTRIBUICOES]
+            especificacao={'Sin': Sin, 'Alfa': Alfa, 'Beta': Beta, 'm_s': m_s}
+            if modalidade_processo=='Reciclo':
+                especificacao.update(A=A, B=B)
+            colunas_incerteza=st.columns(4)
+            for coluna, (nome, valor) in zip(colunas_incerteza, (('u_max', u_max), ('Ks', Ks), ('Yx_s', Yx_s))):
+                with coluna:
+                    distribuicao=st.selectbox(f'**{nome}:**', distribuicoes, index=1, key=f'incerteza_{nome}')
+                    relativa=st.number_input(f'**Incerteza de {nome} (%):**', min_value=0.0, value=5.0,
+                                             key=f'incerteza_rel_{nome}',
+                                             help='Desvio padrão (normal, lognormal) ou meia largura (uniforme)')/100
+                    if distribuicao=='fixo' or relativa==0:
+                        especificacao[nome]=valor
+                    elif distribuicao=='uniforme':
+                        especificacao[nome]=('uniforme', valor*(1-relativa), valor*(1+relativa))
+                    else:
+                        especificacao[nome]=(distribuicao, valor, valor*relativa)
+            with colunas_incerteza[3]:
+                n_amostras=int(st.number_input('**Amostras:**', min_value=100, max_value=1_000_000, value=10_000,
+                                               step=1000, key='incerteza_amostras'))
+            incerteza=(tuple(especificacao.items()), n_amostras)
+
+if modalidade_processo=='Série':
+    Dcritico=dcritico_serie(u_max, Ks, Sin, vazoes_extras, Sin_extras, cinetica, parametros_cineticos)
+elif cinetica!='Monod':
+    E_cinetica=fator_reciclo(A, B) if modalidade_processo=='Reciclo' else 1.0
+    Dcritico=dcritico_cinetica(cinetica, u_max, Ks, Sin, E_cinetica, parametros_cineticos)
+elif modalidade_processo=='Padrão':
+    Dcritico=dcritico_padrao(u_max, Ks, Sin)
 elif modalidade_processo=='Reciclo':
-    Dcritico=u_max/(1+A-A*B)
-elif modalidade_processo=='Série':
-    st.warning('**Em construção**')
-    st.stop()
+    Dcritico=dcritico_reciclo(u_max, A, B)
 else:
     ...
 st.divider()
 
 
-st.header(f'Cálculos e Gráficos - {modalidade_processo}')
-c1,c2=st.columns([1,2])
-with c1:
-    st.sidebar.subheader('Taxa de diluição')
-    step = st.sidebar.number_input("**Variação de D:**",step=0.001,format="%0.3f",value=0.01,)
-    Dil_min,Dil_max=st.sidebar.slider('**Taxa de Diluição (1/h):**',min_value=0.00,max_value=Dcritico+0.05,value=(0.0,Dcritico-0.1),width=250,step=step)
-    if modalidade_processo == 'Padrão':
-        dados, Dcritico=calcular_dados_padrao(Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step)
-    elif modalidade_processo == 'Reciclo':
-        dados, Dcritico=calcular_dados_reciclo(A,B,Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step)
-    elif modalidade_processo == 'Série':
-        st.warning('Em construção')
-        st.stop()
-    else:
-        st.error('Nenhuma modalidade de processo escolhida')
-    if Dil_max>Dcritico*0.95:
-        mostrar_Dcritico=st.checkbox('Mostrar Dcritico no gráfico',False)
-    else:
-        mostrar_Dcritico=False
-    
-
+# --- Seções que reexecutam sozinhas (st.fragment) ---
+# Um widget dentro de um fragmento só reexecuta o próprio fragmento: marcar
+# "Valores para D" ou "Mostrar Dcritico" não recalcula as curvas nem redesenha
+# as demais seções. Mudanças nos parâmetros continuam reexecutando a página.
+@st.fragment
+def painel_formulas(modalidade_processo, modalidade_associacao, Dil_max, Dcritico, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                    A=None, B=None, volumes=None, vazoes_extras=None, Sin_extras=None, n_estagios=None,
+                    cinetica='Monod', m_s=0.0):
     st.subheader(f'Fórmulas Aplicadas')
+    if m_s > 0:
+        st.write('**Manutenção (Pirt):**')
+        st.latex(r"""r_s = \frac{\mu X}{Y_{x/s}} + m_s X""")
+        st.latex(fr"""Y_{{ap}} = \frac{{Y_{{x/s}} \, D E}}{{D E + m_s Y_{{x/s}}}} \quad
+                      X = \frac{{Y_{{ap}} (S_{{in}} - S)}}{{E}} \quad (m_s = {m_s})""")
+        # Nas fórmulas abaixo Yx_s passa a ser o rendimento aparente em D = Dil_max
+        E_formulas = fator_reciclo(A, B) if modalidade_processo == 'Reciclo' else 1.0
+        Yap = float(rendimento_aparente(Dil_max, Yx_s, m_s, E_formulas))
+        if modalidade_associacao == 'Associado' and Yx_s:
+            Alfa = round(Alfa * Yap / Yx_s, 4)
+        Yx_s = round(Yap, 4)
+    if cinetica != 'Monod':
+        # Sem forma fechada geral: mostra a cinética e a condição de estado estacionário
+        st.write(f'**Modelo cinético ({cinetica}):**')
+        st.latex(CINETICAS[cinetica].latex)
+        st.write('**Estado estacionário:**')
+        st.latex(r"""\mu(S, X, P) = D \cdot E""")
+        st.latex(r"""X = \frac{Y_{x/s} (S_{in} - S)}{E}""")
+        st.metric('Dcrítico (1/h)', f'{Dcritico:.3f}')
+        return
     if modalidade_processo == 'Padrão':
         S = (Ks * Dil_max) / (u_max - Dil_max)
         X = Yx_s * (Sin - S)
         X=round(X,3)
         Dil_max=round(Dil_max,2)    
-        st.sidebar.write('**Visualização das Fórmulas**')    
-        if st.sidebar.checkbox(f'Valores para D = {Dil_max} (1/h)', key='mostrar_formula'):
+        if st.checkbox(f'Valores para D = {Dil_max} (1/h)', key='mostrar_formula'):
             if modalidade_associacao == 'Associado':
                 p = Alfa * (Sin - S)
                 eq_p=fr"""P = {Alfa} * ({Sin} - {Dil_max}) = {p:.2f}(g/L)"""
@@ -309,7 +302,7 @@ with c1:
         st.latex(eq_p)
 
     elif modalidade_processo == 'Reciclo':
-        E=(1+A-A*B)
+        E=fator_reciclo(A, B)
         S = (Ks * Dil_max*E) / (u_max - Dil_max*E)
         X = Yx_s * (Sin - S)/E
         S=round(S,3)        
@@ -357,76 +350,377 @@ with c1:
         st.write('**Equação da produto:**')
         st.latex(eq_p)
 
+    elif modalidade_processo == 'Série':
+        eq_d=fr"""Dcritico = \frac{{u_{{max}} * Sin}}{{(Ks + Sin)}}"""
+        eq_f=fr"""S_{{f,i}} = \frac{{F_{{i-1}} S_{{i-1}} + F_{{e,i}} S_{{e,i}}}}{{F_i}} \quad X_{{f,i}} = \frac{{F_{{i-1}} X_{{i-1}}}}{{F_i}}"""
+        eq_s=fr"""D_i (S_{{f,i}} - S_i) = \frac{{\mu_i X_i}}{{Y_{{x/s}}}}"""
+        eq_b=fr"""D_i (X_i - X_{{f,i}}) = \mu_i X_i \quad \mu_i = \frac{{u_{{max}} S_i}}{{Ks + S_i}}"""
+        eq_p=fr"""P_i = P_{{f,i}} + \frac{{r_{{p,i}}}}{{D_i}}"""
+        Dil_max=round(Dil_max,2)
+        if st.checkbox(f'Valores para D = {Dil_max} (1/h)',key='mostrar_formula'):
+            S_s, X_s, P_s = calcular_serie(Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,
+                                           volumes, vazoes_extras, Sin_extras)
+            eq_d=fr"""Dcritico = \frac{{{u_max}*{Sin}}}{{({Ks} + {Sin})}} = {Dcritico:.2f} (1/h)"""
+            eq_s=fr"""S_{{{n_estagios}}} = {S_s[-1]:.2f} (g/L)"""
+            eq_b=fr"""X_{{{n_estagios}}} = {X_s[-1]:.2f} (g/L)"""
+            eq_p=fr"""P_{{{n_estagios}}} = {P_s[-1]:.2f} (g/L)"""
+
+        st.write('**Equação do Dcrítico (primeiro reator):**')
+        st.latex(eq_d)
+        st.write('**Alimentação do reator i:**')
+        st.latex(eq_f)
+        st.write('**Equação da substrato:**')
+        st.latex(eq_s)
+        st.write('**Equação da biomassa:**')
+        st.latex(eq_b)
+        st.write('**Equação da produto:**')
+        st.latex(eq_p)
+
+
+@st.fragment
+def painel_grafico(dados, Dil_min, Dil_max, Dcritico, titulo, max_pontos, bandas=None):
+    # Modo interativo: os dados vão uma vez ao navegador; zoom, leitura dos
+    # valores e a linha do Dcritico são tratados no cliente
+    if st.toggle('Gráfico interativo', key='grafico_interativo'):
+        st.vega_lite_chart(
+            dados_estacionario(dados['Diluição (1/h)'], dados['Biomassa (g/L)'],
+                               dados['Substrato (g/L)'], dados['Produto (g/L)'], max_pontos),
+            especificacao_estacionario(Dil_min, Dil_max, Dcritico, titulo,
+                                       mostrar_Dcritico=Dil_max>Dcritico*0.95, bandas=bandas),
+            width='stretch')
+        return
+    if Dil_max>Dcritico*0.95:
+        mostrar_Dcritico=st.checkbox('Mostrar Dcritico no gráfico',False)
+    else:
+        mostrar_Dcritico=False
+    # PNG em cache: só rasteriza de novo quando os dados ou as opções mudam
+    png=grafico_estacionario_png(dados['Diluição (1/h)'], dados['Biomassa (g/L)'], dados['Substrato (g/L)'],
+                                 dados['Produto (g/L)'], Dil_min, Dil_max, Dcritico, mostrar_Dcritico, titulo,
+                                 max_pontos=max_pontos, bandas=bandas)
+    st.image(png, width='stretch')
+
+
+# Parquet/Arrow exigem o pyarrow; sem ele a exportação cai para CSV
+FORMATOS_EXPORTACAO=FORMATOS if find_spec('pyarrow') else ('csv',)
+
+
+@st.fragment
+def painel_exportacao(gerar_blocos, nome_arquivo, chave):
+    # O arquivo só é gerado quando pedido, bloco a bloco, pelo mesmo motor da tabela
+    c1,c2=st.columns([1,3])
+    with c1:
+        formato=st.selectbox('**Formato:**',FORMATOS_EXPORTACAO,key=f'{chave}_formato')
+    with c2:
+        if st.button('Preparar arquivo para download',key=f'{chave}_preparar'):
+            st.download_button(f'Baixar {nome_arquivo}.{formato}', exportar_bytes(gerar_blocos(), formato),
+                               file_name=f'{nome_arquivo}.{formato}', key=f'{chave}_baixar')
+
+
+@st.fragment
+def painel_dados(dados):
+    # A tabela completa fica no servidor: filtro, ordenação e estatísticas
+    # são calculados aqui e só a página visível vai para o navegador
+    colunas=list(dados)
+    c1,c2,c3,c4=st.columns(4)
+    with c1:
+        ordenar_por=st.selectbox('**Ordenar por:**',['(ordem original)']+colunas,key='tabela_ordem')
+        decrescente=st.checkbox('Decrescente',key='tabela_decrescente')
+    with c2:
+        coluna_filtro=st.selectbox('**Filtrar coluna:**',['(sem filtro)']+colunas,key='tabela_filtro')
+    filtros={}
+    if coluna_filtro in colunas:
+        with c3:
+            minimo=st.number_input('**Mínimo:**',value=None,format="%0.6g",key='tabela_minimo')
+            maximo=st.number_input('**Máximo:**',value=None,format="%0.6g",key='tabela_maximo')
+        filtros[coluna_filtro]=(minimo,maximo)
+    indices=consultar(dados, ordenar_por if ordenar_por in colunas else None, decrescente, filtros)
+    with c4:
+        tamanho=st.selectbox('**Linhas por página:**',[50,100,500,1000],index=1,key='tabela_tamanho')
+        total=n_paginas(indices, tamanho)
+        numero=int(st.number_input(f'**Página (de {total}):**',min_value=1,max_value=total,value=1,step=1,
+                                   key='tabela_pagina'))
+    st.caption(f'{len(indices)} de {dados.n_linhas} linhas')
+    st.dataframe(pagina(dados, indices, numero, tamanho), hide_index=True)
+    if st.checkbox('Mostrar estatísticas da seleção',key='tabela_estatisticas'):
+        st.dataframe(resumo(dados, indices), hide_index=True)
 
 
+st.header(f'Cálculos e Gráficos - {modalidade_processo}')
+c1,c2=st.columns([1,2])
+with c1:
+    st.sidebar.subheader('Taxa de diluição')
+    step = st.sidebar.number_input("**Variação de D:**",step=0.001,format="%0.3f",value=0.01,)
+    Dil_min,Dil_max=st.sidebar.slider('**Taxa de Diluição (1/h):**',min_value=0.00,max_value=Dcritico+0.05,value=(0.0,Dcritico-0.1),width=250,step=step)
+    # Malha adaptativa: refina perto do Dcritico com bem menos pontos
+    if st.sidebar.checkbox('Malha adaptativa', key='malha_adaptativa'):
+        tolerancia = st.sidebar.number_input("**Tolerância relativa:**",min_value=1e-6,max_value=0.1,value=1e-3,format="%0.6f")
+        max_pontos = int(st.sidebar.number_input("**Máximo de pontos:**",min_value=10,value=2000,step=100))
+    else:
+        tolerancia, max_pontos = None, 2000
+    # Orçamento de pontos dos gráficos (redução LTTB); a tabela fica completa
+    pontos_grafico = int(st.sidebar.number_input("**Pontos no gráfico:**",min_value=10,value=2000,step=100))
+    medidor.iniciar('curvas')
+    if modalidade_processo == 'Padrão':
+        dados, Dcritico=calcular_dados_padrao_cache(Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step,
+                                                    tolerancia, max_pontos, cinetica=cinetica,
+                                                    parametros_cineticos=parametros_cineticos, m_s=m_s)
+    elif modalidade_processo == 'Reciclo':
+        dados, Dcritico=calcular_dados_reciclo_cache(A,B,Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step,
+                                                     tolerancia, max_pontos, cinetica=cinetica,
+                                                     parametros_cineticos=parametros_cineticos, m_s=m_s)
+    elif modalidade_processo == 'Série':
+        dados, Dcritico=calcular_dados_serie_cache(Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step,
+                                                   volumes, vazoes_extras, Sin_extras, tolerancia, max_pontos,
+                                                   cinetica=cinetica, parametros_cineticos=parametros_cineticos)
+    else:
+        st.error('Nenhuma modalidade de processo escolhida')
+    # Colunas preguiçosas: calculadas aqui, para o tempo ficar no estágio 'curvas'
+    dados.para_dict()
+    bandas=None
+    if incerteza is not None:
+        medidor.iniciar('incerteza')
+        especificacao, n_amostras = incerteza
+        bandas=faixas(calcular_bandas_cache(Dil_min, Dil_max, min(pontos_grafico, 200), especificacao,
+                                            modalidade_associacao, n_amostras))
+    medidor.parar()
+    medidor.iniciar('formulas')
+    painel_formulas(modalidade_processo, modalidade_associacao, Dil_max, Dcritico, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                    **({'A': A, 'B': B} if modalidade_processo == 'Reciclo' else {}),
+                    **({'volumes': volumes, 'vazoes_extras': vazoes_extras, 'Sin_extras': Sin_extras,
+                        'n_estagios': n_estagios} if modalidade_processo == 'Série' else {}),
+                    cinetica=cinetica, m_s=m_s)
+
+medidor.iniciar('grafico')
 with c2:
-    fig1, ax1 = plt.subplots()
-    ax2 = ax1.twinx()
-
-    # --- Define cores para clareza ---
-    cor_biomassa = 'red'
-    cor_produto = 'blue'
-    cor_substrato = 'green'
-    x=dados['Diluição (1/h)']
-    Biomassa=dados['Biomassa (g/L)']
-    Produto=dados['Produto (g/L)']
-    Substrato=dados['Substrato (g/L)']
-    # --- Plotagem ax1 ---
-    ax1.plot(x, Biomassa, 
-                label='Biomassa', color=cor_biomassa)
-    ax1.plot(x, Produto, 
-                label='Produto', color=cor_produto)
-    # --- Plotagem ax2 ---
-    ax1.plot(x, Substrato, 
-                label='Substrato', color=cor_substrato, linestyle='--')
-    # --- limitação do eixo tempo ---
-    ax1.set_xlim([Dil_min,Dil_max])
-    if mostrar_Dcritico:
-        # Linha Dcritico
-        ax1.axvline(x=Dcritico, color='black', linestyle='--', label='Dcrítico')
-
-        # Se quiser adicionar o texto "Dcrítico" próximo à linha:
-        ax1.text(Dcritico, ax1.get_ylim()[1]*1, f'Dcrítico: {Dcritico:.3f}',
-                rotation=90, color='black', va='top', ha='right')
-
-
-    # --- Configuração Eixo Principal (ax1) ---
-    ax1.set_ylabel("Concentração (g/L) [Biomassa, Produto]")
-    ax1.set_xlabel('Diluição (1/h)')
-    ax1.set_title(f'{modalidade_processo} - {modalidade_associacao}')
-    ax1.grid(True)
-    # Ajusta a cor dos ticks do ax1 se desejar (ex: vermelho)
-    ax1.tick_params(axis='y', labelcolor=cor_biomassa) 
-
-    # Força o eixo y principal a começar em 0
-    ax1.set_ylim(bottom=0)
-
-    # --- Configuração Eixo Secundário (ax2) ---
-    ax2.set_ylabel('Concentração (g/L) [Substrato]', color=cor_substrato)
-    ax2.tick_params(axis='y', labelcolor=cor_substrato)
-
-    # --- ***** A CORREÇÃO DA LEGENDA ***** ---
-    # 1. Coleta handles e labels dos DOIS eixos
-    h1, l1 = ax1.get_legend_handles_labels()
-    h2, l2 = ax2.get_legend_handles_labels()
-
-    # 2. Combina e chama a legenda UMA VEZ no ax1
-    ax1.legend(h1 + h2, l1 + l2, loc='best')
-    # ---------------------------------------------
-
-    st.pyplot(fig1)
+    painel_grafico(dados, Dil_min, Dil_max, Dcritico, f'{modalidade_processo} - {modalidade_associacao}', pontos_grafico, bandas)
+
+medidor.parar()
+
+st.divider()
+st.header(f'Ramos de Estado Estacionário - {modalidade_processo}')
+if modalidade_processo == 'Série':
+    st.info('Continuação disponível para os processos Padrão e Reciclo')
+elif st.checkbox('Traçar os ramos por continuação (ramos instáveis, dobras e lavagem)',False,key='continuacao'):
+    medidor.iniciar('continuacao')
+    E_cont = fator_reciclo(A, B) if modalidade_processo == 'Reciclo' else 1.0
+    c1,c2=st.columns([1,2])
+    with c1:
+        # mu <= u_max em todos os modelos: até 1.05*u_max/E nenhum ramo fica de fora
+        D_max_cont=st.number_input('**D máximo (1/h):**',min_value=0.001,
+                                   value=round(max(1.05*u_max/E_cont if E_cont>0 else Dil_max, Dil_max, 0.001),3),
+                                   format="%0.3f",key='continuacao_D_max')
+        variavel_cont=st.selectbox('**Variável:**',['Biomassa (g/L)','Substrato (g/L)','Produto (g/L)'],
+                                   key='continuacao_variavel')
+        continuacao=continuar_estacionario_cache(D_max_cont, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                                                 modalidade_associacao, E_cont, cinetica,
+                                                 parametros_cineticos, m_s)
+        if E_cont <= 0:
+            st.warning('E = 1 + A - A*B <= 0: não há estado estacionário com crescimento e a lavagem é instável')
+        elif not continuacao['convergiu']:
+            st.warning('A continuação não convergiu até o fim de algum ramo')
+        st.metric('Pontos no ramo com crescimento', continuacao['ramos']['Com crescimento'].n_linhas)
+        st.metric('Avaliações do modelo', continuacao['avaliacoes'])
+        if continuacao['bifurcacoes']:
+            st.write('**Bifurcações:**')
+            st.dataframe(continuacao['bifurcacoes'], hide_index=True)
+    with c2:
+        st.image(grafico_continuacao_png(continuacao, variavel_cont, 0.0, D_max_cont,
+                                         f'{modalidade_processo} - {modalidade_associacao} ({cinetica})'),
+                 width='stretch')
+        st.caption('Linha cheia: estável; tracejada: instável (autovalores do jacobiano)')
+    medidor.parar()
+
+st.divider()
+st.header(f'Produtividade Volumétrica - {modalidade_processo}')
+medidor.iniciar('produtividade')
+if modalidade_processo == 'Série':
+    st.info('Produtividade disponível para os processos Padrão e Reciclo')
+elif dados['Diluição (1/h)'].size == 0:
+    # Malha vazia (limites iguais ou passo maior que a faixa): não há máximo a mostrar
+    st.info('Nenhum ponto na faixa de diluição escolhida: amplie a faixa ou reduza o passo')
+elif modalidade_processo == 'Reciclo' and not fator_reciclo(A, B) > 0:
+    st.info('Fator de reciclo E = 1 + A - A·B não positivo: não há estado estacionário; ajuste A e B')
+else:
+    E_prod = fator_reciclo(A, B) if modalidade_processo == 'Reciclo' else 1.0
+    D_prod = dados['Diluição (1/h)']
+    if cinetica == 'Monod' and m_s == 0:
+        prod_X, prod_P = calcular_produtividade(D_prod, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E_prod)
+        otimo_X = d_otimo(u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E_prod, alvo='Biomassa')
+        otimo_P = d_otimo(u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E_prod, alvo='Produto')
+        # E -> 0 leva o ótimo (z*/E) para fora da faixa calculada: vale o máximo na malha
+        if not (float(otimo_X['D ótimo (1/h)']) <= D_prod[-1] and float(otimo_P['D ótimo (1/h)']) <= D_prod[-1]):
+            st.info('O D ótimo da forma fechada fica além da faixa de diluição calculada: '
+                    'mostrando o máximo dentro da faixa')
+            otimo_X = otimo_P = None
+    else:
+        # Sem forma fechada (outra cinética ou manutenção): máximo na malha de D já calculada
+        prod_X = D_prod * dados['Biomassa (g/L)']
+        prod_P = D_prod * dados['Produto (g/L)']
+        otimo_X = otimo_P = None
+    if otimo_X is None:
+        otimo_X, otimo_P = ({'D ótimo (1/h)': D_prod[np.argmax(prod)],
+                             'Produtividade máxima (g/L.h)': np.max(prod)} for prod in (prod_X, prod_P))
+    c1,c2=st.columns([1,2])
+    with c1:
+        st.write('**Produtividade de biomassa:**')
+        st.latex(r"""P_X = D \cdot X""")
+        st.metric('D ótimo para biomassa (1/h)', f"{float(otimo_X['D ótimo (1/h)']):.3f}")
+        st.metric('Produtividade máxima de biomassa (g/L.h)', f"{float(otimo_X['Produtividade máxima (g/L.h)']):.3f}")
+        st.write('**Produtividade de produto:**')
+        st.latex(r"""P_P = D \cdot P""")
+        st.metric('D ótimo para produto (1/h)', f"{float(otimo_P['D ótimo (1/h)']):.3f}")
+        st.metric('Produtividade máxima de produto (g/L.h)', f"{float(otimo_P['Produtividade máxima (g/L.h)']):.3f}")
+    with c2:
+        png=grafico_produtividade_png(D_prod, prod_X, prod_P, float(otimo_X['D ótimo (1/h)']),
+                                      float(otimo_P['D ótimo (1/h)']),
+                                      f'{modalidade_processo} - {modalidade_associacao}',
+                                      max_pontos=pontos_grafico)
+        st.image(png, width='stretch')
+
+medidor.parar()
+
+
+@st.fragment
+def painel_cursor_mapa(mapa):
+    # O mapa já está calculado (e em cache): mover o cursor só lê uma célula
+    (nome_x, eixo_x), (nome_y, eixo_y) = mapa['eixo_x'], mapa['eixo_y']
+    c1,c2=st.columns(2)
+    with c1:
+        x=st.slider(f'**Cursor - {nome_x}:**',float(eixo_x[0]),float(eixo_x[-1]),
+                    float((eixo_x[0]+eixo_x[-1])/2),key='mapa_cursor_x')
+    with c2:
+        y=st.slider(f'**Cursor - {nome_y}:**',float(eixo_y[0]),float(eixo_y[-1]),
+                    float((eixo_y[0]+eixo_y[-1])/2),key='mapa_cursor_y')
+    valores=ler_mapa(mapa, x, y)
+    if valores.pop('Lavagem'):
+        st.warning('Ponto na região de lavagem')
+    colunas=st.columns(len(valores))
+    for coluna, (nome, valor) in zip(colunas, valores.items()):
+        coluna.metric(nome, f'{valor:.3f}')
+
+
+st.divider()
+st.header(f'Mapas de Operação - {modalidade_processo}')
+if modalidade_processo == 'Série':
+    st.info('Mapas de operação disponíveis para os processos Padrão e Reciclo')
+elif st.checkbox('Gerar mapas de operação (D x Sin e, no reciclo, A x B)',False,key='mapas'):
+    medidor.iniciar('mapas')
+    E_mapa = fator_reciclo(A, B) if modalidade_processo == 'Reciclo' else 1.0
+    c1,c2=st.columns([1,2])
+    with c1:
+        plano=st.selectbox('**Plano:**',['D x Sin']+(['A x B'] if modalidade_processo=='Reciclo' else []),
+                           key='mapa_plano')
+        camada=st.selectbox('**Camada:**',CAMADAS,key='mapa_camada')
+        resolucao=int(st.number_input('**Pontos por eixo:**',min_value=50,max_value=4000,value=2000,step=100,
+                                      key='mapa_resolucao'))
+        if plano=='D x Sin':
+            D_limite=round(max(Dcritico, 0.01)*1.3, 3)
+            D_mapa=st.slider('**Faixa de D (1/h):**',0.0,D_limite,(0.0,D_limite),step=0.001,key='mapa_D')
+            Sin_min=st.number_input('**Sin mínimo (g/L):**',min_value=0.0,value=round(Sin*0.1,3),key='mapa_Sin_min')
+            Sin_max=st.number_input('**Sin máximo (g/L):**',min_value=0.001,value=round(Sin*3,3),key='mapa_Sin_max')
+            mapa=mapa_D_Sin_cache(D_mapa[0], D_mapa[1], Sin_min, Sin_max, u_max, Ks, Yx_s, Alfa, Beta,
+                                  modalidade_associacao, resolucao, resolucao, E_mapa, cinetica,
+                                  parametros_cineticos, m_s)
+            rotulo_fronteira='Dcrítico'
+        else:
+            D_mapa=st.number_input('**D (1/h):**',min_value=0.001,value=round(max(Dcritico*0.8, 0.001),3),
+                                   format="%0.3f",key='mapa_D_fixo')
+            A_mapa=st.slider('**Faixa de A (adm):**',0.0,2.0,(0.0,1.0),step=0.01,key='mapa_A')
+            B_mapa=st.slider('**Faixa de B (adm):**',0.0,5.0,(0.0,3.0),step=0.01,key='mapa_B')
+            mapa=mapa_A_B_cache(A_mapa[0], A_mapa[1], B_mapa[0], B_mapa[1], D_mapa, u_max, Ks, Sin, Yx_s,
+                                Alfa, Beta, modalidade_associacao, resolucao, resolucao, cinetica,
+                                parametros_cineticos, m_s)
+            rotulo_fronteira='Lavagem (D = Dcrítico)'
+    with c2:
+        st.image(grafico_mapa_png(mapa, camada, f'{plano} - {modalidade_associacao}', rotulo_fronteira),
+                 width='stretch')
+        st.caption('Cinza: lavagem (sem crescimento ou E <= 0)')
+    painel_cursor_mapa(mapa)
+    medidor.parar()
+
+st.divider()
+st.header(f'Simulação Dinâmica - {modalidade_processo}')
+if modalidade_processo == 'Série':
+    st.info('Simulação dinâmica disponível para os processos Padrão e Reciclo')
+else:
+    c1,c2=st.columns([1,2])
+    with c1:
+        simular=st.checkbox('Simular partida do reator',False)
+        X0=st.number_input('**X0 (g/L):**',value=0.1)
+        S0=st.number_input('**S0 (g/L):**',value=Sin)
+        P0=st.number_input('**P0 (g/L):**',value=0.0)
+        D_din=st.number_input('**D (1/h):**',value=round(Dcritico*0.5,3),format="%0.3f")
+        t_final=st.number_input('**Tempo de simulação (h):**',value=100.0)
+        if st.checkbox('Aplicar degrau em D'):
+            t_degrau=st.number_input('**Instante do degrau (h):**',value=t_final/2)
+            D_degrau=st.number_input('**D após o degrau (1/h):**',value=round(Dcritico*0.8,3),format="%0.3f")
+            D_sim=lambda t, idx: np.where(t < t_degrau, D_din, D_degrau)
+        else:
+            D_sim=D_din
+    with c2:
+        if simular:
+            medidor.iniciar('dinamico')
+            A_sim, B_sim = (A, B) if modalidade_processo == 'Reciclo' else (0.0, 1.0)
+            tempo=np.linspace(0, t_final, 401)
+            dinamico=simular_dinamico(tempo, X0, S0, P0, D_sim, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                                      modalidade_associacao, A=A_sim, B=B_sim, cinetica=cinetica,
+                                      parametros_cineticos=parametros_cineticos, m_s=m_s)
+            png=grafico_dinamico_png(tempo, dinamico['Biomassa (g/L)'][0], dinamico['Substrato (g/L)'][0],
+                                     dinamico['Produto (g/L)'][0],
+                                     f'{modalidade_processo} - {modalidade_associacao} (transiente)')
+            st.image(png, width='stretch')
+            painel_exportacao(lambda: blocos_dinamico(dinamico), 'simulacao_dinamica', 'exportar_dinamico')
+
+@st.fragment
+def painel_ajuste(Sin, modalidade_associacao, E, m_s):
+    # Estimação de u_max, Ks, Yx_s, Alfa e Beta a partir de medidas de estado estacionário
+    c1,c2=st.columns([1,2])
+    with c1:
+        arquivo=st.file_uploader('**Medidas (CSV: D, S, X, P com cabeçalho):**',type=['csv','txt'],
+                                 key='ajuste_arquivo')
+        nivel=st.selectbox('**Nível de confiança:**',[0.90,0.95,0.99],index=1,key='ajuste_nivel')
+    if arquivo is None:
+        st.caption(f'Usa Sin = {Sin} g/L, E = {E:.3f} e m_s = {m_s} dos parâmetros do processo')
+        return
+    medidas=np.atleast_2d(np.genfromtxt(arquivo, delimiter=',', skip_header=1))
+    if medidas.shape[1] < 3:
+        st.error('O arquivo deve ter ao menos as colunas D, S e X')
+        return
+    D_med, S_med, X_med = medidas[:, 0], medidas[:, 1], medidas[:, 2]
+    P_med = medidas[:, 3] if medidas.shape[1] > 3 else np.full_like(D_med, np.nan)
+    resultado=ajustar(D_med, S_med, X_med, P_med, Sin, modalidade_associacao, E, m_s, nivel=nivel)
+    with c1:
+        st.dataframe({
+            'Parâmetro': list(AJUSTAVEIS),
+            'Estimativa': [float(resultado[nome][0]) for nome in AJUSTAVEIS],
+            'Erro padrão': [float(resultado[f'{nome} erro padrão'][0]) for nome in AJUSTAVEIS],
+            f'IC {nivel:.0%} inf': [float(resultado[f'{nome} IC inf'][0]) for nome in AJUSTAVEIS],
+            f'IC {nivel:.0%} sup': [float(resultado[f'{nome} IC sup'][0]) for nome in AJUSTAVEIS],
+        }, hide_index=True)
+        if not resultado['Convergiu'][0]:
+            st.warning('O ajuste não convergiu; confira as medidas e a modalidade de associação')
+    with c2:
+        st.image(grafico_lineweaver_burk_png(D_med*E, S_med, resultado['u_max'][0], resultado['Ks'][0],
+                                             'Lineweaver-Burk (1/S x 1/D)'), width='stretch')
+
+
+st.divider()
+st.header('Ajuste de Parâmetros Cinéticos')
+if modalidade_processo == 'Série':
+    st.info('Ajuste disponível para os processos Padrão e Reciclo')
+else:
+    painel_ajuste(Sin, modalidade_associacao, fator_reciclo(A, B) if modalidade_processo == 'Reciclo' else 1.0, m_s)
 
 st.divider()
 st.header(f'Dados Brutos - Reator {modalidade_processo} com Produto {modalidade_associacao}')
-st.dataframe(dados)
+medidor.iniciar('tabela')
+painel_dados(dados)
+painel_exportacao(lambda: blocos_resultado(dados), f'dados_{modalidade_processo.lower()}', 'exportar_dados')
+medidor.parar()
 st.markdown("""
 ### Próximas atualizações 
-- Reator em série 
 - Gráficos Gant (Produto x Fase de crescimento)
-- Aplicar manutenção da população (rs = rsm+rsg)
-- Gráfico (1/S x 1/D)
 - Gráfico (D x D(Sin-S)/X)
-- Produtividade Volumétrica
 """)
 
 with st.sidebar:
@@ -464,4 +758,25 @@ with st.sidebar:
 
         # --- BIBLIOGRAFIA ---
         st.markdown("### 📚 Bibliografia Base")
-        st.info('**Biotecnologia Industrial (Vol. 2)** - Schmidell, Lima, Aquarone, Borzani. Edgard Blücher.')
\ No newline at end of file
+        st.info('**Biotecnologia Industrial (Vol. 2)** - Schmidell, Lima, Aquarone, Borzani. Edgard Blücher.')
+
+# --- Depuração: tempos por etapa e cProfile sob demanda ---
+tempos=medidor.finalizar(modalidade_processo=modalidade_processo, modalidade_associacao=modalidade_associacao,
+                         pontos=len(dados['Diluição (1/h)']))
+with st.sidebar:
+    with st.expander("🛠️ Depuração (tempos por etapa)", expanded=False):
+        st.write('**Esta reexecução (ms):**')
+        st.dataframe({'Etapa': list(tempos), 'Tempo (ms)': [round(t*1e3, 2) for t in tempos.values()]}, hide_index=True)
+        percentis=historico_tempos.percentis()
+        st.write(f'**Percentis das últimas {len(historico_tempos)} reexecuções (ms):**')
+        st.dataframe({'Etapa': list(percentis),
+                      'p50': [round(v['p50'], 2) for v in percentis.values()],
+                      'p90': [round(v['p90'], 2) for v in percentis.values()],
+                      'p99': [round(v['p99'], 2) for v in percentis.values()]}, hide_index=True)
+        if st.button('Capturar cProfile da próxima reexecução'):
+            st.session_state['perfilar_proxima']=True
+            st.rerun()
+        if perfil is not None:
+            st.session_state['ultimo_perfil']=texto_perfil(perfil)
+        if 'ultimo_perfil' in st.session_state:
+            st.code(st.session_state['ultimo_perfil'], language=None)
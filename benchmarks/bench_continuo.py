@@ -0,0 +1,268 @@
+"""
+Benchmarks do motor de cinética e da latência de reexecução da página.
+
+Uso:
+    python benchmarks/bench_continuo.py                 # roda e compara com o histórico
+    python benchmarks/bench_continuo.py --salvar        # roda e grava no histórico
+    python benchmarks/bench_continuo.py --rapido        # sem os passos mais finos e a página
+    python benchmarks/bench_continuo.py --limite 0.3    # regressão = 30% mais lento
+    python benchmarks/bench_continuo.py --inicio        # só os tempos de inicialização
+
+Cada caso é repetido algumas vezes e a mediana é comparada com a do último
+registro gravado em benchmarks/historico.jsonl (uma linha JSON por
+execução) na mesma máquina e com as mesmas versões de Python e NumPy. Se algum caso ficar mais lento que o limite, o script termina
+com código 1, para poder ser usado antes do deploy.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from importlib.util import find_spec
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import numpy as np  # noqa: E402
+
+from continuo import (  # noqa: E402
+    ajustar_lote,
+    calcular_dados_padrao,
+    calcular_dados_reciclo,
+    calcular_estado_estacionario,
+    continuar_estacionario,
+    ResultadoEstacionario,
+    consultar,
+    mapa_D_Sin,
+    pagina,
+    varrer_blocos,
+)
+
+HISTORICO = os.path.join(RAIZ, 'benchmarks', 'historico.jsonl')
+SCRIPT = os.path.join(RAIZ, 'Continuo1.py')
+
+# Parâmetros padrão da página
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=10.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+PASSOS = [1e-2, 1e-3, 1e-4, 1e-5, 1e-6]
+
+
+def medir(funcao, repeticoes=5):
+    """Executa a função algumas vezes e retorna a mediana do tempo (s)."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def casos_motor(passos):
+    p = PARAMETROS
+    casos = {}
+    for step in passos:
+        for modalidade in ('Associado', 'Semi Associado', 'Não Associado'):
+            # As colunas são preguiçosas: para_dict() força o cálculo de todas
+            casos[f'padrao[{modalidade}, step={step:g}]'] = lambda step=step, m=modalidade: \
+                calcular_dados_padrao(0.0, 0.36, p['u_max'], p['Ks'], p['Sin'], p['Yx_s'],
+                                      p['Alfa'], p['Beta'], m, step)[0].para_dict()
+        casos[f'reciclo[Semi Associado, step={step:g}]'] = lambda step=step: \
+            calcular_dados_reciclo(0.5, 2.0, 0.0, 0.7, p['u_max'], p['Ks'], p['Sin'], p['Yx_s'],
+                                   p['Alfa'], p['Beta'], 'Semi Associado', step)[0].para_dict()
+    return casos
+
+
+def casos_varredura(rapido):
+    n = 20 if rapido else 100
+    grade = dict(u_max=np.linspace(0.2, 0.6, n), Ks=np.linspace(0.5, 2.0, n),
+                 Sin=np.linspace(5, 20, 10), Yx_s=0.5, Alfa=1.83, Beta=0.155)
+    D = np.linspace(0, 0.5, 1000)
+
+    def varrer():
+        for _ in varrer_blocos(grade, D, 'Semi Associado'):
+            pass
+    return {f'varredura[{n * n * 10 * 1000:.0e} pontos]': varrer}
+
+
+def casos_ajuste(rapido):
+    n = 1000 if rapido else 10_000
+    rng = np.random.default_rng(0)
+    p = PARAMETROS
+    u_max = rng.uniform(0.3, 0.6, n)[:, None]
+    D = np.linspace(0.03, 0.85, 12)[None, :] * u_max
+    S, X, P = calcular_estado_estacionario(D, u_max, p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'],
+                                           p['Beta'], 'Semi Associado')
+    ruido = lambda v: v * (1 + 0.02 * rng.standard_normal(v.shape))  # noqa: E731
+    dados = {'D': D, 'S': ruido(S), 'X': ruido(X), 'P': ruido(P)}
+    return {f'ajuste[{n} conjuntos]': lambda: ajustar_lote(dados, p['Sin'], 'Semi Associado')}
+
+
+def casos_mapas(rapido):
+    n = 500 if rapido else 2000
+    p = PARAMETROS
+    return {f'mapa[D x Sin, {n}x{n}]': lambda: mapa_D_Sin(
+        0.0, 0.5, 1.0, 30.0, p['u_max'], p['Ks'], p['Yx_s'], p['Alfa'], p['Beta'],
+        'Semi Associado', n, n)}
+
+
+def casos_continuacao():
+    p = PARAMETROS
+    return {f'continuacao[{cinetica}]': (lambda cinetica=cinetica: continuar_estacionario(
+        0.5, p['u_max'], p['Ks'], 50.0, p['Yx_s'], p['Alfa'], p['Beta'], 'Semi Associado',
+        cinetica=cinetica)) for cinetica in ('Monod', 'Haldane')}
+
+
+def casos_renderizacao():
+    casos = {}
+    p = PARAMETROS
+    dados, Dcritico = calcular_dados_padrao(0.0, 0.36, p['u_max'], p['Ks'], p['Sin'], p['Yx_s'],
+                                            p['Alfa'], p['Beta'], 'Semi Associado', 1e-4)
+    try:
+        from continuo.graficos import desenhar_estacionario, renderizar_png
+    except ImportError:
+        pass
+    else:
+        casos['grafico[png, 3600 pontos]'] = lambda: renderizar_png(desenhar_estacionario(
+            dados['Diluição (1/h)'], dados['Biomassa (g/L)'], dados['Substrato (g/L)'],
+            dados['Produto (g/L)'], 0.0, 0.36, Dcritico, True, 'benchmark'))
+
+    # A página só envia as linhas visíveis: mede a consulta e o recorte de
+    # 100 linhas, a frio (tabela nova) e na reexecução (seleção guardada)
+    filtros = {'Biomassa (g/L)': (1.0, None)}
+
+    def consulta_a_frio():
+        tabela = ResultadoEstacionario(dados.para_dict())
+        return pagina(tabela, consultar(tabela, 'Produto (g/L)', True, filtros), 1)
+    casos['tabela[pagina a frio, 3600 linhas]'] = consulta_a_frio
+    casos['tabela[pagina, reexecucao]'] = lambda: pagina(
+        dados, consultar(dados, 'Produto (g/L)', True, filtros), 2)
+    return casos
+
+
+def casos_pagina():
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return {}
+
+    def reexecutar():
+        app = AppTest.from_file(SCRIPT, default_timeout=120)
+        app.run()
+        if app.exception:
+            raise RuntimeError(app.exception)
+    return {'pagina[reexecucao completa]': reexecutar}
+
+
+def _processo_novo(codigo):
+    """Executa o código em um interpretador novo (importações a frio)."""
+    def executar():
+        subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, check=True)
+    return executar
+
+
+def casos_inicializacao(rapido):
+    """
+    Tempo de um processo novo até cada etapa da inicialização.
+
+    Inclui a partida do interpretador (caso 'inicio[python]') para que a
+    diferença entre os casos mostre o custo de cada importação.
+    """
+    casos = {
+        'inicio[python]': _processo_novo('pass'),
+        'inicio[import continuo]': _processo_novo('import continuo'),
+        'inicio[import pagina]': _processo_novo(
+            'import continuo.graficos, continuo.interativo, continuo.imagens, continuo.instrumentacao'),
+        'inicio[matplotlib]': _processo_novo('import matplotlib.figure, matplotlib.backends.backend_agg'),
+    }
+    if not rapido and find_spec('streamlit') is not None:
+        # Primeira renderização completa da página em um processo novo
+        casos['inicio[primeira execucao da pagina]'] = _processo_novo(
+            'from streamlit.testing.v1 import AppTest\n'
+            f'app = AppTest.from_file({SCRIPT!r}, default_timeout=120)\n'
+            'app.run()\n'
+            'assert not app.exception, app.exception')
+    return casos
+
+
+def versao_git():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def ambiente():
+    """Identifica a máquina e as versões; só registros iguais são comparáveis."""
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'maquina': platform.node()}
+
+
+def ultimo_registro(atual):
+    """Último registro do histórico gravado no mesmo ambiente (ou None)."""
+    if not os.path.exists(HISTORICO):
+        return None
+    with open(HISTORICO, encoding='utf-8') as arquivo:
+        registros = [json.loads(linha) for linha in arquivo if linha.strip()]
+    for registro in reversed(registros):
+        if all(registro.get(chave) == valor for chave, valor in atual.items()):
+            return registro
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--salvar', action='store_true', help='grava o resultado no histórico')
+    parser.add_argument('--rapido', action='store_true', help='pula os casos mais lentos')
+    parser.add_argument('--limite', type=float, default=0.2,
+                        help='aumento relativo tolerado antes de acusar regressão (padrão: 0.2)')
+    parser.add_argument('--inicio', action='store_true', help='mede apenas a inicialização')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    casos = {}
+    if not args.inicio:
+        casos.update(casos_motor(PASSOS[:3] if args.rapido else PASSOS))
+        casos.update(casos_varredura(args.rapido))
+        casos.update(casos_ajuste(args.rapido))
+        casos.update(casos_mapas(args.rapido))
+        casos.update(casos_continuacao())
+        casos.update(casos_renderizacao())
+        if not args.rapido:
+            casos.update(casos_pagina())
+    casos.update(casos_inicializacao(args.rapido))
+
+    resultados = {}
+    for nome, funcao in casos.items():
+        funcao()  # aquecimento
+        resultados[nome] = medir(funcao, args.repeticoes)
+        print(f'{nome:<45} {resultados[nome] * 1e3:10.3f} ms')
+
+    atual = ambiente()
+    anterior = ultimo_registro(atual)
+    regressoes = []
+    if anterior is None:
+        print('Sem registro anterior nesta máquina/versões: nada a comparar')
+    else:
+        for nome, tempo in resultados.items():
+            base = anterior['resultados'].get(nome)
+            if base and tempo > base * (1 + args.limite):
+                regressoes.append(nome)
+                print(f'REGRESSÃO: {nome}: {base * 1e3:.3f} ms -> {tempo * 1e3:.3f} ms')
+
+    if args.salvar:
+        registro = {
+            'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': versao_git(),
+            **atual,
+            'resultados': resultados,
+        }
+        with open(HISTORICO, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+
+    return 1 if regressoes else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Núcleo de cálculo do Projeto Contínuo.
+
+Expõe os modelos de estado estacionário sem depender do Streamlit,
+pandas ou matplotlib.
+"""
+from .ajuste import AJUSTAVEIS, ajustar, ajustar_lote, empilhar_conjuntos, lineweaver_burk
+from .cache import CacheResultados, memorizar
+from .cinetica import CINETICAS, ModeloCinetico, obter_cinetica, raizes_intervalo, registrar
+from .continuacao import BIFURCACOES, RAMOS, continuar_estacionario, continuar_estacionario_cache
+from .dinamico import derivadas, simular_dinamico
+from .exportacao import FORMATOS, blocos_dinamico, blocos_resultado, exportar, exportar_bytes
+from .incerteza import (
+    DISTRIBUICOES,
+    amostrar_parametros,
+    bandas_incerteza,
+    calcular_bandas,
+    calcular_bandas_cache,
+    faixas,
+)
+from .malha import malha_adaptativa
+from .mapas import CAMADAS, cache_mapas, ler_mapa, mapa_A_B, mapa_A_B_cache, mapa_D_Sin, mapa_D_Sin_cache
+from .modelo import (
+    cache_estacionario,
+    calcular_dados_padrao,
+    calcular_dados_padrao_cache,
+    calcular_dados_reciclo,
+    calcular_dados_reciclo_cache,
+    calcular_dados_serie,
+    calcular_dados_serie_cache,
+    calcular_estado_estacionario,
+    calcular_serie,
+    com_manutencao,
+    dcritico_cinetica,
+    dcritico_padrao,
+    dcritico_reciclo,
+    dcritico_serie,
+    estados_estacionarios,
+    fator_reciclo,
+    rendimento_aparente,
+)
+from .produtividade import calcular_produtividade, d_otimo
+from .resultado import ResultadoEstacionario
+from .tabela import consultar, n_paginas, pagina, resumo
+from .varredura import PARAMETROS, varrer, varrer_blocos
+
+__all__ = [
+    "AJUSTAVEIS",
+    "ajustar",
+    "ajustar_lote",
+    "empilhar_conjuntos",
+    "lineweaver_burk",
+    "CacheResultados",
+    "cache_estacionario",
+    "calcular_dados_padrao_cache",
+    "calcular_dados_reciclo_cache",
+    "calcular_bandas_cache",
+    "calcular_dados_serie_cache",
+    "continuar_estacionario_cache",
+    "cache_mapas",
+    "mapa_A_B_cache",
+    "mapa_D_Sin_cache",
+    "memorizar",
+    "CINETICAS",
+    "ModeloCinetico",
+    "obter_cinetica",
+    "raizes_intervalo",
+    "registrar",
+    "BIFURCACOES",
+    "RAMOS",
+    "continuar_estacionario",
+    "derivadas",
+    "simular_dinamico",
+    "FORMATOS",
+    "blocos_dinamico",
+    "blocos_resultado",
+    "exportar",
+    "exportar_bytes",
+    "DISTRIBUICOES",
+    "amostrar_parametros",
+    "bandas_incerteza",
+    "calcular_bandas",
+    "faixas",
+    "malha_adaptativa",
+    "CAMADAS",
+    "ler_mapa",
+    "mapa_A_B",
+    "mapa_D_Sin",
+    "calcular_produtividade",
+    "d_otimo",
+    "ResultadoEstacionario",
+    "consultar",
+    "n_paginas",
+    "pagina",
+    "resumo",
+    "PARAMETROS",
+    "varrer",
+    "varrer_blocos",
+    "calcular_dados_padrao",
+    "calcular_dados_reciclo",
+    "calcular_dados_serie",
+    "calcular_estado_estacionario",
+    "calcular_serie",
+    "com_manutencao",
+    "dcritico_cinetica",
+    "dcritico_padrao",
+    "dcritico_reciclo",
+    "dcritico_serie",
+    "estados_estacionarios",
+    "fator_reciclo",
+    "rendimento_aparente",
+]
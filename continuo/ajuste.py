@@ -0,0 +1,463 @@
+"""
+Estimação dos parâmetros cinéticos a partir de dados de estado estacionário.
+
+Recebe tabelas medidas (D, S, X, P) de quimiostato e estima u_max, Ks,
+Yx_s, Alfa e Beta em duas etapas:
+
+1. Estimativa inicial linear: Lineweaver-Burk (1/D = Ks/u_max * 1/S +
+   1/u_max) para u_max e Ks, o balanço de biomassa para Yx_s e o balanço
+   de produto para Alfa e Beta.
+2. Mínimos quadrados não lineares (Levenberg-Marquardt) das três curvas
+   ao mesmo tempo, com as mesmas equações da página
+   (calcular_estado_estacionario). u_max, Ks e Yx_s são ajustados em
+   escala logarítmica, o que os mantém positivos.
+
+Muitos conjuntos de dados independentes (uma cepa ou corrida cada) são
+ajustados juntos: os conjuntos são empilhados em arrays (conjuntos x
+pontos, NaN onde falta medida) e cada iteração do Levenberg-Marquardt é
+uma única passada vetorizada sobre todos eles. ajustar_lote divide os
+conjuntos em blocos que podem ser distribuídos entre processos.
+
+Os intervalos de confiança vêm da matriz de covariância assintótica
+s²(JᵀJ)⁻¹ e da distribuição t de Student. Depende apenas do NumPy.
+"""
+from statistics import NormalDist
+
+import numpy as np
+
+from .modelo import calcular_estado_estacionario
+from .resultado import ResultadoEstacionario
+from .varredura import em_ordem
+
+# Parâmetros estimados; os três primeiros são ajustados em escala log
+AJUSTAVEIS = ('u_max', 'Ks', 'Yx_s', 'Alfa', 'Beta')
+_LOGARITMICOS = ('u_max', 'Ks', 'Yx_s')
+
+# Colunas esperadas em cada conjunto de dados (Produto é opcional)
+COLUNAS = ('Diluição (1/h)', 'Substrato (g/L)', 'Biomassa (g/L)', 'Produto (g/L)')
+
+# Conjuntos por bloco em ajustar_lote
+CONJUNTOS_POR_BLOCO = 2000
+
+
+def parametros_ativos(modalidade_associacao):
+    """
+    Parâmetros identificáveis para a modalidade de associação.
+
+    Beta não aparece no modelo associado e Alfa não aparece no não
+    associado; esses ficam fora do ajuste (NaN no resultado).
+    """
+    if modalidade_associacao == 'Associado':
+        return ('u_max', 'Ks', 'Yx_s', 'Alfa')
+    if modalidade_associacao == 'Semi Associado':
+        return AJUSTAVEIS
+    return ('u_max', 'Ks', 'Yx_s', 'Beta')  # Não Associado
+
+
+def empilhar_conjuntos(conjuntos):
+    """
+    Empilha conjuntos de tamanhos diferentes em arrays (conjuntos, pontos).
+
+    Parâmetros:
+        conjuntos (iterable): Tabelas (dict, ResultadoEstacionario, ...) com
+            as colunas de COLUNAS; Produto pode faltar
+
+    Retorna:
+        dict: 'D', 'S', 'X', 'P' -> arrays float64 com NaN nas posições vazias
+    """
+    conjuntos = list(conjuntos)
+    n_pontos = max((len(c[COLUNAS[0]]) for c in conjuntos), default=0)
+    saida = {nome: np.full((len(conjuntos), n_pontos), np.nan) for nome in 'DSXP'}
+    for i, conjunto in enumerate(conjuntos):
+        for nome, coluna in zip('DSXP', COLUNAS):
+            if coluna in conjunto:
+                valores = np.asarray(conjunto[coluna], dtype=np.float64)
+                saida[nome][i, :len(valores)] = valores
+    return saida
+
+
+def _por_conjunto(valor, n):
+    """Escalar ou array com um valor por conjunto -> coluna (n, 1)."""
+    return np.broadcast_to(np.asarray(valor, dtype=np.float64), (n,))[:, None]
+
+
+def _regressao(colunas, y, validos):
+    """
+    Mínimos quadrados lineares por linha (conjunto), só nos pontos válidos.
+
+    Parâmetros:
+        colunas (list): Regressores (n, m)
+        y (array): Resposta (n, m)
+        validos (array): Máscara (n, m)
+
+    Retorna:
+        array: Coeficientes (n, len(colunas)); NaN se o sistema é singular
+    """
+    A = np.stack([np.where(validos, c, 0.0) for c in colunas], axis=-1)
+    b = np.where(validos, y, 0.0)
+    AtA = np.einsum('nmi,nmj->nij', A, A)
+    Atb = np.einsum('nmi,nm->ni', A, b)
+    coeficientes = np.full(Atb.shape, np.nan)
+    singular = np.abs(np.linalg.det(AtA)) <= 1e-300
+    if np.any(~singular):
+        coeficientes[~singular] = np.linalg.solve(AtA[~singular], Atb[~singular][..., None])[..., 0]
+    return coeficientes
+
+
+def lineweaver_burk(D, S):
+    """
+    Estima u_max e Ks pela linearização de Lineweaver-Burk (1/S x 1/D).
+
+    No quimiostato mu = D, logo 1/D = (Ks/u_max)*(1/S) + 1/u_max. Pontos
+    com D ou S não positivos (ou NaN) são ignorados.
+
+    Parâmetros:
+        D (array): Taxas de diluição (1/h), (pontos,) ou (conjuntos, pontos)
+        S (array): Substrato medido (g/L), mesma forma de D
+
+    Retorna:
+        tuple: Arrays (u_max, Ks), um valor por conjunto; NaN se a reta
+            não tem intercepto positivo
+    """
+    D = np.atleast_2d(np.asarray(D, dtype=np.float64))
+    S = np.atleast_2d(np.asarray(S, dtype=np.float64))
+    validos = (D > 0) & (S > 0) & np.isfinite(D) & np.isfinite(S)
+    with np.errstate(divide='ignore'):
+        inclinacao, intercepto = _regressao([1 / S, np.ones_like(S)], 1 / D, validos).T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u_max = np.where(intercepto > 0, 1 / intercepto, np.nan)
+        Ks = np.where(intercepto > 0, inclinacao / intercepto, np.nan)
+    return u_max, Ks
+
+
+def estimativa_inicial(D, S, X, P, Sin, modalidade_associacao, E=1.0, m_s=0.0):
+    """
+    Chute inicial linear para todos os conjuntos de uma vez.
+
+    Parâmetros:
+        D, S, X, P (array): Medidas (conjuntos, pontos), NaN onde falta
+        Sin (float | array): Substrato na alimentação de cada conjunto (g/L)
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float | array): Fator de reciclo de cada conjunto (adm)
+        m_s (float | array): Coeficiente de manutenção conhecido (g/g.h)
+
+    Retorna:
+        dict: nome -> array (conjuntos,) para cada parâmetro de AJUSTAVEIS
+    """
+    n = D.shape[0]
+    Sin, E, m_s = (_por_conjunto(v, n) for v in (Sin, E, m_s))
+
+    u_max, Ks = lineweaver_burk(D * E, S)
+    # Reta sem intercepto positivo (dados ruidosos): u_max um pouco acima
+    # do maior D*E com crescimento e Ks da mediana dos pontos
+    crescimento = (X > 0) & (S > 0) & (D > 0)
+    DE_max = np.nanmax(np.where(crescimento, D * E, np.nan), axis=1, initial=0.0)
+    substituir = ~(np.isfinite(u_max) & (u_max > DE_max) & (Ks > 0))
+    u_reserva = 1.2 * np.where(DE_max > 0, DE_max, 1.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        Ks_pontos = np.where(crescimento, S * (u_reserva[:, None] - D * E) / (D * E), np.nan)
+        Ks_reserva = np.nanmedian(np.where(Ks_pontos > 0, Ks_pontos, np.nan), axis=1)
+    u_max = np.where(substituir, u_reserva, u_max)
+    Ks = np.where(substituir, np.where(np.isfinite(Ks_reserva), Ks_reserva, 1.0), Ks)
+
+    # Balanço de biomassa: 1/Yap = (Sin - S)/(E*X) = 1/Yx_s + m_s/(D*E)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        inverso = np.where(crescimento, (Sin - S) / (E * X) - m_s / (D * E), np.nan)
+        Yx_s = 1 / np.nanmedian(np.where(inverso > 0, inverso, np.nan), axis=1)
+    Yx_s = np.where(np.isfinite(Yx_s), Yx_s, 0.5)
+
+    # Balanço de produto com o X medido (linear em Alfa e Beta)
+    validos = crescimento & np.isfinite(P)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if modalidade_associacao == 'Associado':
+            Alfa = _regressao([E * X / Yx_s[:, None]], P, validos)[:, 0]
+            Beta = np.zeros(n)
+        elif modalidade_associacao == 'Semi Associado':
+            Alfa, Beta = _regressao([X, X / D], P, validos).T
+        else:  # Não Associado
+            Alfa = np.zeros(n)
+            Beta = _regressao([X / D], P, validos)[:, 0]
+    return {'u_max': u_max, 'Ks': Ks, 'Yx_s': Yx_s,
+            'Alfa': np.nan_to_num(Alfa), 'Beta': np.nan_to_num(Beta)}
+
+
+def _quantil_t(q, gl):
+    """
+    Quantil q da distribuição t de Student com gl graus de liberdade.
+
+    Forma exata para 1 e 2 graus de liberdade; acima disso, expansão de
+    Cornish-Fisher em torno da normal (erro relativo < 0,2% a partir de 3).
+    """
+    gl = np.asarray(gl, dtype=np.float64)
+    z = NormalDist().inv_cdf(q)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = z + g1 / gl + g2 / gl ** 2 + g3 / gl ** 3 + g4 / gl ** 4
+    t = np.where(gl == 1, np.tan(np.pi * (q - 0.5)), t)
+    t = np.where(gl == 2, (2 * q - 1) / np.sqrt(2 * q * (1 - q)), t)
+    return np.where(gl >= 1, t, np.nan)
+
+
+class _Problema:
+    """Dados de um bloco de conjuntos e avaliação dos resíduos."""
+
+    def __init__(self, dados, Sin, modalidade_associacao, E, m_s, escalas=None):
+        self.dados = dados
+        self.n = dados['D'].shape[0]
+        self.Sin, self.E, self.m_s = (_por_conjunto(v, self.n) for v in (Sin, E, m_s))
+        self.modalidade = modalidade_associacao
+        self.ativos = parametros_ativos(modalidade_associacao)
+        # Cada curva pesa pela sua escala (resíduos relativos ao maior valor medido)
+        if escalas is None:
+            escalas = {}
+            for nome in 'SXP':
+                maximo = np.nanmax(np.abs(dados[nome]), axis=1, initial=0.0, keepdims=True)
+                escalas[nome] = np.where(maximo > 0, maximo, 1.0)
+        self.escalas = escalas
+        self.validos = {nome: np.isfinite(dados[nome]) & np.isfinite(dados['D']) for nome in 'SXP'}
+        self.n_residuos = sum(v.sum(axis=1) for v in self.validos.values())
+
+    def subconjunto(self, idx):
+        """Problema restrito aos conjuntos idx."""
+        sub = _Problema.__new__(_Problema)
+        sub.dados = {k: v[idx] for k, v in self.dados.items()}
+        sub.n = len(idx)
+        sub.Sin, sub.E, sub.m_s = self.Sin[idx], self.E[idx], self.m_s[idx]
+        sub.modalidade, sub.ativos = self.modalidade, self.ativos
+        sub.escalas = {k: v[idx] for k, v in self.escalas.items()}
+        sub.validos = {k: v[idx] for k, v in self.validos.items()}
+        sub.n_residuos = self.n_residuos[idx]
+        return sub
+
+    def parametros(self, theta):
+        """Vetor ajustado (n, k) -> dict de parâmetros (n, 1)."""
+        p = {'Alfa': np.zeros((self.n, 1)), 'Beta': np.zeros((self.n, 1))}
+        for j, nome in enumerate(self.ativos):
+            valor = theta[:, j:j + 1]
+            p[nome] = np.exp(valor) if nome in _LOGARITMICOS else valor
+        return p
+
+    def residuos(self, theta):
+        """Resíduos ponderados (n, 3*pontos); pontos sem medida valem 0."""
+        p = self.parametros(theta)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            S, X, P = calcular_estado_estacionario(
+                np.nan_to_num(self.dados['D']), p['u_max'], p['Ks'], self.Sin, p['Yx_s'],
+                p['Alfa'], p['Beta'], self.modalidade, self.E, m_s=self.m_s)
+        partes = []
+        for nome, modelo in (('S', S), ('X', X), ('P', P)):
+            r = (modelo - self.dados[nome]) / self.escalas[nome]
+            partes.append(np.where(self.validos[nome], r, 0.0))
+        return np.nan_to_num(np.concatenate(partes, axis=1), nan=1e10, posinf=1e10, neginf=-1e10)
+
+    def jacobiana(self, theta, r):
+        """Jacobiana por diferenças progressivas (n, residuos, k)."""
+        J = np.empty(r.shape + (theta.shape[1],))
+        for j in range(theta.shape[1]):
+            h = 1e-7 * np.maximum(np.abs(theta[:, j]), 1.0)
+            deslocado = theta.copy()
+            deslocado[:, j] += h
+            J[..., j] = (self.residuos(deslocado) - r) / h[:, None]
+        return J
+
+
+def _levenberg_marquardt(problema, theta, max_iteracoes, tolerancia):
+    """
+    Levenberg-Marquardt em lote: cada conjunto tem seu próprio amortecimento
+    e critério de parada; a cada iteração só os conjuntos ainda ativos são
+    avaliados.
+    """
+    n, k = theta.shape
+    r = problema.residuos(theta)
+    sqr = np.einsum('nr,nr->n', r, r)
+    amortecimento = np.full(n, 1e-3)
+    iteracoes = np.zeros(n, dtype=np.intp)
+    convergiu = np.zeros(n, dtype=bool)
+    ativos = np.arange(n)
+
+    for _ in range(max_iteracoes):
+        if len(ativos) == 0:
+            break
+        sub = problema.subconjunto(ativos)
+        th, ra = theta[ativos], r[ativos]
+        J = sub.jacobiana(th, ra)
+        JtJ = np.einsum('nri,nrj->nij', J, J)
+        gradiente = np.einsum('nri,nr->ni', J, ra)
+        diagonal = np.einsum('nii->ni', JtJ)
+        sistema = JtJ + (amortecimento[ativos][:, None] * np.maximum(diagonal, 1e-12))[..., None] \
+            * np.eye(k)
+        passo = -np.linalg.solve(sistema, gradiente[..., None])[..., 0]
+
+        th_novo = th + passo
+        r_novo = sub.residuos(th_novo)
+        sqr_novo = np.einsum('nr,nr->n', r_novo, r_novo)
+        aceito = sqr_novo < sqr[ativos]
+
+        ia = ativos[aceito]
+        reducao = sqr[ia] - sqr_novo[aceito]
+        theta[ia], r[ia], sqr[ia] = th_novo[aceito], r_novo[aceito], sqr_novo[aceito]
+        amortecimento[ia] /= 3
+        amortecimento[ativos[~aceito]] *= 4
+        iteracoes[ativos] += 1
+
+        # Parada: redução relativa pequena, passo pequeno ou gradiente nulo
+        parado = np.zeros(len(ativos), dtype=bool)
+        parado[aceito] = (reducao <= tolerancia * (sqr[ia] + tolerancia)) | \
+            (np.max(np.abs(passo[aceito]), axis=1) <= np.sqrt(tolerancia))
+        parado |= np.max(np.abs(gradiente), axis=1) <= tolerancia
+        convergiu[ativos[parado]] = True
+        esgotado = amortecimento[ativos] > 1e12
+        ativos = ativos[~(parado | esgotado)]
+
+    return theta, sqr, iteracoes, convergiu
+
+
+def ajustar(D, S, X, P, Sin, modalidade_associacao, E=1.0, m_s=0.0, chute=None, nivel=0.95,
+            max_iteracoes=200, tolerancia=1e-12, dtype=np.float64):
+    """
+    Ajusta os parâmetros cinéticos de vários conjuntos de dados de uma vez.
+
+    Parâmetros:
+        D, S, X, P (array): Medidas (conjuntos, pontos) ou (pontos,); NaN
+            onde falta medida (P inteiro NaN ajusta só S e X)
+        Sin (float | array): Substrato na alimentação de cada conjunto (g/L)
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float | array): Fator de reciclo de cada conjunto (adm); 1 no padrão
+        m_s (float | array): Coeficiente de manutenção conhecido (g/g.h)
+        chute (dict | None): Valores iniciais por parâmetro; None usa
+            estimativa_inicial (Lineweaver-Burk e balanços)
+        nivel (float): Nível de confiança dos intervalos
+        max_iteracoes (int): Máximo de iterações do Levenberg-Marquardt
+        tolerancia (float): Tolerância relativa na soma dos quadrados
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+
+    Retorna:
+        ResultadoEstacionario: Uma linha por conjunto: para cada parâmetro
+            o valor, o erro padrão e os limites do intervalo de confiança
+            ('u_max', 'u_max erro padrão', 'u_max IC inf', 'u_max IC sup',
+            ...), além de 'SQR' (soma dos quadrados ponderada), 'Graus de
+            liberdade', 'Iterações' e 'Convergiu' (1 ou 0)
+    """
+    dados = {nome: np.atleast_2d(np.asarray(v, dtype=np.float64))
+             for nome, v in zip('DSXP', (D, S, X, P))}
+    dados['P'] = np.broadcast_to(dados['P'], dados['D'].shape)
+    problema = _Problema(dados, Sin, modalidade_associacao, E, m_s)
+    n = problema.n
+
+    inicial = estimativa_inicial(dados['D'], dados['S'], dados['X'], dados['P'], Sin,
+                                 modalidade_associacao, E, m_s)
+    if chute is not None:
+        inicial.update({nome: np.broadcast_to(np.asarray(v, dtype=np.float64), (n,))
+                        for nome, v in dict(chute).items()})
+    theta = np.column_stack([np.log(inicial[nome]) if nome in _LOGARITMICOS else inicial[nome]
+                             for nome in problema.ativos])
+
+    theta, sqr, iteracoes, convergiu = _levenberg_marquardt(problema, theta, max_iteracoes,
+                                                            tolerancia)
+
+    # Covariância assintótica: s² (JᵀJ)⁻¹ no espaço ajustado
+    r = problema.residuos(theta)
+    J = problema.jacobiana(theta, r)
+    k = theta.shape[1]
+    gl = problema.n_residuos - k
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s2 = np.where(gl > 0, sqr / gl, np.nan)
+        covariancia = s2[:, None, None] * np.linalg.pinv(np.einsum('nri,nrj->nij', J, J))
+        erro = np.sqrt(np.maximum(np.einsum('nii->ni', covariancia), 0.0))
+    t = _quantil_t(1 - (1 - nivel) / 2, gl)
+
+    colunas = {'Conjunto': np.arange(n)}
+    for nome in AJUSTAVEIS:
+        if nome not in problema.ativos:
+            valor = inf = sup = ep = np.full(n, np.nan)
+        else:
+            j = problema.ativos.index(nome)
+            if nome in _LOGARITMICOS:
+                # Intervalo simétrico em log: assimétrico e sempre positivo
+                valor = np.exp(theta[:, j])
+                ep = valor * erro[:, j]
+                inf, sup = np.exp(theta[:, j] - t * erro[:, j]), np.exp(theta[:, j] + t * erro[:, j])
+            else:
+                valor, ep = theta[:, j], erro[:, j]
+                inf, sup = valor - t * ep, valor + t * ep
+        if nome in ('Alfa', 'Beta'):
+            # Sem medidas de produto Alfa e Beta não são identificáveis
+            sem_produto = ~problema.validos['P'].any(axis=1)
+            valor, ep, inf, sup = (np.where(sem_produto, np.nan, v) for v in (valor, ep, inf, sup))
+        colunas[nome] = valor
+        colunas[f'{nome} erro padrão'] = ep
+        colunas[f'{nome} IC inf'] = inf
+        colunas[f'{nome} IC sup'] = sup
+    colunas['SQR'] = sqr
+    colunas['Graus de liberdade'] = gl
+    colunas['Iterações'] = iteracoes
+    colunas['Convergiu'] = convergiu
+    return ResultadoEstacionario(colunas, dtype)
+
+
+def _ajustar_bloco(tarefa):
+    """
+    Ajusta um bloco [inicio, fim) de conjuntos.
+
+    Função de nível de módulo para poder ser enviada a outros processos.
+    """
+    dados, Sin, modalidade_associacao, E, m_s, inicio, fim, opcoes = tarefa
+    resultado = ajustar(dados['D'], dados['S'], dados['X'], dados['P'], Sin,
+                        modalidade_associacao, E, m_s, **opcoes)
+    colunas = dict(resultado.para_dict())
+    colunas['Conjunto'] = colunas['Conjunto'] + inicio
+    return ResultadoEstacionario(colunas, resultado.dtype)
+
+
+def _tarefas(dados, Sin, modalidade_associacao, E, m_s, conjuntos_por_bloco, opcoes):
+    n = dados['D'].shape[0]
+    Sin, E, m_s = (np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)) for v in (Sin, E, m_s))
+    for inicio in range(0, n, conjuntos_por_bloco):
+        fim = min(inicio + conjuntos_por_bloco, n)
+        yield ({nome: v[inicio:fim] for nome, v in dados.items()}, Sin[inicio:fim],
+               modalidade_associacao, E[inicio:fim], m_s[inicio:fim], inicio, fim, opcoes)
+
+
+def ajustar_lote(conjuntos, Sin, modalidade_associacao, E=1.0, m_s=0.0,
+                 conjuntos_por_bloco=CONJUNTOS_POR_BLOCO, processos=1, **opcoes):
+    """
+    Ajusta milhares de conjuntos de dados independentes, em blocos.
+
+    Cada bloco é ajustado de forma vetorizada (ver ajustar); com
+    processos > 1 os blocos são distribuídos entre processos, com no
+    máximo 2*processos blocos enviados e ainda não recolhidos.
+
+    Parâmetros:
+        conjuntos (iterable | dict): Tabelas com as colunas de COLUNAS, ou o
+            dict já empilhado por empilhar_conjuntos
+        Sin (float | array): Substrato na alimentação de cada conjunto (g/L)
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float | array): Fator de reciclo de cada conjunto (adm)
+        m_s (float | array): Coeficiente de manutenção conhecido (g/g.h)
+        conjuntos_por_bloco (int): Conjuntos ajustados por bloco
+        processos (int): Número de processos; 1 ajusta no processo atual
+        **opcoes: Repassadas a ajustar (nivel, max_iteracoes, tolerancia, dtype)
+
+    Retorna:
+        ResultadoEstacionario: Uma linha por conjunto, na ordem de entrada
+    """
+    dados = conjuntos if isinstance(conjuntos, dict) and 'D' in conjuntos \
+        else empilhar_conjuntos(conjuntos)
+    tarefas = _tarefas(dados, Sin, modalidade_associacao, E, m_s, conjuntos_por_bloco, opcoes)
+    if processos <= 1:
+        blocos = [_ajustar_bloco(tarefa) for tarefa in tarefas]
+    else:
+        # Importado só aqui: concurrent.futures pesa na inicialização da página
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            # No máximo 2*processos blocos em andamento (ver varredura.em_ordem)
+            blocos = list(em_ordem(executor, _ajustar_bloco, tarefas, 2 * processos))
+    if not blocos:
+        # Nenhum conjunto: tabela vazia com as mesmas colunas
+        return ajustar(dados['D'], dados['S'], dados['X'], dados['P'], Sin, modalidade_associacao,
+                       E, m_s, **opcoes)
+    return ResultadoEstacionario({coluna: np.concatenate([bloco[coluna] for bloco in blocos])
+                                  for coluna in blocos[0]}, blocos[0].dtype)
@@ -0,0 +1,185 @@
+"""
+Cache de resultados com remoção limitada (LRU + tempo de vida + memória).
+
+Cada interação com a página reexecuta o script inteiro; como este módulo é
+importado uma única vez por processo, o cache sobrevive entre as
+reexecuções e entre sessões, evitando recalcular curvas cujos parâmetros
+não mudaram. Além do número de entradas, um orçamento em bytes limita a
+memória ocupada, qualquer que seja o número de usuários.
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+
+
+class CacheResultados:
+    """
+    Cache chave -> resultado com número máximo de entradas, TTL e
+    orçamento de memória.
+
+    O tamanho de cada resultado é medido de novo a cada acesso, porque as
+    colunas preguiçosas de ResultadoEstacionario só ocupam memória depois
+    de usadas. Um resultado maior que o orçamento inteiro não é guardado.
+
+    Parâmetros:
+        max_entradas (int): Número máximo de entradas mantidas
+        ttl (float | None): Tempo de vida de cada entrada (s); None = sem expiração
+        relogio (callable): Fonte de tempo (s), útil para testes
+        max_bytes (int | None): Memória máxima dos resultados guardados
+            (ver tamanho_bytes); None = sem limite
+    """
+
+    def __init__(self, max_entradas=128, ttl=None, relogio=time.monotonic, max_bytes=None):
+        if max_entradas < 1:
+            raise ValueError("max_entradas deve ser >= 1")
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._relogio = relogio
+        self._entradas = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obter(self, chave, calcular):
+        """
+        Retorna o resultado guardado para a chave ou o calcula e armazena.
+
+        Parâmetros:
+            chave (hashable): Chave do resultado
+            calcular (callable): Função sem argumentos que produz o resultado
+
+        Retorna:
+            object: Resultado em cache ou recém-calculado
+        """
+        agora = self._relogio()
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is not None:
+                instante, valor = entrada
+                if self.ttl is None or agora - instante < self.ttl:
+                    self._entradas.move_to_end(chave)
+                    self.acertos += 1
+                    # Colunas calculadas desde o último acesso contam agora
+                    self._liberar()
+                    return valor
+                del self._entradas[chave]
+                self.remocoes += 1
+            self.falhas += 1
+
+        # O cálculo roda fora da trava para não bloquear outras sessões
+        valor = _congelar(calcular())
+
+        if self.max_bytes is not None and tamanho_bytes(valor) > self.max_bytes:
+            return valor
+
+        with self._trava:
+            self._entradas[chave] = (agora, valor)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.remocoes += 1
+            self._liberar()
+        return valor
+
+    def _liberar(self):
+        """Remove as entradas mais antigas até caber em max_bytes (com a trava)."""
+        if self.max_bytes is None:
+            return
+        tamanhos = [tamanho_bytes(valor) for _, valor in self._entradas.values()]
+        total = sum(tamanhos)
+        for tamanho in tamanhos:
+            if total <= self.max_bytes:
+                break
+            self._entradas.popitem(last=False)
+            self.remocoes += 1
+            total -= tamanho
+
+    def nbytes(self):
+        """Memória ocupada pelos resultados guardados (bytes, ver tamanho_bytes)."""
+        with self._trava:
+            return sum(tamanho_bytes(valor) for _, valor in self._entradas.values())
+
+    def limpar(self):
+        """Remove todas as entradas e zera os contadores."""
+        with self._trava:
+            self._entradas.clear()
+            self.acertos = self.falhas = self.remocoes = 0
+
+    def estatisticas(self):
+        """
+        Retorna os contadores do cache.
+
+        Retorna:
+            dict: entradas, acertos, falhas, remocoes e taxa de acerto
+        """
+        with self._trava:
+            total = self.acertos + self.falhas
+            return {
+                'entradas': len(self._entradas),
+                'bytes': sum(tamanho_bytes(valor) for _, valor in self._entradas.values()),
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'remocoes': self.remocoes,
+                'taxa_acerto': self.acertos / total if total else 0.0,
+            }
+
+
+def tamanho_bytes(valor):
+    """
+    Memória ocupada por um resultado: arrays, bytes e objetos com nbytes
+    (ResultadoEstacionario conta só as colunas já calculadas), somados
+    dentro de dicts, tuplas e listas. Arrays que compartilham memória são
+    contados mais de uma vez (estimativa por cima).
+    """
+    if isinstance(valor, (bytes, bytearray)):
+        return len(valor)
+    nbytes = getattr(valor, 'nbytes', None)
+    if isinstance(nbytes, (int, np.integer)):
+        return int(nbytes)
+    if isinstance(valor, dict):
+        return sum(tamanho_bytes(item) for item in valor.values())
+    if isinstance(valor, (tuple, list)):
+        return sum(tamanho_bytes(item) for item in valor)
+    return 0
+
+
+def _congelar(valor):
+    """Marca os arrays do resultado como somente leitura (são compartilhados)."""
+    if isinstance(valor, np.ndarray):
+        valor.setflags(write=False)
+    elif isinstance(valor, dict):
+        for item in valor.values():
+            _congelar(item)
+    elif isinstance(valor, (tuple, list)):
+        for item in valor:
+            _congelar(item)
+    return valor
+
+
+def memorizar(cache):
+    """
+    Decorador que guarda os resultados da função no cache informado.
+
+    A chave é formada pelo nome da função e pela tupla completa de
+    argumentos, que devem ser hashable.
+
+    Parâmetros:
+        cache (CacheResultados): Cache de destino
+    """
+    def decorador(funcao):
+        @wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            chave = (funcao.__qualname__, args, tuple(sorted(kwargs.items())))
+            return cache.obter(chave, lambda: funcao(*args, **kwargs))
+        envoltorio.cache = cache
+        return envoltorio
+    return decorador
+
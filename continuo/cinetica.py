@@ -0,0 +1,330 @@
+"""
+Registro de modelos cinéticos de crescimento.
+
+Cada modelo fornece a velocidade específica de crescimento mu(S, X, P)
+vetorizada e o solver de estado estacionário do quimiostato: dado o alvo
+mu = D*E, devolve todas as raízes S em [0, Sin). Onde existe forma
+fechada (Monod, Haldane/Andrews, Contois, Moser) ela é usada; nos demais
+(inibição pelo produto de Levenspiel) as raízes saem de uma busca em lote
+(raizes_intervalo): o intervalo é amostrado, as trocas de sinal são
+localizadas e todas as raízes são refinadas juntas por bissecção.
+
+Modelos com vários estados estacionários (ex.: Haldane) devolvem todas as
+raízes, em ordem crescente de S; as curvas da página usam a primeira
+(maior conversão). Monod continua sendo calculado diretamente em
+modelo.py, sem passar pelo registro.
+
+Parâmetros comuns a todos os modelos: u_max e Ks. Os parâmetros extras de
+cada modelo (Ki, n, Pm...) são informados em um dict ou em uma tupla de
+pares (nome, valor), que pode servir de chave de cache.
+"""
+import numpy as np
+
+CINETICAS = {}
+
+
+def registrar(modelo):
+    """
+    Registra um modelo cinético (também pode ser usado como decorador de classe).
+
+    Parâmetros:
+        modelo (ModeloCinetico | type): Instância ou subclasse de ModeloCinetico
+
+    Retorna:
+        O próprio argumento
+    """
+    instancia = modelo() if isinstance(modelo, type) else modelo
+    CINETICAS[instancia.nome] = instancia
+    return modelo
+
+
+def obter_cinetica(cinetica):
+    """
+    Retorna o modelo registrado com o nome dado (ou o próprio modelo).
+
+    Parâmetros:
+        cinetica (str | ModeloCinetico): Nome do modelo ou instância
+
+    Retorna:
+        ModeloCinetico: Modelo cinético
+    """
+    if isinstance(cinetica, ModeloCinetico):
+        return cinetica
+    try:
+        return CINETICAS[cinetica]
+    except KeyError:
+        raise ValueError(f"Modelo cinético desconhecido: {cinetica!r}. "
+                         f"Disponíveis: {sorted(CINETICAS)}") from None
+
+
+def raizes_intervalo(funcao, a, b, subdivisoes=64, iteracoes=60):
+    """
+    Encontra todas as raízes de funcao em [a, b) para um lote de problemas.
+
+    O intervalo de cada problema é dividido em subdivisoes partes iguais;
+    cada troca de sinal entre nós vizinhos vira um colchete, e todos os
+    colchetes de todos os problemas são refinados juntos por bissecção.
+    Raízes mais próximas entre si que (b - a)/subdivisoes podem passar
+    despercebidas.
+
+    Parâmetros:
+        funcao (callable): Recebe S com forma (*forma, k) e devolve valores
+            de mesma forma; os parâmetros de cada problema devem ter forma
+            (*forma, 1) para broadcasting
+        a, b (array): Limites de cada problema, forma comum (*forma)
+        subdivisoes (int): Número de subintervalos da busca inicial
+        iteracoes (int): Iterações da bissecção
+
+    Retorna:
+        array: Raízes com forma (*forma, k), em ordem crescente; NaN onde um
+            problema tem menos de k raízes (k = maior número encontrado, >= 1)
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+    t = np.linspace(0.0, 1.0, subdivisoes + 1)
+    nos = a[..., None] + (b - a)[..., None] * t
+    valores = funcao(nos)
+
+    # Colchetes: troca de sinal ou zero exato no nó esquerdo (o nó b fica de fora)
+    esquerda, direita = valores[..., :-1], valores[..., 1:]
+    colchete = (esquerda == 0) | (np.sign(esquerda) * np.sign(direita) < 0)
+    k = max(int(colchete.sum(axis=-1).max(initial=0)), 1)
+
+    # Compacta os colchetes de cada problema nas primeiras k posições
+    ordem = np.argsort(~colchete, axis=-1, kind='stable')[..., :k]
+    valido = np.take_along_axis(colchete, ordem, axis=-1)
+    lo = np.take_along_axis(nos[..., :-1], ordem, axis=-1)
+    hi = np.take_along_axis(nos[..., 1:], ordem, axis=-1)
+    f_lo = np.take_along_axis(esquerda, ordem, axis=-1)
+    exato = f_lo == 0
+
+    for _ in range(iteracoes):
+        meio = 0.5 * (lo + hi)
+        f_meio = funcao(meio)
+        mesmo_lado = np.sign(f_meio) == np.sign(f_lo)
+        lo = np.where(mesmo_lado, meio, lo)
+        f_lo = np.where(mesmo_lado, f_meio, f_lo)
+        hi = np.where(mesmo_lado, hi, meio)
+
+    raizes = np.where(exato, lo, 0.5 * (lo + hi))
+    return np.where(valido, raizes, np.nan)
+
+
+def produto_estacionario(S, X, D, Sin, Alfa, Beta, modalidade_associacao):
+    """
+    Produto no estado estacionário do quimiostato em função de S e X
+    (mesmas expressões de calcular_estado_estacionario).
+    """
+    if modalidade_associacao == 'Associado':
+        return Alfa * (Sin - S)
+    beta_d = np.divide(Beta, D, out=np.zeros(np.broadcast_shapes(np.shape(Beta), np.shape(D))),
+                       where=np.asarray(D) != 0)
+    if modalidade_associacao == 'Semi Associado':
+        return X * (Alfa + beta_d)
+    return X * beta_d  # Não Associado
+
+
+class ModeloCinetico:
+    """
+    Modelo cinético de crescimento.
+
+    Subclasses definem nome, parametros (nome -> (descrição, valor padrão)),
+    latex (expressão de mu) e mu(); substrato_estacionario() tem uma versão
+    genérica por busca de raízes e pode ser sobrescrito com a forma fechada.
+    """
+
+    nome = None
+    parametros = {}
+    latex = None
+    # Se mu depende de X ou de P (o solver genérico precisa deles)
+    usa_X = False
+    usa_P = False
+
+    def completar(self, parametros_cineticos):
+        """Parâmetros extras com os valores padrão dos que não foram informados."""
+        extras = dict(parametros_cineticos or ())
+        desconhecidos = set(extras) - set(self.parametros)
+        if desconhecidos:
+            raise ValueError(f"Parâmetros desconhecidos para {self.nome}: {sorted(desconhecidos)}")
+        return {nome: extras.get(nome, padrao) for nome, (_, padrao) in self.parametros.items()}
+
+    def mu(self, S, X, P, u_max, Ks, **extras):
+        """Velocidade específica de crescimento (1/h), vetorizada."""
+        raise NotImplementedError
+
+    def substrato_estacionario(self, mu_alvo, Sin, Yx_s, E, u_max, Ks, produto=None, **extras):
+        """
+        Raízes S em [0, Sin) de mu(S, X(S), P(S)) = mu_alvo no quimiostato,
+        com X(S) = Yx_s*(Sin - S)/E.
+
+        Parâmetros:
+            mu_alvo (array): D*E (1/h)
+            Sin, Yx_s, E, u_max, Ks (float | array): Parâmetros do modelo
+            produto (callable | None): P em função de (S, X); None = sem produto
+            **extras: Parâmetros próprios do modelo
+
+        Retorna:
+            array: Raízes com forma (*forma, k), crescentes; NaN = sem raiz
+        """
+        forma = np.broadcast_shapes(np.shape(mu_alvo), np.shape(Sin), np.shape(Yx_s),
+                                    np.shape(E), np.shape(u_max), np.shape(Ks))
+        c = lambda v: np.broadcast_to(v, forma)[..., None]  # noqa: E731
+        alvo, Sin_, Yx_s_, E_, u_max_, Ks_ = map(c, (mu_alvo, Sin, Yx_s, E, u_max, Ks))
+        extras_ = {nome: c(v) for nome, v in extras.items()}
+
+        def f(S):
+            X = Yx_s_ * (Sin_ - S) / E_
+            P = produto(S, X) if produto is not None else 0.0
+            return self.mu(S, X, P, u_max_, Ks_, **extras_) - alvo
+        return raizes_intervalo(f, np.zeros(forma), np.broadcast_to(Sin, forma))
+
+    def substrato_estagio(self, D, Sf, Xf, Yx_s, u_max, Ks, produto=None, **extras):
+        """
+        Raízes S em [0, Sf) do balanço de um estágio da cascata com
+        alimentação (Sf, Xf): mu(S, X, P)*X = D*(X - Xf), X = Xf + Yx_s*(Sf - S).
+        Sem biomassa na alimentação usa-se mu = D (exclui a lavagem S = Sf).
+
+        Retorna:
+            array: Raízes com forma (*forma, k), crescentes; NaN = sem raiz
+        """
+        forma = np.broadcast_shapes(np.shape(D), np.shape(Sf), np.shape(Xf), np.shape(Yx_s),
+                                    np.shape(u_max), np.shape(Ks))
+        c = lambda v: np.broadcast_to(v, forma)[..., None]  # noqa: E731
+        D_, Sf_, Xf_, Yx_s_, u_max_, Ks_ = map(c, (D, Sf, Xf, Yx_s, u_max, Ks))
+        extras_ = {nome: c(v) for nome, v in extras.items()}
+
+        def f(S):
+            X = Xf_ + Yx_s_ * (Sf_ - S)
+            P = produto(S, X) if produto is not None else 0.0
+            mu = self.mu(S, X, P, u_max_, Ks_, **extras_)
+            return np.where(Xf_ > 0, mu * X - D_ * (X - Xf_), mu - D_)
+        return raizes_intervalo(f, np.zeros(forma), np.broadcast_to(Sf, forma))
+
+    def dcritico(self, u_max, Ks, Sin, E=1.0, **extras):
+        """D de lavagem do quimiostato: mu na alimentação (S = Sin, X = P = 0) dividido por E."""
+        return self.mu(np.asarray(Sin, dtype=np.float64), 0.0, 0.0, u_max, Ks, **extras) / E
+
+
+def _validas(raizes, Sin):
+    """
+    Mantém as raízes em [0, Sin) e devolve forma (*forma, k) com NaN nas
+    inválidas. S >= Sin (X <= 0) é lavagem, a mesma regra do caminho
+    rápido de Monod em calcular_estado_estacionario.
+    """
+    with np.errstate(invalid='ignore'):
+        return np.where((raizes >= 0) & (raizes < np.asarray(Sin)[..., None]), raizes, np.nan)
+
+
+@registrar
+class Monod(ModeloCinetico):
+    """mu = u_max*S/(Ks + S)."""
+
+    nome = 'Monod'
+    latex = r'\mu = \frac{u_{max} S}{K_s + S}'
+
+    def mu(self, S, X, P, u_max, Ks):
+        return u_max * S / (Ks + S)
+
+    def substrato_estacionario(self, mu_alvo, Sin, Yx_s, E, u_max, Ks, produto=None):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            S = np.where(u_max > mu_alvo, Ks * mu_alvo / (u_max - mu_alvo), np.nan)
+        return _validas(S[..., None], Sin)
+
+
+@registrar
+class Haldane(ModeloCinetico):
+    """
+    Haldane/Andrews (inibição pelo substrato): mu = u_max*S/(Ks + S + S²/Ki).
+
+    mu(S) = alvo vira (alvo/Ki)*S² + (alvo - u_max)*S + alvo*Ks = 0: até
+    duas raízes; a maior S corresponde ao ramo instável.
+    """
+
+    nome = 'Haldane'
+    parametros = {'Ki': ('Constante de inibição pelo substrato (g/L)', 10.0)}
+    latex = r'\mu = \frac{u_{max} S}{K_s + S + S^2/K_i}'
+
+    def mu(self, S, X, P, u_max, Ks, Ki):
+        return u_max * S / (Ks + S + S * S / Ki)
+
+    def substrato_estacionario(self, mu_alvo, Sin, Yx_s, E, u_max, Ks, produto=None, Ki=10.0):
+        a = mu_alvo / Ki
+        b = mu_alvo - u_max
+        c = mu_alvo * Ks
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta = b * b - 4 * a * c
+            raiz = np.sqrt(np.where(delta >= 0, delta, np.nan))
+            # Fórmula estável; a = 0 (alvo = 0) dá a raiz única S = 0
+            q = -0.5 * (b - raiz)
+            S1 = np.where(a != 0, c / q, 0.0)
+            S2 = np.where(a != 0, q / a, np.nan)
+        return _validas(np.stack(np.broadcast_arrays(S1, S2), axis=-1), Sin)
+
+    def dcritico(self, u_max, Ks, Sin, E=1.0, Ki=10.0):
+        return self.mu(np.asarray(Sin, dtype=np.float64), 0.0, 0.0, u_max, Ks, Ki) / E
+
+
+@registrar
+class Contois(ModeloCinetico):
+    """
+    Contois: mu = u_max*S/(Ks*X + S), com Ks em g/g.
+
+    Com X = Yx_s*(Sin - S)/E a condição mu = alvo é linear em S.
+    """
+
+    nome = 'Contois'
+    latex = r'\mu = \frac{u_{max} S}{K_s X + S}'
+    usa_X = True
+
+    def mu(self, S, X, P, u_max, Ks):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(S > 0, u_max * S / (Ks * X + S), 0.0)
+
+    def substrato_estacionario(self, mu_alvo, Sin, Yx_s, E, u_max, Ks, produto=None):
+        k = Ks * Yx_s / E
+        with np.errstate(divide='ignore', invalid='ignore'):
+            denominador = u_max - mu_alvo + mu_alvo * k
+            S = np.where(denominador > 0, mu_alvo * k * Sin / denominador, np.nan)
+        return _validas(S[..., None], Sin)
+
+
+@registrar
+class Moser(ModeloCinetico):
+    """Moser: mu = u_max*S^n/(Ks + S^n)."""
+
+    nome = 'Moser'
+    parametros = {'n': ('Expoente de Moser (adm)', 2.0)}
+    latex = r'\mu = \frac{u_{max} S^n}{K_s + S^n}'
+
+    def mu(self, S, X, P, u_max, Ks, n):
+        Sn = np.power(np.maximum(S, 0.0), n)
+        return u_max * Sn / (Ks + Sn)
+
+    def substrato_estacionario(self, mu_alvo, Sin, Yx_s, E, u_max, Ks, produto=None, n=2.0):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            S = np.where(u_max > mu_alvo, np.power(Ks * mu_alvo / (u_max - mu_alvo), 1.0 / n), np.nan)
+        return _validas(S[..., None], Sin)
+
+    def dcritico(self, u_max, Ks, Sin, E=1.0, n=2.0):
+        return self.mu(np.asarray(Sin, dtype=np.float64), 0.0, 0.0, u_max, Ks, n) / E
+
+
+@registrar
+class Levenspiel(ModeloCinetico):
+    """
+    Levenspiel (inibição pelo produto): mu = u_max*(1 - P/Pm)^n*S/(Ks + S).
+
+    P depende de S pelo balanço de produto, então as raízes saem da busca
+    em lote (solver genérico); pode haver mais de um estado estacionário.
+    """
+
+    nome = 'Levenspiel'
+    parametros = {
+        'Pm': ('Concentração de produto que interrompe o crescimento (g/L)', 50.0),
+        'n': ('Expoente de inibição (adm)', 1.0),
+    }
+    latex = r'\mu = u_{max} \left(1 - \frac{P}{P_m}\right)^n \frac{S}{K_s + S}'
+    usa_P = True
+
+    def mu(self, S, X, P, u_max, Ks, Pm, n):
+        inibicao = np.power(np.clip(1.0 - P / Pm, 0.0, None), n)
+        return u_max * inibicao * S / (Ks + S)
@@ -0,0 +1,421 @@
+"""
+Continuação numérica (pseudo-comprimento de arco) dos estados estacionários em D.
+
+A malha uniforme de D amostra apenas o estado estacionário de menor S:
+quando a curva dobra (inibição pelo substrato ou pelo produto) ela salta
+de um ramo para o outro, e no reciclo, com E*D perto de u_max, devolve
+X < 0 sem aviso. Aqui os ramos são percorridos por comprimento de arco,
+o que atravessa as dobras e segue também os ramos instáveis:
+
+    - Ramo com crescimento: a curva g(S, D) = mu(S, X, P) - D*E = 0, com
+      X e P dados pelos balanços (X = Yap*(Sin - S)/E), em coordenadas
+      escaladas (S/Sin, D/D_max). O percurso parte de (S, D) = (0, 0) e
+      de sementes em uma malha grossa de D (estados_estacionarios), para
+      achar também ramos que não passam pela origem, e termina ao cruzar
+      o ramo de lavagem (S = Sin), sair da faixa de D ou fechar um laço
+    - Ramo de lavagem: X = 0, S = Sin, P = 0 para qualquer D
+
+Cada passo é um preditor na tangente e um corretor de Newton-corda no
+plano perpendicular a ela, reaproveitando o gradiente do ponto anterior
+(uma avaliação por iteração). O passo cresce onde a curva é suave e
+encolhe onde o ângulo entre tangentes vizinhas passa de angulo_max: as
+regiões retas gastam poucos pontos e a quina da lavagem, que a malha
+uniforme só resolve com milhares de pontos, é alcançada exatamente.
+
+Bifurcações detectadas:
+    - Ponto limite (dobra): a componente D da tangente troca de sinal;
+      o ponto é refinado por falsa posição (Illinois) ao longo da corda
+    - Transcrítica (lavagem): o ramo com crescimento chega a S = Sin em
+      D = mu(Sin)/E, onde encontra o ramo de lavagem e troca de estabilidade
+    - Troca de estabilidade fora desses pontos (ex.: Hopf)
+
+A estabilidade de cada ponto vem dos autovalores do jacobiano dos
+balanços dinâmicos (dinamico.py) em X, S e P, por diferenças centrais
+avaliadas em lote; no ramo de lavagem o jacobiano é triangular e os
+autovalores saem direto (mu(Sin) - D*E e -D).
+"""
+import numpy as np
+
+from .cache import memorizar
+from .cinetica import obter_cinetica, produto_estacionario
+from .dinamico import derivadas
+from .modelo import cache_estacionario, com_manutencao, estados_estacionarios
+from .resultado import ResultadoEstacionario
+
+RAMOS = ('Com crescimento', 'Lavagem')
+BIFURCACOES = ('Ponto limite', 'Transcrítica', 'Troca de estabilidade')
+
+# Passo das diferenças progressivas do resíduo (coordenadas escaladas)
+_H = 1e-7
+# Passo relativo das diferenças centrais do jacobiano dinâmico
+_H_JACOBIANO = 1e-6
+# Máximo de ramos desconexos percorridos
+_MAX_RAMOS = 8
+
+
+class _Sistema:
+    """Resíduo do estado estacionário, jacobianos e contagem de avaliações."""
+
+    def __init__(self, D_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E,
+                 cinetica, parametros_cineticos, m_s):
+        self.modelo = obter_cinetica(cinetica)
+        self.extras = self.modelo.completar(parametros_cineticos)
+        self.u_max, self.Ks, self.Sin, self.Yx_s = u_max, Ks, Sin, Yx_s
+        self.Alfa, self.Beta, self.E, self.m_s = Alfa, Beta, E, m_s
+        self.modalidade_associacao = modalidade_associacao
+        # Escalas: S em Sin, D na faixa pedida e o resíduo em 1/h
+        self.escala = np.array([Sin, D_max])
+        self.escala_g = max(u_max, D_max * E)
+        self.avaliacoes = 0
+
+    def estado(self, S, D):
+        """Biomassa e produto sobre a curva de estado estacionário (S, D)."""
+        Yx_s, Alfa = com_manutencao(D, self.Yx_s, self.Alfa, self.modalidade_associacao,
+                                     self.E, self.m_s)
+        X = Yx_s * (self.Sin - S) / self.E
+        P = produto_estacionario(S, X, D, self.Sin, Alfa, self.Beta, self.modalidade_associacao)
+        return X, P
+
+    def residuo(self, u):
+        """g = (mu - D*E)/escala_g nos pontos escalados u (..., 2)."""
+        S, D = u[..., 0] * self.escala[0], u[..., 1] * self.escala[1]
+        self.avaliacoes += S.size
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            X, P = self.estado(S, D)
+            mu = self.modelo.mu(S, X, P, self.u_max, self.Ks, **self.extras)
+        return (mu - D * self.E) / self.escala_g
+
+    def gradiente(self, u, g=None):
+        """Gradiente de g por diferenças progressivas (g em u já conhecido é reaproveitado)."""
+        if g is None:
+            g, g_S, g_D = self.residuo(u + np.array([[0.0, 0.0], [_H, 0.0], [0.0, _H]]))
+        else:
+            g_S, g_D = self.residuo(u + np.array([[_H, 0.0], [0.0, _H]]))
+        return g, np.array([g_S - g, g_D - g]) / _H
+
+    def corrigir(self, u_pred, normal, tol, grad, max_iter=12):
+        """
+        Newton-corda no sistema [g(u) = 0, normal.(u - u_pred) = 0], com o
+        gradiente grad (de um ponto próximo) fixo durante as iterações.
+
+        Retorna:
+            tuple: Ponto corrigido (None se não convergiu), iterações e o
+                gradiente no ponto corrigido (para a tangente)
+        """
+        try:
+            inversa = np.linalg.inv(np.array([grad, normal]))
+        except np.linalg.LinAlgError:
+            return None, max_iter, None
+        u = u_pred.copy()
+        for iteracao in range(1, max_iter + 1):
+            g = self.residuo(u)
+            if not np.isfinite(g):
+                break
+            du = inversa @ [-g, -(normal @ (u - u_pred))]
+            u = u + du
+            if np.max(np.abs(du)) < tol:
+                g, grad = self.gradiente(u)
+                if np.all(np.isfinite(grad)) and np.any(grad):
+                    return u, iteracao, grad
+                break
+        return None, max_iter, None
+
+    def autovalor_dominante(self, S, D):
+        """
+        Maior parte real dos autovalores do jacobiano de (dX/dt, dS/dt, dP/dt)
+        em cada ponto (S, D) do ramo com crescimento.
+        """
+        n = len(S)
+        if n == 0:
+            return np.empty(0)
+        X, P = self.estado(S, D)
+        y = np.stack([X, S, P], axis=-1)
+        h = _H_JACOBIANO * (1.0 + np.abs(y))
+        # 6 perturbações (+-h em cada estado) de todos os pontos em um só lote
+        perturbados = np.repeat(y[None], 6, axis=0)
+        for j in range(3):
+            perturbados[2 * j, :, j] += h[:, j]
+            perturbados[2 * j + 1, :, j] -= h[:, j]
+        p = {'D': np.tile(D, 6), 'Sin': self.Sin}
+        p.update({nome: np.broadcast_to(valor, (6 * n,)) for nome, valor in
+                  (('u_max', self.u_max), ('Ks', self.Ks), ('Yx_s', self.Yx_s),
+                   ('Alfa', self.Alfa), ('Beta', self.Beta), ('E', self.E), ('m_s', self.m_s),
+                   *self.extras.items())})
+        self.avaliacoes += 6 * n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            taxas = derivadas(0.0, perturbados.reshape(6 * n, 3), p, self.modalidade_associacao,
+                               self.modelo).reshape(6, n, 3)
+        jacobiano = np.stack([(taxas[2 * j] - taxas[2 * j + 1]) / (2 * h[:, j, None])
+                              for j in range(3)], axis=-1)
+        jacobiano = np.nan_to_num(jacobiano)
+        return np.linalg.eigvals(jacobiano).real.max(axis=-1)
+
+
+def _tangente(grad, anterior):
+    """Tangente unitária à curva g = 0, orientada no sentido de anterior."""
+    t = np.array([-grad[1], grad[0]])
+    t /= np.hypot(*t)
+    return -t if t @ anterior < 0 else t
+
+
+def _localizar_dobra(sistema, ua, ta, ga, ub, tb, tol, max_iter=30):
+    """
+    Refina o ponto limite entre ua e ub (componente D da tangente = 0) por
+    falsa posição (Illinois) sobre a corda, corrigindo cada tentativa na
+    curva.
+    """
+    corda = ub - ua
+    normal = corda / np.hypot(*corda)
+    a, fa, b, fb = 0.0, ta[1], 1.0, tb[1]
+    u, t = ub, tb
+    lado = 0
+    for _ in range(max_iter):
+        s = (a * fb - b * fa) / (fb - fa)
+        u_novo, _, grad = sistema.corrigir(ua + s * corda, normal, tol, ga)
+        if u_novo is None:
+            break
+        u, t = u_novo, _tangente(grad, ta)
+        f = t[1]
+        if abs(f) < tol or b - a < tol:
+            break
+        if f * fa < 0:
+            b, fb = s, f
+            if lado == -1:
+                fa /= 2
+            lado = -1
+        else:
+            a, fa = s, f
+            if lado == 1:
+                fb /= 2
+            lado = 1
+    return u
+
+
+def _percorrer(sistema, u, t, grad, u_critico, angulo_max, passo_max, passo_min, tol, max_passos):
+    """
+    Percorre o ramo a partir de u no sentido de t até uma saída.
+
+    Retorna:
+        tuple: Pontos (lista de arrays escalados), tipos ('Ponto limite',
+            'Transcrítica' ou None por ponto), se fechou um laço e se convergiu
+    """
+    pontos, tipos = [u], [None]
+    passo = passo_max / 10
+    while len(pontos) < max_passos:
+        u_novo, iteracoes, grad_novo = sistema.corrigir(u + passo * t, t, tol, grad)
+        if u_novo is not None:
+            t_novo = _tangente(grad_novo, t)
+            angulo = np.arccos(np.clip(t @ t_novo, -1.0, 1.0))
+        if u_novo is None or angulo > angulo_max:
+            passo /= 2
+            if passo < passo_min:
+                return pontos, tipos, False, False
+            continue
+
+        if t[1] * t_novo[1] < 0:
+            u_dobra = _localizar_dobra(sistema, u, t, grad, u_novo, t_novo, tol)
+            if 0.0 < u_dobra[0] < 1.0 and 0.0 < u_dobra[1] < 1.0:
+                pontos.append(u_dobra)
+                tipos.append('Ponto limite')
+
+        # Saídas do ramo: S = Sin (transcrítica), D = D_max, S ou D <= 0 e laço fechado
+        fracoes = {}
+        if u_novo[0] >= 1.0:
+            fracoes['Transcrítica'] = (1.0 - u[0]) / (u_novo[0] - u[0])
+        if u_novo[1] >= 1.0:
+            fracoes['D_max'] = (1.0 - u[1]) / (u_novo[1] - u[1])
+        if u_novo[0] <= 0.0 or u_novo[1] <= 0.0:
+            fracoes['origem'] = 1.0
+        if fracoes:
+            saida = min(fracoes, key=fracoes.get)
+            if saida == 'Transcrítica':
+                pontos.append(u_critico)
+                tipos.append('Transcrítica')
+            elif saida == 'D_max':
+                normal = np.array([0.0, 1.0])
+                u_fim, _, _ = sistema.corrigir(u + fracoes['D_max'] * (u_novo - u), normal, tol,
+                                               grad)
+                pontos.append(u_fim if u_fim is not None else u_novo)
+                tipos.append(None)
+            return pontos, tipos, False, True
+        if len(pontos) > 3 and np.hypot(*(u_novo - pontos[0])) < passo:
+            pontos.append(pontos[0])
+            tipos.append(tipos[0])
+            return pontos, tipos, True, True
+
+        pontos.append(u_novo)
+        tipos.append(None)
+        u, t, grad = u_novo, t_novo, grad_novo
+        if iteracoes <= 6 and angulo < angulo_max / 2:
+            passo = min(passo * 1.5, passo_max)
+    return pontos, tipos, False, True
+
+
+def _coberta(semente, pontos, tol=1e-3):
+    """Se a semente (S, D escalados) está a menos de tol de algum segmento já percorrido."""
+    if not len(pontos):
+        return False
+    if len(pontos) == 1:
+        return bool(np.hypot(*(pontos[0] - semente)) < tol)
+    # Distância perpendicular ao segmento: a diferença em S na mesma D
+    # superestima a distância onde a curva é quase vertical em D (perto da lavagem)
+    a, corda = pontos[:-1], pontos[1:] - pontos[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fracao = np.einsum('ij,ij->i', semente - a, corda) / np.einsum('ij,ij->i', corda, corda)
+    fracao = np.clip(np.nan_to_num(fracao), 0.0, 1.0)
+    distancia = np.hypot(*(a + fracao[:, None] * corda - semente).T)
+    return bool(np.any(distancia < tol))
+
+
+def _ramo_lavagem(D_max, Dcritico, mu_Sin, E, Sin):
+    """Ramo X = 0 com os autovalores exatos (jacobiano triangular)."""
+    nos = [0.0, D_max]
+    if 0 < Dcritico < D_max:
+        nos.append(Dcritico)
+    nos = np.unique(nos)
+    D = np.unique(np.concatenate([nos, (nos[:-1] + nos[1:]) / 2]))
+    autovalor = np.maximum(mu_Sin - D * E, -D)
+    return D, np.full_like(D, Sin), autovalor
+
+
+def _tabela(D, S, X, P, autovalor, tol):
+    with np.errstate(invalid='ignore'):
+        estavel = np.where(np.isnan(autovalor), np.nan, autovalor < -tol)
+    return ResultadoEstacionario({
+        'Diluição (1/h)': D,
+        'Biomassa (g/L)': X,
+        'Substrato (g/L)': S,
+        'Produto (g/L)': P,
+        'Autovalor dominante (1/h)': autovalor,
+        'Estável': estavel,
+    })
+
+
+def continuar_estacionario(D_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E=1.0,
+                           cinetica='Monod', parametros_cineticos=None, m_s=0.0, angulo_max=0.1,
+                           passo_max=0.05, passo_min=1e-9, tol=1e-10, max_passos=5000,
+                           n_sementes=16):
+    """
+    Percorre os ramos de estado estacionário em D por continuação de
+    pseudo-comprimento de arco e detecta as bifurcações.
+
+    Parâmetros:
+        D_max (float): Maior taxa de diluição percorrida (1/h)
+        u_max, Ks, Sin, Yx_s, Alfa, Beta (float): Parâmetros do modelo
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float): Fator de reciclo (adm); 1 no reator padrão. Com E <= 0
+            não há estado estacionário com crescimento e a lavagem é instável
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (tuple | None): Pares (nome, valor) dos parâmetros extras
+        m_s (float): Coeficiente de manutenção (g/g.h)
+        angulo_max (float): Maior ângulo entre tangentes vizinhas (rad);
+            controla a fidelidade da curva
+        passo_max, passo_min (float): Limites do passo (coordenadas escaladas)
+        tol (float): Tolerância do corretor de Newton
+        max_passos (int): Número máximo de pontos por ramo
+        n_sementes (int): Pontos da malha grossa de D que procura ramos
+            não ligados à origem
+
+    Retorna:
+        dict: 'ramos' (RAMOS -> ResultadoEstacionario com Diluição,
+            Biomassa, Substrato, Produto, 'Autovalor dominante (1/h)' e
+            'Estável' (1 ou 0), na ordem do percurso; ramos desconexos com
+            crescimento vêm separados por uma linha de NaN), 'bifurcacoes'
+            (lista de dicts com 'Tipo' (ver BIFURCACOES), Diluição,
+            Biomassa, Substrato e Produto), 'avaliacoes' (avaliações de mu
+            na continuação e nos jacobianos) e 'convergiu' (False se o passo
+            caiu abaixo de passo_min antes do fim de algum ramo)
+    """
+    sistema = _Sistema(D_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E,
+                       cinetica, parametros_cineticos, m_s)
+    mu_Sin = float(sistema.modelo.mu(np.float64(Sin), 0.0, 0.0, u_max, Ks, **sistema.extras))
+    tol_autovalor = 1e-6 * sistema.escala_g
+
+    if E <= 0:
+        # mu >= 0 > D*E: a biomassa cresce sem limite, não há ramo com crescimento
+        vazio = np.empty(0)
+        D, S, autovalor = _ramo_lavagem(D_max, np.inf, mu_Sin, E, Sin)
+        zeros = np.zeros_like(D)
+        return {'ramos': {'Com crescimento': _tabela(vazio, vazio, vazio, vazio, vazio, tol_autovalor),
+                          'Lavagem': _tabela(D, S, zeros, zeros, autovalor, tol_autovalor)},
+                'bifurcacoes': [], 'avaliacoes': 0, 'convergiu': True}
+
+    Dcritico = mu_Sin / E
+    u_critico = np.array([1.0, Dcritico / D_max])
+    argumentos = (u_critico, angulo_max, passo_max, passo_min, tol, max_passos)
+
+    # Sementes: a origem (S = 0 em D = 0) vale quando P não explode em D -> 0
+    # (Beta/D) dentro de mu; as demais saem de uma malha grossa de D
+    sementes = []
+    if not (sistema.modelo.usa_P and modalidade_associacao != 'Associado'):
+        sementes.append(np.zeros(2))
+    D_sementes = np.linspace(D_max / n_sementes, D_max, n_sementes)
+    S_sementes, _, _ = estados_estacionarios(D_sementes, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                                             modalidade_associacao, E, cinetica,
+                                             parametros_cineticos, m_s)
+    for i, k in zip(*np.nonzero(np.isfinite(S_sementes))):
+        sementes.append(np.array([S_sementes[i, k] / Sin, D_sementes[i] / D_max]))
+
+    ramos, convergiu = [], True
+    for semente in sementes:
+        if len(ramos) == _MAX_RAMOS:
+            break
+        if any(_coberta(semente, np.array(pontos)) for pontos, _ in ramos):
+            continue
+        g, grad = sistema.gradiente(semente)
+        if not (np.all(np.isfinite(grad)) and np.any(grad)):
+            continue
+        if semente[0] == 0.0:
+            # Origem: só no sentido de S crescente
+            pontos, tipos, _, ok = _percorrer(sistema, semente, _tangente(grad, np.array([1.0, 0.0])),
+                                              grad, *argumentos)
+        else:
+            # Semente interior: para os dois lados, unidos na ordem do percurso
+            t = _tangente(grad, np.array([0.0, 1.0]))
+            pontos, tipos, fechado, ok = _percorrer(sistema, semente, t, grad, *argumentos)
+            if not fechado:
+                atras, tipos_atras, _, ok_atras = _percorrer(sistema, semente, -t, grad, *argumentos)
+                pontos, tipos = atras[:0:-1] + pontos, tipos_atras[:0:-1] + tipos
+                ok = ok and ok_atras
+        convergiu = convergiu and ok
+        ramos.append((pontos, tipos))
+
+    # Ramos separados por uma linha de NaN (quebra as linhas nos gráficos)
+    separador = np.full((1, 2), np.nan)
+    u_ramo = np.concatenate(sum(([separador, np.array(pontos)] for pontos, _ in ramos), [])[1:]) \
+        if ramos else np.empty((0, 2))
+    tipos = sum(([None] + tipos for _, tipos in ramos), [])[1:]
+    S, D = u_ramo[:, 0] * Sin, u_ramo[:, 1] * D_max
+    with np.errstate(invalid='ignore'):
+        X, P = sistema.estado(S, D)
+    validos = ~np.isnan(S)
+    autovalor = np.full_like(S, np.nan)
+    autovalor[validos] = sistema.autovalor_dominante(S[validos], D[validos])
+
+    # Na transcrítica a lavagem vale exatamente (X = P = 0) e o autovalor cruza 0
+    transcriticas = [i for i, tipo in enumerate(tipos) if tipo == 'Transcrítica']
+    X[transcriticas], P[transcriticas], autovalor[transcriticas] = 0.0, 0.0, 0.0
+    marcados = {i for i, tipo in enumerate(tipos) if tipo is not None}
+    bifurcacoes = [(i, tipo) for i, tipo in enumerate(tipos) if tipo is not None]
+    # Trocas de sinal do autovalor fora das dobras e da transcrítica
+    with np.errstate(invalid='ignore'):
+        sinal = np.where(np.abs(autovalor) <= tol_autovalor, 0, np.sign(autovalor))
+        trocas = np.nonzero(sinal[:-1] * sinal[1:] < 0)[0]
+    bifurcacoes += [(i + 1, 'Troca de estabilidade') for i in trocas
+                    if i not in marcados and i + 1 not in marcados]
+    bifurcacoes = [{'Tipo': tipo, 'Diluição (1/h)': float(D[i]), 'Biomassa (g/L)': float(X[i]),
+                    'Substrato (g/L)': float(S[i]), 'Produto (g/L)': float(P[i])}
+                   for i, tipo in sorted(bifurcacoes, key=lambda item: item[0])]
+
+    D_lav, S_lav, autovalor_lav = _ramo_lavagem(D_max, Dcritico, mu_Sin, E, Sin)
+    zeros = np.zeros_like(D_lav)
+    return {
+        'ramos': {'Com crescimento': _tabela(D, S, X, P, autovalor, tol_autovalor),
+                  'Lavagem': _tabela(D_lav, S_lav, zeros, zeros, autovalor_lav, tol_autovalor)},
+        'bifurcacoes': bifurcacoes,
+        'avaliacoes': sistema.avaliacoes,
+        'convergiu': convergiu,
+    }
+
+
+continuar_estacionario_cache = memorizar(cache_estacionario)(continuar_estacionario)
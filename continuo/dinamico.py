@@ -0,0 +1,212 @@
+"""
+Simulação dinâmica (transiente) do reator contínuo.
+
+Integra os balanços de massa de X, S e P para os reatores padrão e com
+reciclo usando Runge-Kutta adaptativo (Dormand-Prince 5(4)). Vários
+cenários independentes são integrados ao mesmo tempo como um único array
+de estado, cada um com seu próprio passo de tempo.
+
+Balanços (E = 1 + A - A*B; E = 1 no reator padrão):
+    dX/dt = (mu - D*E) * X
+    dS/dt = D * (Sin - S) - (mu / Yx_s + m_s) * X
+    dP/dt = rp - D * P
+
+com mu = u_max * S / (Ks + S) (ou outro modelo de cinetica.py), m_s o
+coeficiente de manutenção de Pirt (0 desliga) e rp escolhido de forma que o estado
+estacionário reproduza as expressões fechadas de modelo.py:
+    Associado:      rp = Alfa * mu * X / Yx_s
+    Semi Associado: rp = (Alfa * mu / E + Beta) * X
+    Não Associado:  rp = Beta * X
+"""
+import numpy as np
+
+from .cinetica import obter_cinetica
+from .modelo import fator_reciclo
+
+# Tabela de Butcher de Dormand-Prince 5(4)
+_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0])
+# Diferença entre as soluções de 5ª e 4ª ordem (estimativa do erro)
+_E = np.array([71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+
+
+def _valor(parametro, t):
+    """Avalia um parâmetro constante ou função do tempo."""
+    return parametro(t) if callable(parametro) else parametro
+
+
+def derivadas(t, y, p, modalidade_associacao, modelo=None):
+    """
+    Balanços do quimiostato: taxas dX/dt, dS/dt e dP/dt.
+
+    Usado pelo integrador de simular_dinamico e pela jacobiana da
+    continuação (estabilidade dos estados estacionários).
+
+    Parâmetros:
+        t (float): Instante (h), para parâmetros que são funções do tempo
+        y (array): Estados (n, 3) com colunas X, S e P (g/L)
+        p (dict): u_max, Ks, Yx_s, Alfa, Beta, E, m_s, D e Sin (escalares,
+            arrays (n,) ou, D e Sin, funções do tempo) e os parâmetros
+            extras do modelo cinético
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        modelo (ModeloCinetico | None): Cinética do registro; None = Monod
+
+    Retorna:
+        array: Derivadas (n, 3) na ordem X, S, P
+    """
+    X, S, P = y[:, 0], y[:, 1], y[:, 2]
+    D = _valor(p['D'], t)
+    Sin = _valor(p['Sin'], t)
+    S_pos = np.maximum(S, 0.0)
+    if modelo is None:
+        mu = p['u_max'] * S_pos / (p['Ks'] + S_pos)
+    else:
+        extras = {nome: p[nome] for nome in modelo.parametros}
+        mu = modelo.mu(S_pos, np.maximum(X, 0.0), np.maximum(P, 0.0), p['u_max'], p['Ks'],
+                       **extras)
+
+    if modalidade_associacao == 'Associado':
+        rp = p['Alfa'] * mu * X / p['Yx_s']
+    elif modalidade_associacao == 'Semi Associado':
+        rp = (p['Alfa'] * mu / p['E'] + p['Beta']) * X
+    else:  # Não Associado
+        rp = p['Beta'] * X
+
+    dy = np.empty_like(y)
+    dy[:, 0] = (mu - D * p['E']) * X
+    dy[:, 1] = D * (Sin - S) - (mu / p['Yx_s'] + p['m_s']) * X
+    dy[:, 2] = rp - D * P
+    return dy
+
+
+def _restringir_funcao(funcao, idx):
+    """Envolve uma função do tempo para devolver apenas os cenários ativos."""
+    def restrita(t):
+        valor = np.asarray(funcao(t, idx), dtype=np.float64)
+        return np.broadcast_to(valor, t.shape)
+    return restrita
+
+
+def simular_dinamico(t_eval, X0, S0, P0, D, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                     modalidade_associacao, A=0.0, B=1.0, rtol=1e-6, atol=1e-9,
+                     max_passos=100_000, cinetica='Monod', parametros_cineticos=None, m_s=0.0):
+    """
+    Integra os balanços de massa para um ou vários cenários.
+
+    Todos os parâmetros numéricos podem ser escalares ou arrays 1-D com um
+    valor por cenário. D e Sin também aceitam funções f(t, idx) que recebem
+    o tempo de cada cenário ativo e seus índices e devolvem os valores
+    correspondentes (ex.: degraus de D ou Sin).
+
+    Parâmetros:
+        t_eval (array): Instantes de saída crescentes (h); t_eval[0] é o instante inicial
+        X0, S0, P0 (float | array): Condições iniciais (g/L)
+        D (float | array | callable): Taxa de diluição (1/h)
+        u_max (float | array): Velocidade máxima específica de crescimento (1/h)
+        Ks (float | array): Constante de saturação (g/L)
+        Sin (float | array | callable): Concentração de substrato na entrada (g/L)
+        Yx_s (float | array): Rendimento de biomassa por substrato (g/g)
+        Alfa (float | array): Coeficiente de associação
+        Beta (float | array): Coeficiente de não associação
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        A (float | array): Fração de reciclo (adm); 0 para o reator padrão
+        B (float | array): Fator de concentração da biomassa (adm)
+        rtol (float): Tolerância relativa
+        atol (float): Tolerância absoluta (g/L)
+        max_passos (int): Número máximo de iterações do integrador
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (dict | tuple | None): Parâmetros extras do
+            modelo (escalares ou arrays 1-D por cenário)
+        m_s (float | array): Coeficiente de manutenção (g/g.h)
+
+    Retorna:
+        dict: Tempo (h) e arrays (n_cenarios, n_tempos) de Biomassa, Substrato e Produto
+    """
+    t_eval = np.asarray(t_eval, dtype=np.float64)
+    if t_eval.ndim != 1 or len(t_eval) < 2 or np.any(np.diff(t_eval) <= 0):
+        raise ValueError("t_eval deve ser 1-D, crescente e ter ao menos dois instantes")
+
+    constantes = {'u_max': u_max, 'Ks': Ks, 'Yx_s': Yx_s, 'Alfa': Alfa, 'Beta': Beta, 'm_s': m_s,
+                  'E': fator_reciclo(np.asarray(A, dtype=np.float64),
+                                     np.asarray(B, dtype=np.float64))}
+    modelo = None if cinetica == 'Monod' else obter_cinetica(cinetica)
+    if modelo is not None:
+        constantes.update(modelo.completar(parametros_cineticos))
+    variaveis = {'D': D, 'Sin': Sin}
+    formas = [np.shape(v) for v in (X0, S0, P0, *constantes.values(), *variaveis.values())
+              if not callable(v)]
+    forma = np.broadcast_shapes(*formas)
+    if len(forma) > 1:
+        raise ValueError("Os parâmetros por cenário devem ser escalares ou arrays 1-D")
+    n = forma[0] if forma else 1
+
+    p = {nome: np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)).copy()
+         for nome, v in constantes.items()}
+    for nome, v in variaveis.items():
+        p[nome] = v if callable(v) else np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)).copy()
+
+    y = np.empty((n, 3))
+    for j, v in enumerate((X0, S0, P0)):
+        y[:, j] = np.broadcast_to(np.asarray(v, dtype=np.float64), (n,))
+
+    saida = np.empty((n, len(t_eval), 3))
+    saida[:, 0] = y
+    t = np.full(n, t_eval[0])
+    proximo = np.ones(n, dtype=np.intp)   # índice do próximo instante de saída
+    h = np.full(n, (t_eval[-1] - t_eval[0]) * 1e-3)
+
+    for _ in range(max_passos):
+        idx = np.nonzero(proximo < len(t_eval))[0]
+        if len(idx) == 0:
+            break
+        pa = {nome: (_restringir_funcao(v, idx) if callable(v) else v[idx])
+              for nome, v in p.items()}
+        ta, ya = t[idx], y[idx]
+        alvo = t_eval[proximo[idx]]
+        ha = np.minimum(h[idx], alvo - ta)
+
+        k = np.empty((7,) + ya.shape)
+        for i in range(7):
+            yi = ya.copy()
+            for j, a in enumerate(_A[i]):
+                if a:
+                    yi += (ha * a)[:, None] * k[j]
+            k[i] = derivadas(ta + _C[i] * ha, yi, pa, modalidade_associacao, modelo)
+
+        y_novo = ya + ha[:, None] * np.tensordot(_B, k, axes=1)
+        erro = ha[:, None] * np.tensordot(_E, k, axes=1)
+        escala = atol + rtol * np.maximum(np.abs(ya), np.abs(y_novo))
+        norma = np.sqrt(np.mean((erro / escala) ** 2, axis=1))
+
+        aceito = norma <= 1.0
+        fator = np.clip(0.9 * np.where(norma > 0, norma, 1e-10) ** -0.2, 0.2, 5.0)
+        # Passos encurtados só para atingir um instante de saída não reduzem h
+        h[idx] = np.where(aceito & (ha < h[idx]), np.maximum(h[idx], ha * fator), ha * fator)
+
+        ia = idx[aceito]
+        t[ia] = ta[aceito] + ha[aceito]
+        y[ia] = y_novo[aceito]
+
+        # Cenários que chegaram ao instante de saída registram o estado
+        chegou = ia[t[ia] >= t_eval[proximo[ia]] - 1e-12 * np.abs(t_eval[-1])]
+        t[chegou] = t_eval[proximo[chegou]]
+        saida[chegou, proximo[chegou]] = y[chegou]
+        proximo[chegou] += 1
+    else:
+        raise RuntimeError("Integração não convergiu: max_passos atingido")
+
+    return {
+        'Tempo (h)': t_eval,
+        'Biomassa (g/L)': saida[:, :, 0],
+        'Substrato (g/L)': saida[:, :, 1],
+        'Produto (g/L)': saida[:, :, 2],
+    }
@@ -0,0 +1,183 @@
+"""
+Exportação em blocos para Parquet, Arrow (IPC) e CSV.
+
+Os resultados são escritos bloco a bloco: cada bloco é convertido para
+Arrow sem cópia (os arrays do NumPy são reaproveitados), gravado e
+descartado antes do próximo. Assim a memória fica limitada ao tamanho de
+um bloco, mesmo para varreduras de centenas de milhões de linhas vindas
+de varrer_blocos.
+
+Parquet e Arrow usam o pyarrow (importado só na exportação) e compressão
+zstd por padrão; o CSV é escrito só com o NumPy e serve de alternativa
+quando o pyarrow não está instalado.
+"""
+import io
+
+import numpy as np
+
+from .resultado import ResultadoEstacionario
+
+FORMATOS = ('parquet', 'arrow', 'csv')
+
+# Linhas por bloco ao fatiar um resultado já em memória
+LINHAS_POR_BLOCO = 1_000_000
+
+
+def blocos_resultado(dados, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """
+    Fatia um resultado em blocos de linhas consecutivas (views, sem cópia).
+
+    Parâmetros:
+        dados (ResultadoEstacionario): Tabela completa
+        linhas_por_bloco (int): Linhas por bloco
+
+    Retorna:
+        generator: ResultadoEstacionario de cada bloco
+    """
+    for inicio in range(0, max(dados.n_linhas, 1), linhas_por_bloco):
+        fim = inicio + linhas_por_bloco
+        yield ResultadoEstacionario({nome: dados[nome][inicio:fim] for nome in dados}, dados.dtype)
+
+
+def blocos_dinamico(dinamico, cenarios_por_bloco=None, dtype=np.float64):
+    """
+    Converte o resultado de simular_dinamico em blocos no formato "tidy"
+    (uma linha por cenário e instante).
+
+    Parâmetros:
+        dinamico (dict): Resultado de simular_dinamico
+        cenarios_por_bloco (int | None): Cenários por bloco; None escolhe
+            para ficar perto de LINHAS_POR_BLOCO linhas
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+
+    Retorna:
+        generator: ResultadoEstacionario com Cenário, Tempo, Biomassa,
+            Substrato e Produto
+    """
+    tempo = dinamico['Tempo (h)']
+    n_cenarios, n_tempos = dinamico['Biomassa (g/L)'].shape
+    if cenarios_por_bloco is None:
+        cenarios_por_bloco = max(1, LINHAS_POR_BLOCO // max(n_tempos, 1))
+    # Sem cenários ainda gera um bloco vazio, para o arquivo ter as colunas
+    for inicio in range(0, max(n_cenarios, 1), cenarios_por_bloco):
+        fim = min(inicio + cenarios_por_bloco, n_cenarios)
+        yield ResultadoEstacionario({
+            'Cenário': np.repeat(np.arange(inicio, fim), n_tempos),
+            'Tempo (h)': np.tile(tempo, fim - inicio),
+            'Biomassa (g/L)': dinamico['Biomassa (g/L)'][inicio:fim].ravel(),
+            'Substrato (g/L)': dinamico['Substrato (g/L)'][inicio:fim].ravel(),
+            'Produto (g/L)': dinamico['Produto (g/L)'][inicio:fim].ravel(),
+        }, dtype)
+
+
+def _tabela_arrow(bloco):
+    import pyarrow as pa
+    return pa.table({nome: pa.array(valor) for nome, valor in bloco.items()})
+
+
+def _escrever_parquet(blocos, destino, compressao):
+    import pyarrow.parquet as pq
+    escritor = None
+    try:
+        for bloco in blocos:
+            tabela = _tabela_arrow(bloco)
+            if escritor is None:
+                escritor = pq.ParquetWriter(destino, tabela.schema, compression=compressao)
+            escritor.write_table(tabela)
+    finally:
+        if escritor is not None:
+            escritor.close()
+
+
+def _escrever_arrow(blocos, destino, compressao):
+    import pyarrow as pa
+    opcoes = pa.ipc.IpcWriteOptions(compression=compressao)
+    escritor = None
+    try:
+        for bloco in blocos:
+            tabela = _tabela_arrow(bloco)
+            if escritor is None:
+                escritor = pa.ipc.new_file(destino, tabela.schema, options=opcoes)
+            escritor.write_table(tabela)
+    finally:
+        if escritor is not None:
+            escritor.close()
+
+
+def _escrever_csv(blocos, arquivo):
+    cabecalho = True
+    for bloco in blocos:
+        if cabecalho:
+            arquivo.write((','.join(f'"{nome}"' for nome in bloco) + '\n').encode('utf-8'))
+            cabecalho = False
+        np.savetxt(arquivo, np.column_stack([bloco[nome] for nome in bloco]),
+                   delimiter=',', fmt='%.10g', encoding='utf-8')
+
+
+def _com_esquema(blocos, colunas, dtype):
+    """Repassa os blocos; se não vier nenhum, gera um bloco vazio com as colunas."""
+    vazio = True
+    for bloco in blocos:
+        vazio = False
+        yield bloco
+    if vazio:
+        if colunas is None:
+            raise ValueError("nenhum bloco para exportar: informe colunas para gravar um arquivo vazio")
+        yield ResultadoEstacionario({nome: np.empty(0) for nome in colunas}, dtype)
+
+
+def exportar(blocos, destino, formato='parquet', compressao='zstd', colunas=None, dtype=np.float64):
+    """
+    Grava os blocos em disco (ou em um arquivo binário aberto), um a um.
+
+    Parâmetros:
+        blocos (iterable): ResultadoEstacionario com as mesmas colunas
+            (ex.: varrer_blocos, blocos_resultado, blocos_dinamico)
+        destino (str | file): Caminho ou arquivo binário aberto para escrita
+        formato (str): 'parquet', 'arrow' (IPC/Feather v2) ou 'csv'
+        compressao (str | None): Codec do Parquet/Arrow ('zstd', 'lz4',
+            'snappy' só no Parquet, ou None); ignorado no CSV
+        colunas (list | None): Esquema usado se blocos vier vazio (ex.:
+            varredura.COLUNAS); o arquivo é gravado só com o cabeçalho
+        dtype (type): Tipo das colunas desse arquivo vazio
+
+    Retorna:
+        int: Número de linhas gravadas
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"formato deve ser um de {FORMATOS}")
+
+    linhas = [0]
+
+    def contar(blocos):
+        for bloco in _com_esquema(blocos, colunas, dtype):
+            linhas[0] += bloco.n_linhas
+            yield bloco
+
+    if formato == 'parquet':
+        _escrever_parquet(contar(blocos), destino, compressao)
+    elif formato == 'arrow':
+        _escrever_arrow(contar(blocos), destino, compressao)
+    elif isinstance(destino, str):
+        with open(destino, 'wb') as arquivo:
+            _escrever_csv(contar(blocos), arquivo)
+    else:
+        _escrever_csv(contar(blocos), destino)
+    return linhas[0]
+
+
+def exportar_bytes(blocos, formato='parquet', compressao='zstd', colunas=None, dtype=np.float64):
+    """
+    Exporta para um buffer em memória (ex.: st.download_button).
+
+    Os blocos continuam sendo convertidos um a um; em memória fica apenas
+    o arquivo final, já comprimido.
+
+    Parâmetros: os mesmos de exportar, sem o destino.
+
+    Retorna:
+        bytes: Conteúdo do arquivo
+    """
+    buffer = io.BytesIO()
+    exportar(blocos, buffer, formato, compressao, colunas, dtype)
+    return buffer.getvalue()
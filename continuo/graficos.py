@@ -0,0 +1,431 @@
+"""
+Renderização dos gráficos sem o estado global do pyplot.
+
+As figuras são criadas com a API orientada a objetos (matplotlib.figure.
+Figure + backend Agg), rasterizadas para PNG e descartadas; nada fica
+registrado no gerenciador de figuras do pyplot, então a memória do
+servidor não cresce a cada interação. Os PNGs ficam em um cache limitado,
+chaveado pelos dados plotados e pelas opções do gráfico, para que gráficos
+inalterados não sejam rasterizados de novo. As curvas de D são reduzidas
+por LTTB (reducao.py) antes de plotar, então o tempo de rasterização não
+depende do passo de D.
+
+O matplotlib só é importado na primeira figura desenhada (ou em segundo
+plano, por pre_carregar), para não pesar no início de cada processo. Mesmo
+assim o módulo não é reexportado pelo pacote.
+"""
+import hashlib
+import io
+import sys
+import threading
+
+import numpy as np
+
+from .cache import CacheResultados
+from .reducao import MAX_PONTOS, reduzir_curvas
+
+# Mesmas cores usadas na página
+COR_BIOMASSA = 'red'
+COR_PRODUTO = 'blue'
+COR_SUBSTRATO = 'green'
+
+# Padrões equivalentes aos do st.pyplot
+DPI = 200
+
+cache_graficos = CacheResultados(max_entradas=64, ttl=3600, max_bytes=64 * 2**20)
+
+
+def _nova_figura():
+    """Cria uma figura nova, importando o matplotlib no primeiro uso."""
+    from matplotlib.figure import Figure
+    return Figure()
+
+
+def pre_carregar():
+    """
+    Importa o matplotlib em uma thread de fundo.
+
+    Chamado no início da página: o primeiro gráfico encontra o módulo já
+    carregado sem atrasar o que é desenhado antes dele. Se o matplotlib já
+    foi importado neste processo, não faz nada.
+
+    Retorna:
+        threading.Thread | None: Thread do carregamento (daemon), se iniciada
+    """
+    if 'matplotlib.figure' in sys.modules:
+        return None
+
+    def carregar():
+        import matplotlib.backends.backend_agg  # noqa: F401
+        import matplotlib.figure  # noqa: F401
+    thread = threading.Thread(target=carregar, name='continuo-pre-carregar', daemon=True)
+    thread.start()
+    return thread
+
+
+def _assinatura(*arrays):
+    """Resumo (hash) do conteúdo dos arrays, usado na chave do cache."""
+    resumo = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        resumo.update(str((array.dtype, array.shape)).encode())
+        resumo.update(array.data)
+    return resumo.hexdigest()
+
+
+def renderizar_png(fig, dpi=DPI):
+    """
+    Rasteriza a figura em PNG.
+
+    Parâmetros:
+        fig (Figure): Figura a rasterizar
+        dpi (int): Resolução (pontos por polegada)
+
+    Retorna:
+        bytes: Imagem PNG
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    FigureCanvasAgg(fig)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def desenhar_estacionario(D, Biomassa, Substrato, Produto, Dil_min, Dil_max, Dcritico,
+                          mostrar_Dcritico, titulo, bandas=None):
+    """
+    Monta a figura das curvas de estado estacionário (eixos ax1/ax2).
+
+    Parâmetros:
+        D, Biomassa, Substrato, Produto (array): Curvas a plotar
+        Dil_min (float): Limite inferior do eixo D (1/h)
+        Dil_max (float): Limite superior do eixo D (1/h)
+        Dcritico (float): Taxa de diluição crítica (1/h)
+        mostrar_Dcritico (bool): Desenha a linha do Dcritico
+        titulo (str): Título do gráfico
+        bandas (tuple | None): Faixas de incerteza (D, {curva: (inferior,
+            mediana, superior)}), como retornado por incerteza.faixas
+
+    Retorna:
+        Figure: Figura montada (fora do pyplot)
+    """
+    fig1 = _nova_figura()
+    ax1 = fig1.subplots()
+    ax2 = ax1.twinx()
+
+    # --- Faixas de incerteza (atrás das curvas) ---
+    if bandas is not None:
+        D_bandas, curvas = bandas
+        for nome, cor in (('Biomassa', COR_BIOMASSA), ('Produto', COR_PRODUTO),
+                          ('Substrato', COR_SUBSTRATO)):
+            inferior, mediana, superior = curvas[nome]
+            ax1.fill_between(D_bandas, inferior, superior, color=cor, alpha=0.15, linewidth=0)
+            ax1.plot(D_bandas, mediana, color=cor, linestyle=':', label=f'{nome} (mediana)')
+
+    # --- Plotagem ax1 ---
+    ax1.plot(D, Biomassa, label='Biomassa', color=COR_BIOMASSA)
+    ax1.plot(D, Produto, label='Produto', color=COR_PRODUTO)
+    ax1.plot(D, Substrato, label='Substrato', color=COR_SUBSTRATO, linestyle='--')
+    # --- limitação do eixo tempo ---
+    ax1.set_xlim([Dil_min, Dil_max])
+    if mostrar_Dcritico:
+        # Linha Dcritico
+        ax1.axvline(x=Dcritico, color='black', linestyle='--', label='Dcrítico')
+        ax1.text(Dcritico, ax1.get_ylim()[1], f'Dcrítico: {Dcritico:.3f}',
+                 rotation=90, color='black', va='top', ha='right')
+
+    # --- Configuração Eixo Principal (ax1) ---
+    ax1.set_ylabel("Concentração (g/L) [Biomassa, Produto]")
+    ax1.set_xlabel('Diluição (1/h)')
+    ax1.set_title(titulo)
+    ax1.grid(True)
+    ax1.tick_params(axis='y', labelcolor=COR_BIOMASSA)
+    # Força o eixo y principal a começar em 0
+    ax1.set_ylim(bottom=0)
+
+    # --- Configuração Eixo Secundário (ax2) ---
+    ax2.set_ylabel('Concentração (g/L) [Substrato]', color=COR_SUBSTRATO)
+    ax2.tick_params(axis='y', labelcolor=COR_SUBSTRATO)
+
+    # Legenda única com os handles dos DOIS eixos
+    h1, l1 = ax1.get_legend_handles_labels()
+    h2, l2 = ax2.get_legend_handles_labels()
+    ax1.legend(h1 + h2, l1 + l2, loc='best')
+    return fig1
+
+
+def desenhar_dinamico(tempo, Biomassa, Substrato, Produto, titulo):
+    """
+    Monta a figura da simulação dinâmica (concentrações x tempo).
+
+    Parâmetros:
+        tempo, Biomassa, Substrato, Produto (array): Curvas a plotar
+        titulo (str): Título do gráfico
+
+    Retorna:
+        Figure: Figura montada (fora do pyplot)
+    """
+    fig = _nova_figura()
+    ax = fig.subplots()
+    ax.plot(tempo, Biomassa, label='Biomassa', color=COR_BIOMASSA)
+    ax.plot(tempo, Produto, label='Produto', color=COR_PRODUTO)
+    ax.plot(tempo, Substrato, label='Substrato', color=COR_SUBSTRATO, linestyle='--')
+    ax.set_xlabel('Tempo (h)')
+    ax.set_ylabel('Concentração (g/L)')
+    ax.set_title(titulo)
+    ax.set_xlim([tempo[0], tempo[-1]])
+    ax.set_ylim(bottom=0)
+    ax.grid(True)
+    ax.legend(loc='best')
+    return fig
+
+
+def grafico_estacionario_png(D, Biomassa, Substrato, Produto, Dil_min, Dil_max, Dcritico,
+                             mostrar_Dcritico, titulo, dpi=DPI, max_pontos=MAX_PONTOS, bandas=None):
+    """
+    Retorna o PNG das curvas de estado estacionário, usando o cache.
+
+    Parâmetros: os mesmos de desenhar_estacionario, mais dpi e max_pontos
+    (número máximo de pontos plotados por curva).
+
+    Retorna:
+        bytes: Imagem PNG
+    """
+    D, Biomassa, Substrato, Produto = reduzir_curvas(D, (Biomassa, Substrato, Produto), max_pontos)
+    assinatura_bandas = None
+    if bandas is not None:
+        D_bandas, curvas = bandas
+        assinatura_bandas = _assinatura(D_bandas, *(c for nome in sorted(curvas) for c in curvas[nome]))
+    chave = ('estacionario', _assinatura(D, Biomassa, Substrato, Produto), assinatura_bandas,
+             float(Dil_min), float(Dil_max), float(Dcritico), bool(mostrar_Dcritico), titulo, dpi)
+    return cache_graficos.obter(chave, lambda: renderizar_png(
+        desenhar_estacionario(D, Biomassa, Substrato, Produto, Dil_min, Dil_max, Dcritico,
+                              mostrar_Dcritico, titulo, bandas), dpi))
+
+
+def grafico_dinamico_png(tempo, Biomassa, Substrato, Produto, titulo, dpi=DPI):
+    """
+    Retorna o PNG da simulação dinâmica, usando o cache.
+
+    Parâmetros: os mesmos de desenhar_dinamico, mais dpi.
+
+    Retorna:
+        bytes: Imagem PNG
+    """
+    chave = ('dinamico', _assinatura(tempo, Biomassa, Substrato, Produto), titulo, dpi)
+    return cache_graficos.obter(chave, lambda: renderizar_png(
+        desenhar_dinamico(tempo, Biomassa, Substrato, Produto, titulo), dpi))
+
+
+def desenhar_produtividade(D, prod_X, prod_P, D_otimo_X, D_otimo_P, titulo):
+    """
+    Monta a figura das produtividades volumétricas (D*X e D*P) x D.
+
+    Parâmetros:
+        D, prod_X, prod_P (array): Curvas a plotar
+        D_otimo_X (float): D de máxima produtividade de biomassa (1/h)
+        D_otimo_P (float): D de máxima produtividade de produto (1/h)
+        titulo (str): Título do gráfico
+
+    Retorna:
+        Figure: Figura montada (fora do pyplot)
+    """
+    fig = _nova_figura()
+    ax = fig.subplots()
+    ax.plot(D, prod_X, label='D*X (biomassa)', color=COR_BIOMASSA)
+    ax.plot(D, prod_P, label='D*P (produto)', color=COR_PRODUTO)
+    ax.axvline(x=D_otimo_X, color=COR_BIOMASSA, linestyle=':', label=f'D ótimo X: {D_otimo_X:.3f}')
+    ax.axvline(x=D_otimo_P, color=COR_PRODUTO, linestyle=':', label=f'D ótimo P: {D_otimo_P:.3f}')
+    ax.set_xlabel('Diluição (1/h)')
+    ax.set_ylabel('Produtividade (g/L.h)')
+    ax.set_title(titulo)
+    ax.set_ylim(bottom=0)
+    ax.grid(True)
+    ax.legend(loc='best')
+    return fig
+
+
+def grafico_produtividade_png(D, prod_X, prod_P, D_otimo_X, D_otimo_P, titulo, dpi=DPI,
+                              max_pontos=MAX_PONTOS):
+    """
+    Retorna o PNG das produtividades volumétricas, usando o cache.
+
+    Parâmetros: os mesmos de desenhar_produtividade, mais dpi e max_pontos
+    (número máximo de pontos plotados por curva).
+
+    Retorna:
+        bytes: Imagem PNG
+    """
+    D, prod_X, prod_P = reduzir_curvas(D, (prod_X, prod_P), max_pontos)
+    chave = ('produtividade', _assinatura(D, prod_X, prod_P), float(D_otimo_X),
+             float(D_otimo_P), titulo, dpi)
+    return cache_graficos.obter(chave, lambda: renderizar_png(
+        desenhar_produtividade(D, prod_X, prod_P, D_otimo_X, D_otimo_P, titulo), dpi))
+
+
+def desenhar_lineweaver_burk(D, S, u_max, Ks, titulo):
+    """
+    Monta o gráfico de Lineweaver-Burk (1/S x 1/D) das medidas com a reta
+    dos parâmetros ajustados (1/D = Ks/u_max * 1/S + 1/u_max).
+
+    Parâmetros:
+        D, S (array): Medidas de diluição (1/h) e substrato (g/L)
+        u_max (float): Velocidade máxima específica de crescimento ajustada (1/h)
+        Ks (float): Constante de saturação ajustada (g/L)
+        titulo (str): Título do gráfico
+
+    Retorna:
+        Figure: Figura montada (fora do pyplot)
+    """
+    validos = (D > 0) & (S > 0)
+    inverso_S, inverso_D = 1 / S[validos], 1 / D[validos]
+    fig = _nova_figura()
+    ax = fig.subplots()
+    ax.scatter(inverso_S, inverso_D, color=COR_SUBSTRATO, label='Medidas')
+    x = np.linspace(0, inverso_S.max() * 1.05 if len(inverso_S) else 1.0, 50)
+    ax.plot(x, Ks / u_max * x + 1 / u_max, color='black', linestyle='--',
+            label=f'Ajuste: u_max = {u_max:.3f}, Ks = {Ks:.3f}')
+    ax.set_xlabel('1/S (L/g)')
+    ax.set_ylabel('1/D (h)')
+    ax.set_title(titulo)
+    ax.set_xlim(left=0)
+    ax.set_ylim(bottom=0)
+    ax.grid(True)
+    ax.legend(loc='best')
+    return fig
+
+
+def grafico_lineweaver_burk_png(D, S, u_max, Ks, titulo, dpi=DPI):
+    """
+    Retorna o PNG do gráfico de Lineweaver-Burk, usando o cache.
+
+    Parâmetros: os mesmos de desenhar_lineweaver_burk, mais dpi.
+
+    Retorna:
+        bytes: Imagem PNG
+    """
+    D, S = np.asarray(D, dtype=np.float64), np.asarray(S, dtype=np.float64)
+    chave = ('lineweaver_burk', _assinatura(D, S), float(u_max), float(Ks), titulo, dpi)
+    return cache_graficos.obter(chave, lambda: renderizar_png(
+        desenhar_lineweaver_burk(D, S, float(u_max), float(Ks), titulo), dpi))
+
+
+def desenhar_mapa(mapa, camada, titulo, rotulo_fronteira='Dcrítico'):
+    """
+    Monta o mapa de calor de uma camada de um mapa de operação, com a
+    região de lavagem em cinza e a fronteira de lavagem tracejada.
+
+    Parâmetros:
+        mapa (dict): Resultado de mapas.mapa_D_Sin ou mapas.mapa_A_B
+        camada (str): Nome da camada (ver mapas.CAMADAS)
+        titulo (str): Título do gráfico
+        rotulo_fronteira (str): Legenda da curva de fronteira
+
+    Retorna:
+        Figure: Figura montada (fora do pyplot)
+    """
+    from matplotlib import colormaps
+    (nome_x, eixo_x), (nome_y, eixo_y) = mapa['eixo_x'], mapa['eixo_y']
+    valores = np.ma.masked_array(mapa['camadas'][camada], mask=mapa['lavagem'])
+    cores = colormaps['viridis'].with_extremes(bad='lightgray')
+
+    fig = _nova_figura()
+    ax = fig.subplots()
+    imagem = ax.imshow(valores, origin='lower', aspect='auto', cmap=cores, interpolation='nearest',
+                       extent=(eixo_x[0], eixo_x[-1], eixo_y[0], eixo_y[-1]))
+    fig.colorbar(imagem, ax=ax, label=camada)
+    x, y = mapa['fronteira']
+    ax.plot(x, y, color='black', linestyle='--', label=rotulo_fronteira)
+    ax.set_xlim(eixo_x[0], eixo_x[-1])
+    ax.set_ylim(eixo_y[0], eixo_y[-1])
+    ax.set_xlabel(nome_x)
+    ax.set_ylabel(nome_y)
+    ax.set_title(titulo)
+    ax.legend(loc='upper right')
+    return fig
+
+
+def grafico_mapa_png(mapa, camada, titulo, rotulo_fronteira='Dcrítico', dpi=DPI):
+    """
+    Retorna o PNG do mapa de calor, usando o cache.
+
+    Parâmetros: os mesmos de desenhar_mapa, mais dpi.
+
+    Retorna:
+        bytes: Imagem PNG
+    """
+    chave = ('mapa', _assinatura(mapa['camadas'][camada], mapa['lavagem'], *mapa['fronteira']),
+             camada, titulo, rotulo_fronteira, dpi)
+    return cache_graficos.obter(chave, lambda: renderizar_png(
+        desenhar_mapa(mapa, camada, titulo, rotulo_fronteira), dpi))
+
+
+def _trecho_estavel(estavel):
+    """Máscara dos pontos estáveis estendida um ponto para cada lado (liga as trocas de estabilidade)."""
+    estavel = np.asarray(estavel) == 1
+    estendida = estavel.copy()
+    estendida[1:] |= estavel[:-1]
+    estendida[:-1] |= estavel[1:]
+    return estendida
+
+
+def desenhar_continuacao(continuacao, variavel, Dil_min, Dil_max, titulo):
+    """
+    Monta o diagrama de bifurcação: os ramos de estado estacionário em D,
+    estáveis em linha cheia e instáveis tracejados, com as bifurcações marcadas.
+
+    Parâmetros:
+        continuacao (dict): Resultado de continuacao.continuar_estacionario
+        variavel (str): 'Biomassa (g/L)', 'Substrato (g/L)' ou 'Produto (g/L)'
+        Dil_min (float): Limite inferior do eixo D (1/h)
+        Dil_max (float): Limite superior do eixo D (1/h)
+        titulo (str): Título do gráfico
+
+    Retorna:
+        Figure: Figura montada (fora do pyplot)
+    """
+    cores = {'Biomassa (g/L)': COR_BIOMASSA, 'Substrato (g/L)': COR_SUBSTRATO,
+             'Produto (g/L)': COR_PRODUTO}
+    marcadores = {'Ponto limite': 'o', 'Transcrítica': 's', 'Troca de estabilidade': '^'}
+    fig = _nova_figura()
+    ax = fig.subplots()
+    for ramo, cor in (('Lavagem', 'gray'), ('Com crescimento', cores[variavel])):
+        dados = continuacao['ramos'][ramo]
+        D, y = dados['Diluição (1/h)'], dados[variavel]
+        estavel = _trecho_estavel(dados['Estável'])
+        instavel = np.asarray(dados['Estável']) == 0
+        if np.any(estavel):
+            ax.plot(D, np.where(estavel, y, np.nan), color=cor, label=f'{ramo} - estável')
+        if np.any(instavel):
+            ax.plot(D, np.where(instavel, y, np.nan), color=cor, linestyle='--',
+                    label=f'{ramo} - instável')
+    for tipo, marcador in marcadores.items():
+        pontos = [b for b in continuacao['bifurcacoes'] if b['Tipo'] == tipo]
+        if pontos:
+            ax.scatter([b['Diluição (1/h)'] for b in pontos], [b[variavel] for b in pontos],
+                       marker=marcador, color='black', zorder=3, label=tipo)
+    ax.set_xlim(Dil_min, Dil_max)
+    ax.set_xlabel('Diluição (1/h)')
+    ax.set_ylabel(variavel)
+    ax.set_title(titulo)
+    ax.grid(True)
+    ax.legend(loc='best', fontsize='small')
+    return fig
+
+
+def grafico_continuacao_png(continuacao, variavel, Dil_min, Dil_max, titulo, dpi=DPI):
+    """
+    Retorna o PNG do diagrama de bifurcação, usando o cache.
+
+    Parâmetros: os mesmos de desenhar_continuacao, mais dpi.
+
+    Retorna:
+        bytes: Imagem PNG
+    """
+    ramos = continuacao['ramos'].values()
+    chave = ('continuacao', _assinatura(*(r[nome] for r in ramos for nome in
+                                          ('Diluição (1/h)', variavel, 'Estável'))),
+             tuple((b['Tipo'], b['Diluição (1/h)']) for b in continuacao['bifurcacoes']),
+             variavel, float(Dil_min), float(Dil_max), titulo, dpi)
+    return cache_graficos.obter(chave, lambda: renderizar_png(
+        desenhar_continuacao(continuacao, variavel, float(Dil_min), float(Dil_max), titulo), dpi))
@@ -0,0 +1,118 @@
+"""
+Imagens dos diagramas do processo, lidas e redimensionadas uma vez por
+processo.
+
+A página é reexecutada a cada interação; em vez de ler os PNGs de
+Imagens/ do disco a cada vez e enviar o arquivo em resolução cheia para
+exibi-lo com 400 px, o conteúdo fica em um cache do processo
+compartilhado por todas as sessões, já na largura de exibição. O recorte
+ampliado do filtro de reciclo sai do mesmo diagrama.
+
+O redimensionamento usa o Pillow (importado só no primeiro uso); sem ele
+as imagens são servidas no tamanho original.
+"""
+import io
+import os
+
+from .cache import CacheResultados, memorizar
+
+# Pasta Imagens/ na raiz do projeto
+PASTA_IMAGENS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Imagens')
+
+# Diagrama de cada modalidade de processo
+DIAGRAMAS = {
+    'Padrão': 'Dia_p_continuo.png',
+    'Reciclo': 'Dia_p_cont_reciclo.png',
+    'Série': 'Dia_p_cont_serie.png',
+}
+
+# Regiões ampliadas (arquivo, caixa em frações da largura/altura:
+# esquerda, topo, direita, base)
+RECORTES = {
+    'Filtro de reciclo': ('Dia_p_cont_reciclo.png', (0.62, 0.22, 1.0, 0.56)),
+}
+
+# Pixels por pixel de exibição (telas de alta densidade)
+DENSIDADE = 2
+
+cache_imagens = CacheResultados(max_entradas=32)
+
+
+@memorizar(cache_imagens)
+def ler_imagem(nome_arquivo, pasta=PASTA_IMAGENS):
+    """
+    Lê o arquivo de imagem uma única vez por processo.
+
+    Parâmetros:
+        nome_arquivo (str): Nome do arquivo dentro da pasta
+        pasta (str): Pasta das imagens
+
+    Retorna:
+        bytes | None: Conteúdo do arquivo, ou None se ele não existir
+    """
+    caminho = os.path.join(pasta, nome_arquivo)
+    if not os.path.exists(caminho):
+        return None
+    with open(caminho, 'rb') as arquivo:
+        return arquivo.read()
+
+
+def _redimensionar(original, largura, caixa=None):
+    """Recorta (opcional) e reduz o PNG para a largura dada, em PNG."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return original
+    with Image.open(io.BytesIO(original)) as imagem:
+        if caixa is not None:
+            w, h = imagem.size
+            esquerda, topo, direita, base = caixa
+            imagem = imagem.crop((round(esquerda * w), round(topo * h),
+                                  round(direita * w), round(base * h)))
+        if imagem.width > largura:
+            altura = max(1, round(imagem.height * largura / imagem.width))
+            imagem = imagem.resize((largura, altura), Image.LANCZOS)
+        buffer = io.BytesIO()
+        imagem.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@memorizar(cache_imagens)
+def imagem_exibicao(nome_arquivo, largura=400, densidade=DENSIDADE, pasta=PASTA_IMAGENS):
+    """
+    Retorna a variante da imagem já reduzida para a largura de exibição.
+
+    Parâmetros:
+        nome_arquivo (str): Nome do arquivo dentro da pasta
+        largura (int): Largura de exibição (px)
+        densidade (int): Pixels da imagem por pixel de exibição
+        pasta (str): Pasta das imagens
+
+    Retorna:
+        bytes | None: PNG redimensionado, ou None se o arquivo não existir
+    """
+    original = ler_imagem(nome_arquivo, pasta)
+    if original is None:
+        return None
+    return _redimensionar(original, largura * densidade)
+
+
+@memorizar(cache_imagens)
+def recorte_ampliado(nome_recorte, largura=400, densidade=DENSIDADE, pasta=PASTA_IMAGENS):
+    """
+    Retorna uma região do diagrama (RECORTES) ampliada para exibição.
+
+    Parâmetros:
+        nome_recorte (str): Chave de RECORTES (ex.: 'Filtro de reciclo')
+        largura (int): Largura de exibição (px)
+        densidade (int): Pixels da imagem por pixel de exibição
+        pasta (str): Pasta das imagens
+
+    Retorna:
+        bytes | None: PNG do recorte, ou None se o arquivo não existir
+    """
+    nome_arquivo, caixa = RECORTES[nome_recorte]
+    original = ler_imagem(nome_arquivo, pasta)
+    if original is None:
+        return None
+    return _redimensionar(original, largura * densidade, caixa)
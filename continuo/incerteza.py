@@ -0,0 +1,238 @@
+"""
+Propagação de incerteza dos parâmetros cinéticos (Monte Carlo).
+
+Os parâmetros (u_max, Ks, Yx_s, ...) são sorteados de distribuições
+normal, lognormal, uniforme ou normal multivariada (covariância de um
+ajuste), e o estado estacionário dos reatores padrão e com reciclo é
+avaliado para todas as amostras de um bloco em uma única passada
+vetorizada (amostras x D).
+
+As amostras são processadas em blocos de tamanho limitado. Cada bloco é
+reduzido a um resumo de quantis (até NIVEIS_RESUMO níveis por ponto de
+D); quando os resumos pendentes passam de COLUNAS_PENDENTES colunas, eles
+são incorporados, ponderados pelo número de amostras, a um único resumo
+acumulado de NIVEIS_RESUMO níveis. Os quantis pedidos saem desse resumo
+(erro da ordem de 1/NIVEIS_RESUMO na posição do quantil). Como ficam em
+memória só um bloco e no máximo COLUNAS_PENDENTES + NIVEIS_RESUMO colunas
+de resumo, ela não depende do número de amostras; com um único bloco, o
+resultado é o quantil exato da amostra.
+"""
+import numpy as np
+
+from .cache import memorizar
+from .modelo import cache_estacionario, calcular_estado_estacionario, fator_reciclo
+from .resultado import ResultadoEstacionario
+from .varredura import OPCIONAIS, PARAMETROS, PONTOS_POR_BLOCO
+
+DISTRIBUICOES = ('normal', 'lognormal', 'uniforme')
+
+# Níveis do resumo de quantis guardado por bloco
+NIVEIS_RESUMO = 201
+# Colunas de resumos pendentes antes de incorporá-las ao acumulado
+COLUNAS_PENDENTES = 4 * NIVEIS_RESUMO
+
+
+def _amostrar(distribuicao, n, rng):
+    """Sorteia n valores de uma distribuição (nome, a, b) ou constante."""
+    if np.isscalar(distribuicao):
+        return np.full(n, float(distribuicao))
+    nome, a, b = distribuicao
+    if nome == 'normal':  # média, desvio padrão
+        return rng.normal(a, b, n)
+    if nome == 'lognormal':  # média e desvio padrão da própria variável
+        sigma2 = np.log1p((b / a) ** 2)
+        return rng.lognormal(np.log(a) - sigma2 / 2, np.sqrt(sigma2), n)
+    if nome == 'uniforme':  # mínimo, máximo
+        return rng.uniform(a, b, n)
+    raise ValueError(f"distribuição deve ser uma de {DISTRIBUICOES} (recebido {nome!r})")
+
+
+def amostrar_parametros(especificacao, n, rng=None, covariancia=None):
+    """
+    Sorteia n conjuntos de parâmetros.
+
+    Parâmetros:
+        especificacao (dict | iterable): nome -> valor fixo ou tupla
+            ('normal', média, desvio), ('lognormal', média, desvio) ou
+            ('uniforme', mínimo, máximo). A, B e m_s são opcionais (sem
+            reciclo e sem manutenção).
+        n (int): Número de amostras
+        rng (np.random.Generator | int | None): Gerador ou semente
+        covariancia (tuple | None): (nomes, médias, matriz) de um ajuste; os
+            parâmetros listados são sorteados de uma normal multivariada e
+            substituem os da especificação
+
+    Retorna:
+        dict: nome -> array (n,) para cada parâmetro de PARAMETROS.
+            Valores negativos (sem sentido físico) são truncados em 0.
+    """
+    rng = np.random.default_rng(rng)
+    especificacao = {**OPCIONAIS, **dict(especificacao)}
+    faltando = set(PARAMETROS) - set(especificacao)
+    if faltando:
+        raise ValueError(f"Parâmetros ausentes: {sorted(faltando)}")
+
+    amostras = {nome: _amostrar(especificacao[nome], n, rng) for nome in PARAMETROS}
+    if covariancia is not None:
+        nomes, medias, matriz = covariancia
+        conjunto = rng.multivariate_normal(np.asarray(medias, dtype=np.float64),
+                                           np.asarray(matriz, dtype=np.float64), n,
+                                           method='cholesky')
+        for j, nome in enumerate(nomes):
+            amostras[nome] = conjunto[:, j]
+    for nome in PARAMETROS:
+        if nome != 'B':
+            np.maximum(amostras[nome], 0.0, out=amostras[nome])
+    return amostras
+
+
+def _niveis(niveis):
+    """Níveis no meio de niveis faixas de mesma massa em [0, 1]."""
+    return (np.arange(niveis) + 0.5) / niveis
+
+
+def _resumo(valores, niveis):
+    """Valores ordenados de cada linha (ponto de D) nos níveis de _niveis."""
+    ordenados = np.sort(valores, axis=1)
+    idx = (_niveis(niveis) * ordenados.shape[1]).astype(np.intp)
+    return ordenados[:, idx]
+
+
+def _combinar(resumos, pesos, quantis):
+    """
+    Quantis ponderados de resumos de blocos, por ponto de D.
+
+    Cada coluna de um resumo representa peso/niveis amostras do bloco; os
+    quantis saem por interpolação na distribuição acumulada dos resumos
+    reunidos e ordenados.
+    """
+    valores = np.concatenate(resumos, axis=1)
+    massa = np.concatenate([np.full(r.shape[1], p / r.shape[1]) for r, p in zip(resumos, pesos)])
+    ordem = np.argsort(valores, axis=1)
+    valores = np.take_along_axis(valores, ordem, axis=1)
+    massa = massa[ordem]
+    acumulada = np.cumsum(massa, axis=1)
+    # Posição de cada valor no meio da sua massa, normalizada para [0, 1]
+    acumulada = (acumulada - 0.5 * massa) / acumulada[:, -1:]
+    # Todos os quantis de todas as linhas em uma única busca: cada linha é
+    # deslocada de 2*i, o que mantém o vetor achatado em ordem crescente
+    linhas, colunas = valores.shape
+    q = np.asarray(quantis, dtype=np.float64)[None, :]
+    deslocamento = 2.0 * np.arange(linhas)[:, None]
+    direita = np.searchsorted((acumulada + deslocamento).ravel(), q + deslocamento) \
+        - colunas * np.arange(linhas)[:, None]
+    direita = np.clip(direita, 1, colunas - 1)
+    esquerda = direita - 1
+    c0 = np.take_along_axis(acumulada, esquerda, axis=1)
+    c1 = np.take_along_axis(acumulada, direita, axis=1)
+    v0 = np.take_along_axis(valores, esquerda, axis=1)
+    v1 = np.take_along_axis(valores, direita, axis=1)
+    peso = np.clip(np.divide(q - c0, c1 - c0, out=np.zeros_like(c0), where=c1 > c0), 0.0, 1.0)
+    return (v0 + peso * (v1 - v0)).T
+
+
+def bandas_incerteza(Dil, especificacao, modalidade_associacao, n_amostras=10_000,
+                     quantis=(0.05, 0.5, 0.95), semente=None, covariancia=None,
+                     pontos_por_bloco=PONTOS_POR_BLOCO, dtype=np.float64):
+    """
+    Quantis de Biomassa, Substrato e Produto ao longo de D sob incerteza
+    dos parâmetros.
+
+    Parâmetros:
+        Dil (array): Taxas de diluição (1/h)
+        especificacao (dict | iterable): Distribuições dos parâmetros (ver
+            amostrar_parametros); A e B definem o reciclo (E = 1 + A - A*B)
+            e m_s a manutenção
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        n_amostras (int): Número de amostras de Monte Carlo
+        quantis (tuple): Quantis desejados, entre 0 e 1
+        semente (int | None): Semente do gerador (resultado reprodutível)
+        covariancia (tuple | None): (nomes, médias, matriz), ver amostrar_parametros
+        pontos_por_bloco (int): Máximo de pontos (amostras x D) por bloco
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+
+    Retorna:
+        ResultadoEstacionario: Diluição e, para cada quantil q, as colunas
+            'Biomassa p{100q} (g/L)', 'Substrato p{100q} (g/L)' e
+            'Produto p{100q} (g/L)'
+    """
+    D = np.ascontiguousarray(Dil, dtype=np.float64)
+    rng = np.random.default_rng(semente)
+    por_bloco = max(1, pontos_por_bloco // max(len(D), 1))
+
+    niveis = _niveis(NIVEIS_RESUMO)
+    # Resumo acumulado e resumos ainda não incorporados, com seus pesos
+    resumos = {'Biomassa': [], 'Substrato': [], 'Produto': []}
+    pesos = []
+    unico = n_amostras <= por_bloco
+    for inicio in range(0, n_amostras, por_bloco):
+        n = min(por_bloco, n_amostras - inicio)
+        # Uma linha por ponto de D e uma coluna por amostra: a ordenação
+        # por ponto de D percorre memória contígua
+        p = {nome: v[None, :] for nome, v in
+             amostrar_parametros(especificacao, n, rng, covariancia).items()}
+        S, X, P = calcular_estado_estacionario(
+            D[:, None], p['u_max'], p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'], p['Beta'],
+            modalidade_associacao, fator_reciclo(p['A'], p['B']), m_s=p['m_s'])
+        for nome, valores in (('Biomassa', X), ('Substrato', S), ('Produto', P)):
+            valores = np.broadcast_to(valores, (len(D), n))
+            if unico:
+                # Bloco único: quantis exatos da amostra
+                resumos[nome] = np.quantile(valores, quantis, axis=1)
+            else:
+                resumos[nome].append(_resumo(valores, min(NIVEIS_RESUMO, n)))
+        pesos.append(n)
+        if not unico and sum(r.shape[1] for r in resumos['Biomassa']) > COLUNAS_PENDENTES:
+            # Incorpora os pendentes em um resumo acumulado de tamanho fixo
+            for nome in resumos:
+                resumos[nome] = [_combinar(resumos[nome], pesos, niveis).T]
+            pesos = [sum(pesos)]
+
+    colunas = {'Diluição (1/h)': D}
+    for nome, unidade in (('Biomassa', 'g/L'), ('Substrato', 'g/L'), ('Produto', 'g/L')):
+        valores = resumos[nome] if unico else _combinar(resumos[nome], pesos, quantis)
+        for q, linha in zip(quantis, valores):
+            colunas[f'{nome} p{100 * q:g} ({unidade})'] = linha
+    return ResultadoEstacionario(colunas, dtype)
+
+
+def faixas(bandas, quantis=(0.05, 0.5, 0.95)):
+    """
+    Reorganiza o resultado de bandas_incerteza para os gráficos.
+
+    Parâmetros:
+        bandas (ResultadoEstacionario): Resultado de bandas_incerteza
+        quantis (tuple): (inferior, mediana, superior), presentes no resultado
+
+    Retorna:
+        tuple: D e dict 'Biomassa'/'Substrato'/'Produto' -> (inferior, mediana, superior)
+    """
+    return bandas['Diluição (1/h)'], {
+        nome: tuple(bandas[f'{nome} p{100 * q:g} (g/L)'] for q in quantis)
+        for nome in ('Biomassa', 'Substrato', 'Produto')
+    }
+
+
+def calcular_bandas(Dil_min, Dil_max, n_pontos, especificacao, modalidade_associacao,
+                    n_amostras=10_000, quantis=(0.05, 0.5, 0.95), semente=0):
+    """
+    Versão de bandas_incerteza com argumentos hashable, para o cache da página.
+
+    Parâmetros:
+        Dil_min (float): Diluição mínima (1/h)
+        Dil_max (float): Diluição máxima (1/h)
+        n_pontos (int): Pontos da malha uniforme de D
+        especificacao (tuple): Pares (nome, distribuição), ver amostrar_parametros
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        n_amostras (int): Número de amostras de Monte Carlo
+        quantis (tuple): Quantis desejados, entre 0 e 1
+        semente (int): Semente do gerador
+
+    Retorna:
+        ResultadoEstacionario: Ver bandas_incerteza
+    """
+    return bandas_incerteza(np.linspace(Dil_min, Dil_max, n_pontos), especificacao,
+                            modalidade_associacao, n_amostras, quantis, semente)
+
+
+calcular_bandas_cache = memorizar(cache_estacionario)(calcular_bandas)
@@ -0,0 +1,174 @@
+"""
+Instrumentação das etapas de cada reexecução da página.
+
+Cada reexecução cria um MedidorReexecucao que cronometra as etapas do
+script (curvas, fórmulas, gráfico, tabela, imagens...). Ao final, os tempos
+são gravados em uma linha de log estruturada (JSON) e guardados em um
+histórico limitado do processo, usado para calcular percentis das
+reexecuções recentes. Um cProfile de uma reexecução pode ser capturado
+sob demanda.
+"""
+import cProfile
+import io
+import json
+import logging
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+logger = logging.getLogger('continuo.tempos')
+
+
+def configurar_log(nivel=logging.INFO):
+    """
+    Envia as linhas de tempo para o stderr (idempotente: a página chama a
+    cada reexecução).
+    """
+    if not logger.handlers:
+        manipulador = logging.StreamHandler()
+        manipulador.setFormatter(logging.Formatter('%(asctime)s %(name)s %(message)s'))
+        logger.addHandler(manipulador)
+        logger.setLevel(nivel)
+        logger.propagate = False
+
+
+class HistoricoTempos:
+    """
+    Histórico limitado dos tempos por etapa das últimas reexecuções.
+
+    Parâmetros:
+        max_reexecucoes (int): Quantidade de reexecuções mantidas
+    """
+
+    def __init__(self, max_reexecucoes=200):
+        self._registros = deque(maxlen=max_reexecucoes)
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._registros)
+
+    def registrar(self, tempos):
+        """Guarda os tempos (s) por etapa de uma reexecução."""
+        with self._trava:
+            self._registros.append(dict(tempos))
+
+    def percentis(self, qs=(50, 90, 99)):
+        """
+        Calcula percentis dos tempos de cada etapa.
+
+        Parâmetros:
+            qs (tuple): Percentis desejados
+
+        Retorna:
+            dict: etapa -> {'p50': ms, 'p90': ms, ..., 'n': amostras}
+        """
+        with self._trava:
+            registros = list(self._registros)
+        etapas = {}
+        for registro in registros:
+            for nome, tempo in registro.items():
+                etapas.setdefault(nome, []).append(tempo)
+        resumo = {}
+        for nome, tempos in etapas.items():
+            valores = np.percentile(np.asarray(tempos) * 1e3, qs)
+            resumo[nome] = {f'p{q}': float(v) for q, v in zip(qs, valores)}
+            resumo[nome]['n'] = len(tempos)
+        return resumo
+
+
+# Histórico compartilhado pelo processo (sobrevive entre reexecuções)
+historico_tempos = HistoricoTempos()
+
+
+class MedidorReexecucao:
+    """
+    Cronômetro das etapas de uma reexecução.
+
+    iniciar(nome) encerra a etapa em andamento e abre a próxima, o que
+    permite marcar as etapas do script sem reindentar os blocos; medir(nome)
+    é a forma com gerenciador de contexto.
+
+    Parâmetros:
+        historico (HistoricoTempos): Destino dos tempos ao finalizar
+    """
+
+    def __init__(self, historico=historico_tempos):
+        self.historico = historico
+        self.tempos = {}
+        self._atual = None
+        self._inicio = time.perf_counter()
+
+    def iniciar(self, nome):
+        """Encerra a etapa atual (se houver) e começa a etapa nome."""
+        self.parar()
+        self._atual = (nome, time.perf_counter())
+
+    def parar(self):
+        """Encerra a etapa atual, acumulando seu tempo."""
+        if self._atual is not None:
+            nome, inicio = self._atual
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + time.perf_counter() - inicio
+            self._atual = None
+
+    @contextmanager
+    def medir(self, nome):
+        """Cronometra o bloco como a etapa nome."""
+        self.iniciar(nome)
+        try:
+            yield
+        finally:
+            self.parar()
+
+    def finalizar(self, **contexto):
+        """
+        Encerra a reexecução: registra no histórico e escreve a linha de log.
+
+        Parâmetros:
+            **contexto: Campos extras para o log (ex.: modalidade do processo)
+
+        Retorna:
+            dict: Tempos (s) por etapa, incluindo 'total'
+        """
+        self.parar()
+        self.tempos['total'] = time.perf_counter() - self._inicio
+        self.historico.registrar(self.tempos)
+        logger.info(json.dumps({
+            'evento': 'reexecucao',
+            'etapas_ms': {nome: round(t * 1e3, 3) for nome, t in self.tempos.items()},
+            **contexto,
+        }, ensure_ascii=False))
+        return self.tempos
+
+
+def iniciar_perfil():
+    """
+    Liga um cProfile para a reexecução atual.
+
+    Retorna:
+        cProfile.Profile: Perfil já habilitado
+    """
+    perfil = cProfile.Profile()
+    perfil.enable()
+    return perfil
+
+
+def texto_perfil(perfil, linhas=30, ordem='cumulative'):
+    """
+    Desliga o perfil e formata as funções mais custosas.
+
+    Parâmetros:
+        perfil (cProfile.Profile): Perfil iniciado por iniciar_perfil
+        linhas (int): Número de funções listadas
+        ordem (str): Critério de ordenação do pstats
+
+    Retorna:
+        str: Relatório do pstats
+    """
+    perfil.disable()
+    saida = io.StringIO()
+    pstats.Stats(perfil, stream=saida).sort_stats(ordem).print_stats(linhas)
+    return saida.getvalue()
@@ -0,0 +1,175 @@
+"""
+Gráfico interativo das curvas de estado estacionário (Vega-Lite).
+
+Em vez de rasterizar um PNG no servidor, monta uma especificação
+Vega-Lite e uma tabela colunar com as curvas (reduzidas para exibição por
+LTTB, reducao.py) que o navegador recebe uma única vez. Zoom,
+deslocamento, leitura dos valores sob o cursor e a linha do Dcritico
+passam a ser tratados no cliente, sem reexecutar o script.
+
+O layout reproduz o gráfico do matplotlib: Biomassa e Produto no eixo
+principal (ax1, à esquerda) e Substrato tracejado no eixo secundário
+(ax2, à direita), com as mesmas cores. Módulo de Python puro + NumPy;
+a página entrega o resultado a st.vega_lite_chart.
+"""
+import numpy as np
+
+from .reducao import MAX_PONTOS, lttb
+
+# Mesmas cores do gráfico em PNG (graficos.py)
+COR_BIOMASSA = 'red'
+COR_PRODUTO = 'blue'
+COR_SUBSTRATO = 'green'
+
+_ROTULO_D = 'Diluição (1/h)'
+
+
+def dados_estacionario(D, Biomassa, Substrato, Produto, max_pontos=MAX_PONTOS):
+    """
+    Monta a tabela colunar enviada ao navegador (D, X, S, P).
+
+    Parâmetros:
+        D, Biomassa, Substrato, Produto (array): Curvas completas
+        max_pontos (int): Número máximo de pontos enviados (redução LTTB)
+
+    Retorna:
+        dict: 'D', 'X', 'S', 'P' -> arrays float64 reduzidos para exibição
+    """
+    idx = lttb(D, np.vstack([Biomassa, Substrato, Produto]), max_pontos)
+    return {nome: np.asarray(valor, dtype=np.float64)[idx]
+            for nome, valor in (('D', D), ('X', Biomassa), ('S', Substrato), ('P', Produto))}
+
+
+def _camadas_bandas(bandas, eixo_D):
+    """Camadas das faixas de incerteza: (ax1: Biomassa e Produto, ax2: Substrato)."""
+    D_bandas, curvas = bandas
+    campos = {'Biomassa': 'X', 'Produto': 'P', 'Substrato': 'S'}
+    colunas = {'D': np.asarray(D_bandas, dtype=np.float64)}
+    for nome, campo in campos.items():
+        for sufixo, valores in zip(('inf', 'med', 'sup'), curvas[nome]):
+            colunas[f'{campo}_{sufixo}'] = np.asarray(valores, dtype=np.float64)
+    linhas = zip(*(v.tolist() for v in colunas.values()))
+    dados = {'values': [dict(zip(colunas, linha)) for linha in linhas]}
+
+    def camadas(nome, cor):
+        campo = campos[nome]
+        return [
+            {'data': dados, 'mark': {'type': 'area', 'color': cor, 'opacity': 0.15, 'clip': True},
+             'encoding': {'x': eixo_D,
+                          'y': {'field': f'{campo}_inf', 'type': 'quantitative'},
+                          'y2': {'field': f'{campo}_sup'}}},
+            {'data': dados, 'mark': {'type': 'line', 'color': cor, 'strokeDash': [2, 2], 'clip': True},
+             'encoding': {'x': eixo_D, 'y': {'field': f'{campo}_med', 'type': 'quantitative'}}},
+        ]
+    return (camadas('Biomassa', COR_BIOMASSA) + camadas('Produto', COR_PRODUTO),
+            camadas('Substrato', COR_SUBSTRATO))
+
+
+def especificacao_estacionario(Dil_min, Dil_max, Dcritico, titulo, mostrar_Dcritico=False,
+                               bandas=None):
+    """
+    Monta a especificação Vega-Lite das curvas de estado estacionário.
+
+    Os dados não entram na especificação: são passados à parte (tabela de
+    dados_estacionario), o que mantém a especificação pequena e permite
+    que o Streamlit envie as colunas em Arrow.
+
+    Interações no navegador:
+        - zoom (roda do mouse) e deslocamento (arrastar) no eixo D;
+          duplo clique volta à faixa [Dil_min, Dil_max]
+        - leitura de D, Biomassa, Substrato e Produto no ponto mais próximo
+        - caixa "Mostrar Dcritico" liga e desliga a linha do Dcritico
+
+    Parâmetros:
+        Dil_min (float): Limite inferior inicial do eixo D (1/h)
+        Dil_max (float): Limite superior inicial do eixo D (1/h)
+        Dcritico (float): Taxa de diluição crítica (1/h)
+        titulo (str): Título do gráfico
+        mostrar_Dcritico (bool): Estado inicial da linha do Dcritico
+        bandas (tuple | None): Faixas de incerteza (D, {curva: (inferior,
+            mediana, superior)}), já reduzidas; vão embutidas na especificação
+
+    Retorna:
+        dict: Especificação Vega-Lite (v5)
+    """
+    eixo_D = {'field': 'D', 'type': 'quantitative', 'title': _ROTULO_D,
+              'scale': {'domain': [float(Dil_min), float(Dil_max)]}}
+    dicas = [
+        {'field': 'D', 'type': 'quantitative', 'title': _ROTULO_D, 'format': '.4f'},
+        {'field': 'X', 'type': 'quantitative', 'title': 'Biomassa (g/L)', 'format': '.3f'},
+        {'field': 'S', 'type': 'quantitative', 'title': 'Substrato (g/L)', 'format': '.3f'},
+        {'field': 'P', 'type': 'quantitative', 'title': 'Produto (g/L)', 'format': '.3f'},
+    ]
+
+    # --- ax1: Biomassa e Produto (formato longo para a legenda) ---
+    ax1 = {
+        'transform': [{'fold': ['X', 'P'], 'as': ['curva', 'valor']},
+                      {'calculate': "datum.curva == 'X' ? 'Biomassa' : 'Produto'", 'as': 'curva'}],
+        'mark': {'type': 'line', 'clip': True},
+        'encoding': {
+            'x': eixo_D,
+            'y': {'field': 'valor', 'type': 'quantitative',
+                  'title': 'Concentração (g/L) [Biomassa, Produto]',
+                  'scale': {'domainMin': 0},
+                  'axis': {'labelColor': COR_BIOMASSA}},
+            'color': {'field': 'curva', 'type': 'nominal', 'title': None,
+                      'scale': {'domain': ['Biomassa', 'Produto', 'Substrato'],
+                                'range': [COR_BIOMASSA, COR_PRODUTO, COR_SUBSTRATO]},
+                      'legend': {'orient': 'top-right'}},
+        },
+        'params': [{'name': 'zoom', 'select': {'type': 'interval', 'encodings': ['x']},
+                    'bind': 'scales'}],
+    }
+
+    # --- ax2: Substrato tracejado no eixo da direita ---
+    ax2 = {
+        'transform': [{'calculate': "'Substrato'", 'as': 'curva'}],
+        'mark': {'type': 'line', 'strokeDash': [6, 4], 'clip': True},
+        'encoding': {
+            'x': eixo_D,
+            'y': {'field': 'S', 'type': 'quantitative',
+                  'title': 'Concentração (g/L) [Substrato]',
+                  'axis': {'orient': 'right', 'labelColor': COR_SUBSTRATO,
+                           'titleColor': COR_SUBSTRATO}},
+            'color': {'field': 'curva', 'type': 'nominal'},
+        },
+    }
+
+    # --- Leitura dos valores: ponto mais próximo do cursor no eixo D ---
+    cursor = {
+        'mark': {'type': 'rule', 'color': 'gray'},
+        'encoding': {
+            'x': {'field': 'D', 'type': 'quantitative'},
+            'opacity': {'condition': {'param': 'cursor', 'empty': False, 'value': 0.6},
+                        'value': 0},
+            'tooltip': dicas,
+        },
+        'params': [{'name': 'cursor',
+                    'select': {'type': 'point', 'encodings': ['x'], 'nearest': True,
+                               'on': 'pointerover', 'clear': 'pointerout'}}],
+    }
+
+    # --- Linha do Dcritico, ligada pela caixa de seleção no cliente ---
+    dcritico = {
+        'data': {'values': [{'Dcritico': float(Dcritico)}]},
+        'transform': [{'filter': 'mostrar_Dcritico'}],
+        'layer': [
+            {'mark': {'type': 'rule', 'color': 'black', 'strokeDash': [6, 4], 'clip': True},
+             'encoding': {'x': {'field': 'Dcritico', 'type': 'quantitative'}}},
+            {'mark': {'type': 'text', 'angle': 270, 'align': 'right', 'baseline': 'bottom',
+                      'dx': -4, 'y': 0, 'clip': True},
+             'encoding': {'x': {'field': 'Dcritico', 'type': 'quantitative'},
+                          'text': {'value': f'Dcrítico: {float(Dcritico):.3f}'}}},
+        ],
+    }
+
+    bandas_ax1, bandas_ax2 = _camadas_bandas(bandas, eixo_D) if bandas is not None else ([], [])
+
+    return {
+        '$schema': 'https://vega.github.io/schema/vega-lite/v5.json',
+        'title': titulo,
+        'params': [{'name': 'mostrar_Dcritico', 'value': bool(mostrar_Dcritico),
+                    'bind': {'input': 'checkbox', 'name': 'Mostrar Dcritico '}}],
+        'layer': [{'layer': bandas_ax1 + [ax1, cursor, dcritico]}, {'layer': bandas_ax2 + [ax2]}],
+        'resolve': {'scale': {'y': 'independent'}},
+    }
@@ -0,0 +1,99 @@
+"""
+Malha adaptativa de taxas de diluição.
+
+A malha uniforme de np.arange gasta a mesma resolução na região plana de
+D baixo e na região íngreme logo abaixo do Dcritico. Aqui os intervalos
+são subdivididos apenas onde a interpolação linear entre os pontos vizinhos
+erra mais do que a tolerância, respeitando um orçamento máximo de pontos.
+Cada rodada de refinamento avalia todos os pontos médios novos em uma
+única chamada vetorizada.
+
+O intervalo que começa em D = 0 não é subdividido: ali o termo Beta*X/D
+é singular e o refinamento gastaria o orçamento perseguindo P -> inf em
+vez de resolver a região perto do Dcritico. O erro é medido em relação à
+amplitude robusta (percentis 1-99 dos valores finitos) de cada curva.
+
+O erro no ponto médio não enxerga uma quina perto da ponta do intervalo
+(a lavagem no Dcritico): as quinas conhecidas entram como nós da malha
+inicial, e a interpolação linear fica suave dos dois lados.
+"""
+import numpy as np
+
+
+def _amplitude(F):
+    """Amplitude robusta de cada curva: percentis 1-99 dos valores finitos."""
+    finitos = np.where(np.isfinite(F), F, np.nan)
+    with np.errstate(invalid='ignore'):
+        inferior, superior = np.nanpercentile(finitos, [1, 99], axis=1, keepdims=True)
+    escala = superior - inferior
+    escala[~(escala > 0)] = 1.0
+    return escala
+
+
+def malha_adaptativa(avaliar, Dil_min, Dil_max, tolerancia=1e-3, max_pontos=2000,
+                     pontos_iniciais=17, largura_minima=None, nos=()):
+    """
+    Gera uma malha de D refinada onde as curvas têm maior curvatura.
+
+    Parâmetros:
+        avaliar (callable): Recebe um array de D com n pontos e devolve as
+            curvas como array (n,) ou (k, n)
+        Dil_min (float): Diluição mínima (1/h)
+        Dil_max (float): Diluição máxima (1/h)
+        tolerancia (float): Erro máximo de interpolação, relativo à
+            amplitude de cada curva
+        max_pontos (int): Número máximo de pontos da malha
+        pontos_iniciais (int): Pontos da malha uniforme inicial
+        largura_minima (float | None): Menor largura de intervalo subdividida
+            (1/h); None = 1e-12 da faixa
+        nos (iterable): D onde as curvas têm quina (ex.: Dcritico); os que
+            caem dentro da faixa entram na malha inicial
+
+    Retorna:
+        tuple: Malha D (array crescente, inclui Dil_max) e as curvas avaliadas
+            nela, com a mesma forma retornada por avaliar
+    """
+    if Dil_max <= Dil_min:
+        D = np.array([Dil_min], dtype=np.float64)
+        return D, avaliar(D)
+
+    nos = np.asarray(nos, dtype=np.float64).ravel()
+    nos = np.unique(nos[(nos > Dil_min) & (nos < Dil_max)])
+    pontos_iniciais = max(2, min(pontos_iniciais, max_pontos - len(nos)))
+    D = np.union1d(np.linspace(Dil_min, Dil_max, pontos_iniciais), nos)
+    resultado = avaliar(D)
+    F = np.atleast_2d(resultado)
+    if largura_minima is None:
+        largura_minima = 1e-12 * (Dil_max - Dil_min)
+
+    # Intervalos ainda não verificados (um a menos que o número de pontos)
+    ativo = np.ones(len(D) - 1, dtype=bool)
+    while len(D) < max_pontos and ativo.any():
+        idx = np.nonzero(ativo)[0]
+        Dm = 0.5 * (D[idx] + D[idx + 1])
+        Fm = np.atleast_2d(avaliar(Dm))
+
+        escala = _amplitude(F)
+        with np.errstate(invalid='ignore'):
+            erro = np.max(np.abs(Fm - 0.5 * (F[:, idx] + F[:, idx + 1])) / escala, axis=0)
+        erro = np.where(np.isfinite(erro), erro, 0.0)
+
+        # O intervalo em D = 0 (Beta*X/D singular) fica de fora
+        dividir = (erro > tolerancia) & (D[idx + 1] - D[idx] > largura_minima) & (D[idx] > 0)
+        disponiveis = max_pontos - len(D)
+        if dividir.sum() > disponiveis:
+            # Orçamento esgotado: subdivide apenas os piores intervalos
+            piores = np.argsort(np.where(dividir, -erro, np.inf))[:disponiveis]
+            dividir = np.zeros_like(dividir)
+            dividir[piores] = True
+
+        ativo[idx[~dividir]] = False
+        novos = idx[dividir]
+        if len(novos) == 0:
+            break
+        D = np.insert(D, novos + 1, Dm[dividir])
+        F = np.insert(F, novos + 1, Fm[:, dividir], axis=1)
+        # Cada intervalo subdividido vira dois intervalos ativos
+        ativo = np.insert(ativo, novos + 1, True)
+
+    return D, np.ascontiguousarray(F[0] if np.ndim(resultado) == 1 else F)
@@ -0,0 +1,188 @@
+"""
+Mapas de operação: o estado estacionário sobre planos 2-D de parâmetros.
+
+Dois planos:
+    - D x Sin: taxa de diluição x substrato na alimentação
+    - A x B: fração de reciclo x fator de concentração da biomassa
+      (E = 1 + A - A*B), para um D fixo
+
+A grade inteira (ex.: 2000 x 2000) é avaliada por broadcasting em uma
+única chamada de calcular_estado_estacionario (eixo x nas colunas, eixo y
+nas linhas). Para os modelos cinéticos sem forma fechada, cuja busca de
+raízes multiplica a memória, a grade é avaliada em faixas de linhas.
+
+Cada mapa traz as camadas Biomassa, Substrato, Produto e produtividades,
+a máscara da região de lavagem (X <= 0, onde a solução com crescimento
+deixa de existir) e a fronteira de lavagem (Dcritico) para sobrepor ao
+mapa. As camadas são float32: um mapa de 2000 x 2000 ocupa ~80 MB.
+"""
+import numpy as np
+
+from .cache import CacheResultados, memorizar
+from .cinetica import obter_cinetica
+from .modelo import calcular_estado_estacionario, fator_reciclo
+
+CAMADAS = ('Biomassa (g/L)', 'Substrato (g/L)', 'Produto (g/L)',
+           'Produtividade de biomassa (g/L.h)', 'Produtividade de produto (g/L.h)')
+
+# Pontos por faixa de linhas para os modelos resolvidos por busca de raízes
+PONTOS_POR_FAIXA = 50_000
+
+
+def _avaliar(D, Sin, E, u_max, Ks, Yx_s, Alfa, Beta, modalidade_associacao, cinetica,
+             parametros_cineticos, m_s, dtype):
+    """
+    Avalia o estado estacionário na grade (linhas x colunas) e monta as camadas.
+
+    D, Sin e E já vêm com formas compatíveis com a grade (ny, nx).
+    """
+    forma = np.broadcast_shapes(np.shape(D), np.shape(Sin), np.shape(E))
+    if cinetica == 'Monod':
+        faixas = [slice(None)]
+    else:
+        linhas = max(1, PONTOS_POR_FAIXA // max(forma[1], 1))
+        faixas = [slice(i, i + linhas) for i in range(0, forma[0], linhas)]
+
+    camadas = {nome: np.empty(forma, dtype=dtype) for nome in CAMADAS}
+    lavagem = np.empty(forma, dtype=bool)
+    for faixa in faixas:
+        D_f, Sin_f, E_f = (np.broadcast_to(v, forma)[faixa] if np.ndim(v) else v
+                           for v in (D, Sin, E))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            S, X, P = calcular_estado_estacionario(D_f, u_max, Ks, Sin_f, Yx_s, Alfa, Beta,
+                                                   modalidade_associacao, E_f, cinetica,
+                                                   parametros_cineticos, m_s)
+        # Sem crescimento possível (X <= 0) ou E <= 0 (sem sentido físico): lavagem
+        sem_crescimento = ~(X > 0) | (np.asarray(E_f) <= 0)
+        X = np.where(sem_crescimento, 0.0, X)
+        S = np.where(sem_crescimento, Sin_f, S)
+        P = np.where(sem_crescimento, 0.0, P)
+        # Produtividade de produto como taxa de formação (limite correto em D = 0)
+        if modalidade_associacao == 'Associado':
+            prod_P = D_f * P
+        elif modalidade_associacao == 'Semi Associado':
+            prod_P = X * (Alfa * D_f + Beta)
+        else:  # Não Associado
+            prod_P = Beta * X
+        for nome, valor in zip(CAMADAS, (X, S, P, D_f * X, prod_P)):
+            camadas[nome][faixa] = valor
+        lavagem[faixa] = sem_crescimento
+    return camadas, lavagem
+
+
+def _mu_alimentacao(u_max, Ks, Sin, cinetica, parametros_cineticos):
+    """mu na alimentação (S = Sin, sem biomassa): a taxa D*E de lavagem."""
+    modelo = obter_cinetica(cinetica)
+    return modelo.dcritico(u_max, Ks, Sin, 1.0, **modelo.completar(parametros_cineticos))
+
+
+def mapa_D_Sin(D_min, D_max, Sin_min, Sin_max, u_max, Ks, Yx_s, Alfa, Beta,
+               modalidade_associacao, n_D=2000, n_Sin=2000, E=1.0, cinetica='Monod',
+               parametros_cineticos=None, m_s=0.0, dtype=np.float32):
+    """
+    Mapa de operação no plano D x Sin.
+
+    Parâmetros:
+        D_min, D_max (float): Faixa de diluição (1/h), eixo x
+        Sin_min, Sin_max (float): Faixa de substrato na alimentação (g/L), eixo y
+        u_max, Ks, Yx_s, Alfa, Beta (float): Parâmetros do modelo
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        n_D, n_Sin (int): Resolução da grade em cada eixo
+        E (float): Fator de reciclo (adm); 1 no reator padrão
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (tuple | None): Pares (nome, valor) dos parâmetros extras
+        m_s (float): Coeficiente de manutenção (g/g.h)
+        dtype (type): Tipo das camadas (np.float32 ou np.float64)
+
+    Retorna:
+        dict: 'eixo_x' e 'eixo_y' (nome, valores), 'camadas' (nome -> array
+            (n_Sin, n_D)), 'lavagem' (máscara) e 'fronteira' (x, y): curva
+            Dcritico(Sin) = mu(Sin)/E
+    """
+    D = np.linspace(D_min, D_max, n_D)
+    Sin = np.linspace(Sin_min, Sin_max, n_Sin)
+    camadas, lavagem = _avaliar(D[None, :], Sin[:, None], E, u_max, Ks, Yx_s, Alfa, Beta,
+                                modalidade_associacao, cinetica, parametros_cineticos, m_s, dtype)
+    Dcritico = _mu_alimentacao(u_max, Ks, Sin, cinetica, parametros_cineticos) / E
+    return {
+        'eixo_x': ('Diluição (1/h)', D),
+        'eixo_y': ('Sin (g/L)', Sin),
+        'camadas': camadas,
+        'lavagem': lavagem,
+        'fronteira': (np.asarray(Dcritico, dtype=np.float64), Sin),
+    }
+
+
+def mapa_A_B(A_min, A_max, B_min, B_max, D, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+             modalidade_associacao, n_A=2000, n_B=2000, cinetica='Monod',
+             parametros_cineticos=None, m_s=0.0, dtype=np.float32):
+    """
+    Mapa de operação do reator com reciclo no plano A x B, para um D fixo.
+
+    Combinações com E = 1 + A - A*B <= 0 não têm sentido físico e entram
+    na máscara de lavagem.
+
+    Parâmetros:
+        A_min, A_max (float): Faixa da fração de reciclo (adm), eixo x
+        B_min, B_max (float): Faixa do fator de concentração (adm), eixo y
+        D (float): Taxa de diluição (1/h)
+        u_max, Ks, Sin, Yx_s, Alfa, Beta (float): Parâmetros do modelo
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        n_A, n_B (int): Resolução da grade em cada eixo
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (tuple | None): Pares (nome, valor) dos parâmetros extras
+        m_s (float): Coeficiente de manutenção (g/g.h)
+        dtype (type): Tipo das camadas (np.float32 ou np.float64)
+
+    Retorna:
+        dict: Como em mapa_D_Sin; a fronteira é a curva B(A) em que
+            D*E(A, B) = mu(Sin), ou seja, D = Dcritico
+    """
+    A = np.linspace(A_min, A_max, n_A)
+    B = np.linspace(B_min, B_max, n_B)
+    E = fator_reciclo(A[None, :], B[:, None])
+    camadas, lavagem = _avaliar(np.float64(D), Sin, E, u_max, Ks, Yx_s, Alfa, Beta,
+                                modalidade_associacao, cinetica, parametros_cineticos, m_s, dtype)
+    # D*(1 + A - A*B) = mu(Sin)  ->  B = (1 + A - mu(Sin)/D)/A
+    razao = _mu_alimentacao(u_max, Ks, Sin, cinetica, parametros_cineticos) / D if D > 0 else np.inf
+    with np.errstate(divide='ignore', invalid='ignore'):
+        B_fronteira = np.where(A > 0, (1 + A - razao) / A, np.nan)
+    return {
+        'eixo_x': ('Fração de reciclo A (adm)', A),
+        'eixo_y': ('Fator de concentração B (adm)', B),
+        'camadas': camadas,
+        'lavagem': lavagem,
+        'fronteira': (A, B_fronteira),
+    }
+
+
+def ler_mapa(mapa, x, y):
+    """
+    Valores de todas as camadas na célula mais próxima de (x, y).
+
+    Busca direta nos eixos uniformes, sem recalcular nada: serve de
+    cursor sobre um mapa já calculado (e em cache).
+
+    Parâmetros:
+        mapa (dict): Resultado de mapa_D_Sin ou mapa_A_B
+        x, y (float): Coordenadas nos eixos do mapa
+
+    Retorna:
+        dict: Coordenadas da célula, 'Lavagem' e o valor de cada camada
+    """
+    (nome_x, eixo_x), (nome_y, eixo_y) = mapa['eixo_x'], mapa['eixo_y']
+    i = int(np.clip(np.searchsorted(eixo_y, y), 1, len(eixo_y) - 1))
+    j = int(np.clip(np.searchsorted(eixo_x, x), 1, len(eixo_x) - 1))
+    i -= y - eixo_y[i - 1] < eixo_y[i] - y
+    j -= x - eixo_x[j - 1] < eixo_x[j] - x
+    valores = {nome_x: float(eixo_x[j]), nome_y: float(eixo_y[i]),
+               'Lavagem': bool(mapa['lavagem'][i, j])}
+    valores.update({nome: float(camada[i, j]) for nome, camada in mapa['camadas'].items()})
+    return valores
+
+
+# Mapas de operação: ~80 MB cada em 2000 x 2000, por isso poucas entradas
+cache_mapas = CacheResultados(max_entradas=4, ttl=3600, max_bytes=320 * 2**20)
+
+mapa_D_Sin_cache = memorizar(cache_mapas)(mapa_D_Sin)
+mapa_A_B_cache = memorizar(cache_mapas)(mapa_A_B)
@@ -0,0 +1,645 @@
+"""
+Modelos de estado estacionário do processo contínuo.
+
+Módulo de cálculo puro (depende apenas do NumPy): pode ser importado por
+scripts em lote, notebooks e workers sem iniciar o Streamlit.
+"""
+import numpy as np
+
+from .cache import CacheResultados, memorizar
+from .cinetica import obter_cinetica, produto_estacionario
+from .malha import malha_adaptativa
+from .resultado import ResultadoEstacionario, preguicoso
+
+
+def fator_reciclo(A, B):
+    """
+    Calcula o fator de reciclo E = 1 + A - A*B.
+
+    Parâmetros:
+        A (float): Fração de reciclo (adm)
+        B (float): Fator de concentração da biomassa (adm)
+
+    Retorna:
+        float: Fator de reciclo E (adm)
+    """
+    return 1 + A - A * B
+
+
+def dcritico_padrao(u_max, Ks, Sin):
+    """
+    Calcula a taxa de diluição crítica do reator padrão.
+
+    Parâmetros:
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação (g/L)
+        Sin (float): Concentração de substrato na entrada (g/L)
+
+    Retorna:
+        float: Dcritico (1/h)
+    """
+    return u_max * Sin / (Ks + Sin)
+
+
+def dcritico_reciclo(u_max, A, B):
+    """
+    Calcula a taxa de diluição crítica do reator com reciclo.
+
+    Parâmetros:
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        A (float): Fração de reciclo (adm)
+        B (float): Fator de concentração da biomassa (adm)
+
+    Retorna:
+        float: Dcritico (1/h)
+    """
+    return u_max / fator_reciclo(A, B)
+
+
+def rendimento_aparente(Dil, Yx_s, m_s, E=1.0):
+    """
+    Calcula o rendimento aparente de biomassa com manutenção (Pirt).
+
+    O consumo de substrato é rs = mu*X/Yx_s + m_s*X; no estado estacionário
+    mu = D*E, de modo que 1/Yap = 1/Yx_s + m_s/(D*E). Em D = 0 todo o
+    substrato vai para a manutenção (Yap = 0); sem manutenção (m_s = 0),
+    Yap = Yx_s em qualquer D, inclusive D = 0.
+
+    Parâmetros:
+        Dil (float | array): Taxas de diluição (1/h)
+        Yx_s (float | array): Rendimento verdadeiro de biomassa (g/g)
+        m_s (float | array): Coeficiente de manutenção (g/g.h)
+        E (float | array): Fator de reciclo (adm)
+
+    Retorna:
+        array: Rendimento aparente Yap (g/g)
+    """
+    mu = np.asarray(Dil, dtype=np.float64) * E
+    denominador = mu + m_s * Yx_s
+    forma = np.broadcast_shapes(np.shape(mu), np.shape(Yx_s), np.shape(m_s))
+    # Valor onde o denominador se anula (D = 0): 0 com manutenção, Yx_s sem
+    limite = np.array(np.broadcast_to(np.where(np.asarray(m_s) > 0, 0.0, Yx_s), forma),
+                      dtype=np.float64)
+    return np.divide(Yx_s * mu, denominador, out=limite, where=denominador > 0)
+
+
+def dcritico_cinetica(cinetica, u_max, Ks, Sin, E=1.0, parametros_cineticos=None):
+    """
+    Calcula a taxa de diluição de lavagem para qualquer modelo cinético
+    registrado: D em que mu(Sin) = D*E.
+
+    Parâmetros:
+        cinetica (str): Nome do modelo cinético (ver cinetica.CINETICAS)
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação
+        Sin (float): Concentração de substrato na entrada (g/L)
+        E (float): Fator de reciclo (adm)
+        parametros_cineticos (dict | tuple | None): Parâmetros extras do modelo
+
+    Retorna:
+        float: Dcritico (1/h)
+    """
+    modelo = obter_cinetica(cinetica)
+    return modelo.dcritico(u_max, Ks, Sin, E, **modelo.completar(parametros_cineticos))
+
+
+def _malha_diluicao(avaliar, Dil_min, Dil_max, step, tolerancia, max_pontos, Dlavagem):
+    """
+    Monta a malha uniforme (step) ou, se houver tolerância, a malha adaptativa.
+
+    Parâmetros:
+        avaliar (callable): Recebe o array de D e devolve as curvas empilhadas (k, n)
+        Dlavagem (float): D da quina da lavagem, nó da malha adaptativa
+
+    Na malha adaptativa nenhum intervalo fica mais estreito que
+    step*tolerancia: o refinamento não vai além da resolução pedida.
+
+    Retorna:
+        tuple: Malha D e função sem argumentos que devolve as curvas (k, n);
+            na malha uniforme as curvas só são calculadas quando pedidas
+    """
+    if tolerancia is None:
+        Dil = np.arange(Dil_min, Dil_max, step)
+        return Dil, preguicoso(lambda: avaliar(Dil))
+    Dil, curvas = malha_adaptativa(avaliar, Dil_min, Dil_max, tolerancia, max_pontos,
+                                   largura_minima=step * tolerancia, nos=[Dlavagem])
+    return Dil, lambda: curvas
+
+
+def estados_estacionarios(Dil, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E=1.0,
+                          cinetica='Monod', parametros_cineticos=None, m_s=0.0):
+    """
+    Calcula todos os estados estacionários com biomassa (X > 0) para cada D.
+
+    Modelos como Haldane têm dois estados estacionários para o mesmo D
+    (o de maior S é instável); aqui todos são devolvidos, ao longo do
+    último eixo, em ordem crescente de S.
+
+    Parâmetros: os mesmos de calcular_estado_estacionario.
+
+    Retorna:
+        tuple: Arrays (S, X, P) com forma (*forma, k); NaN onde há menos
+            de k estados estacionários (lavagem: nenhum)
+    """
+    D = np.asarray(Dil, dtype=np.float64)
+    modelo = obter_cinetica(cinetica)
+    extras = modelo.completar(parametros_cineticos)
+    Yx_s, Alfa = com_manutencao(D, Yx_s, Alfa, modalidade_associacao, E, m_s)
+    forma = np.broadcast_shapes(D.shape, np.shape(u_max), np.shape(Ks), np.shape(Sin),
+                                np.shape(Yx_s), np.shape(Alfa), np.shape(Beta), np.shape(E))
+
+    produto = None
+    if modelo.usa_P:
+        c = lambda v: np.broadcast_to(v, forma)[..., None]  # noqa: E731
+        D_, Sin_, Alfa_, Beta_ = map(c, (D, Sin, Alfa, Beta))
+        produto = lambda S, X: produto_estacionario(  # noqa: E731
+            S, X, D_, Sin_, Alfa_, Beta_, modalidade_associacao)
+
+    S = modelo.substrato_estacionario(np.broadcast_to(D * E, forma), Sin, Yx_s, E, u_max, Ks,
+                                      produto, **extras)
+    expandir = lambda v: np.asarray(v)[..., None] if np.ndim(v) else v  # noqa: E731
+    X = expandir(Yx_s) * (expandir(Sin) - S) / expandir(E)
+    P = produto_estacionario(S, X, expandir(D), expandir(Sin), expandir(Alfa), expandir(Beta),
+                             modalidade_associacao)
+    return S, X, P
+
+
+def com_manutencao(D, Yx_s, Alfa, modalidade_associacao, E, m_s):
+    """
+    Troca Yx_s pelo rendimento aparente quando há manutenção.
+
+    Com mu = D*E o balanço de substrato fica X = Yap*(Sin - S)/E, a mesma
+    forma do modelo sem manutenção. No caso associado o produto segue o
+    crescimento (rp = Alfa*mu*X/Yx_s), então Alfa é escalado por Yap/Yx_s.
+    Usado pelos modelos de estado estacionário e pela continuação.
+
+    Parâmetros:
+        D (float | array): Taxas de diluição (1/h)
+        Yx_s (float | array): Rendimento verdadeiro de biomassa (g/g)
+        Alfa (float | array): Coeficiente de associação
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float | array): Fator de reciclo (adm)
+        m_s (float | array): Coeficiente de manutenção (g/g.h); 0 não altera nada
+
+    Retorna:
+        tuple: (Yx_s, Alfa) efetivos
+    """
+    if not np.any(m_s):
+        return Yx_s, Alfa
+    Yap = rendimento_aparente(D, Yx_s, m_s, E)
+    if modalidade_associacao == 'Associado':
+        Alfa = Alfa * Yap / Yx_s
+    return Yap, Alfa
+
+
+def _estado_estacionario_cinetica(D, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E,
+                                  cinetica, parametros_cineticos, m_s):
+    """Estado estacionário de maior conversão (menor S) para um modelo do registro."""
+    S, X, P = estados_estacionarios(D, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E,
+                                    cinetica, parametros_cineticos, m_s)
+    Yx_s, Alfa = com_manutencao(D, Yx_s, Alfa, modalidade_associacao, E, m_s)
+    # Primeira raiz válida; sem raiz em [0, Sin) o reator está em lavagem
+    S = np.fmin.reduce(S, axis=-1)
+    lavagem = np.isnan(S)
+    S = np.where(lavagem, np.broadcast_to(Sin, S.shape), S)
+    X = np.where(lavagem, 0.0, Yx_s * (Sin - S) / E)
+    P = np.where(lavagem, 0.0, produto_estacionario(S, X, D, Sin, Alfa, Beta, modalidade_associacao))
+    return S, X, P
+
+
+def calcular_estado_estacionario(Dil, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E=1.0,
+                                 cinetica='Monod', parametros_cineticos=None, m_s=0.0):
+    """
+    Calcula substrato, biomassa e produto no estado estacionário para toda
+    a malha de diluição de uma só vez (operações vetorizadas do NumPy).
+
+    O reator padrão corresponde a E = 1; para o reator com reciclo,
+    E = 1 + A - A*B. Os parâmetros podem ser escalares ou arrays
+    compatíveis por broadcasting com Dil, o que permite avaliar vários
+    conjuntos de parâmetros em uma única passada.
+
+    Singularidades tratadas por máscaras:
+        - u_max - D*E <= 0, ou S >= Sin (D acima de Dcritico): a expressão
+          de Monod não tem solução com biomassa, então o ponto é reportado
+          como lavagem (S = Sin, X = 0, P = 0).
+        - D = 0: o termo Beta/D não é definido e é zerado.
+
+    Com manutenção (m_s > 0, modelo de Pirt) o substrato não muda, pois
+    mu = D*E continua valendo; a biomassa usa o rendimento aparente
+    (ver rendimento_aparente) e cai a zero quando D -> 0.
+
+    Parâmetros:
+        Dil (array): Taxas de diluição (1/h)
+        u_max (float | array): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação (g/L)
+        Sin (float): Concentração de substrato na entrada (g/L)
+        Yx_s (float): Rendimento de biomassa por substrato (g/g)
+        Alfa (float): Coeficiente de associação
+        Beta (float): Coeficiente de não associação
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float): Fator de reciclo (adm)
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS); Monod é
+            calculado aqui mesmo, os demais pelo solver do registro, que
+            devolve o estado estacionário de menor S
+        parametros_cineticos (dict | tuple | None): Parâmetros extras do modelo
+        m_s (float | array): Coeficiente de manutenção (g/g.h); 0 desliga
+
+    Retorna:
+        tuple: Arrays contíguos (S, X, P)
+    """
+    D = np.asarray(Dil, dtype=np.float64)
+    if cinetica != 'Monod':
+        return _estado_estacionario_cinetica(D, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,
+                                             E, cinetica, parametros_cineticos, m_s)
+    Yx_s, Alfa = com_manutencao(D, Yx_s, Alfa, modalidade_associacao, E, m_s)
+    DE = D * E
+    denominador = u_max - DE
+    forma = np.broadcast_shapes(denominador.shape, np.shape(Ks), np.shape(Sin),
+                                np.shape(Yx_s))
+
+    # Máscara da lavagem: evita divisão por zero quando D*E -> u_max
+    lavagem = denominador <= 0
+    S = np.divide(Ks * DE, denominador,
+                  out=np.array(np.broadcast_to(Sin, forma), dtype=np.float64),
+                  where=~lavagem)
+    # Entre Dcritico e u_max/E a raiz passa de Sin (X < 0): também é lavagem,
+    # a mesma regra de _substrato_estagio e de cinetica.Monod
+    lavagem = lavagem | (S >= Sin)
+    S = np.where(lavagem, Sin, S)
+    X = np.where(lavagem, 0.0, Yx_s * (Sin - S) / E)
+
+    if modalidade_associacao == 'Associado':
+        P = Alfa * (Sin - S)
+    else:
+        # Máscara de D = 0: evita inf no termo não associado
+        beta_d = np.divide(Beta, D, out=np.zeros(np.broadcast_shapes(np.shape(Beta), D.shape)),
+                           where=D != 0)
+        if modalidade_associacao == 'Semi Associado':
+            P = X * (Alfa + beta_d)
+        else:  # Não Associado
+            P = X * beta_d
+
+    return S, X, P
+
+
+def calcular_dados_padrao(Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step,
+                          tolerancia=None, max_pontos=2000, dtype=np.float64, cinetica='Monod',
+                          parametros_cineticos=None, m_s=0.0):
+    """
+    Calcula os valores de diluição, biomassa, substrato e produto
+    para diferentes modalidades de associação em um reator contínuo.
+
+    Parâmetros:
+        Dil_min (float): Diluição mínima (1/h)
+        Dil_max (float): Diluição máxima (1/h)
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação (g/L)
+        Sin (float): Concentração de substrato na entrada (g/L)
+        Yx_s (float): Rendimento de biomassa por substrato (g/g)
+        Alfa (float): Coeficiente de associação
+        Beta (float): Coeficiente de não associação
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        step (float): Variação de D na malha uniforme (1/h)
+        tolerancia (float | None): Se informada, usa a malha adaptativa com
+            este erro relativo de interpolação em vez da malha uniforme
+        max_pontos (int): Número máximo de pontos da malha adaptativa
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (tuple | None): Pares (nome, valor) dos
+            parâmetros extras do modelo (tupla para servir de chave do cache)
+        m_s (float): Coeficiente de manutenção (g/g.h); 0 desliga
+
+    Retorna:
+        ResultadoEstacionario: Colunas de Diluição, Biomassa, Substrato e
+            Produto; com manutenção, também o Rendimento aparente
+    """
+
+    # Cálculo de D crítico
+    if cinetica == 'Monod':
+        Dcritico = dcritico_padrao(u_max, Ks, Sin)
+    else:
+        Dcritico = dcritico_cinetica(cinetica, u_max, Ks, Sin, 1.0, parametros_cineticos)
+
+    # Intervalo de diluição
+    Dil, curvas = _malha_diluicao(
+        lambda D: np.vstack(calcular_estado_estacionario(
+            D, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,
+            cinetica=cinetica, parametros_cineticos=parametros_cineticos, m_s=m_s)),
+        Dil_min, Dil_max, step, tolerancia, max_pontos, Dcritico)
+
+    colunas = {
+        'Diluição (1/h)': Dil,
+        'Biomassa (g/L)': lambda: curvas()[1],
+        'Substrato (g/L)': lambda: curvas()[0],
+        'Produto (g/L)': lambda: curvas()[2],
+    }
+    if m_s:
+        colunas['Rendimento aparente (g/g)'] = lambda: rendimento_aparente(Dil, Yx_s, m_s)
+    dados = ResultadoEstacionario(colunas, dtype)
+
+    return dados, Dcritico
+
+
+def calcular_dados_reciclo(A,B,Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,step,
+                           tolerancia=None, max_pontos=2000, dtype=np.float64, cinetica='Monod',
+                           parametros_cineticos=None, m_s=0.0):
+    """
+    Calcula os valores de diluição, biomassa, substrato e produto
+    para diferentes modalidades de associação em um reator contínuo.
+
+    Parâmetros:
+        A (float): Fração de reciclo (adm)
+        B (float): Fator de concentração da biomassa (adm)
+        Dil_min (float): Diluição mínima (1/h)
+        Dil_max (float): Diluição máxima (1/h)
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação (g/L)
+        Sin (float): Concentração de substrato na entrada (g/L)
+        Yx_s (float): Rendimento de biomassa por substrato (g/g)
+        Alfa (float): Coeficiente de associação
+        Beta (float): Coeficiente de não associação
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        step (float): Variação de D na malha uniforme (1/h)
+        tolerancia (float | None): Se informada, usa a malha adaptativa com
+            este erro relativo de interpolação em vez da malha uniforme
+        max_pontos (int): Número máximo de pontos da malha adaptativa
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (tuple | None): Pares (nome, valor) dos
+            parâmetros extras do modelo (tupla para servir de chave do cache)
+        m_s (float): Coeficiente de manutenção (g/g.h); 0 desliga
+
+    Retorna:
+        ResultadoEstacionario: Colunas de Diluição, Biomassa, Substrato e
+            Produto; com manutenção, também o Rendimento aparente
+    """
+    
+    # Cálculo da fração de reciclo
+    E = fator_reciclo(A, B)
+    # Cálculo de D crítico; a lavagem começa onde mu(Sin) = D*E, que no
+    # Monod fica abaixo de u_max/E
+    Dlavagem = dcritico_cinetica(cinetica, u_max, Ks, Sin, E, parametros_cineticos)
+    Dcritico = u_max / E if cinetica == 'Monod' else Dlavagem
+
+    # Intervalo de diluição
+    Dil, curvas = _malha_diluicao(
+        lambda D: np.vstack(calcular_estado_estacionario(
+            D, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E,
+            cinetica, parametros_cineticos, m_s)),
+        Dil_min, Dil_max, step, tolerancia, max_pontos, Dlavagem)
+
+    colunas = {
+        'Diluição (1/h)': Dil,
+        'Biomassa (g/L)': lambda: curvas()[1],
+        'Substrato (g/L)': lambda: curvas()[0],
+        'Produto (g/L)': lambda: curvas()[2],
+    }
+    if m_s:
+        colunas['Rendimento aparente (g/g)'] = lambda: rendimento_aparente(Dil, Yx_s, m_s, E)
+    dados = ResultadoEstacionario(colunas, dtype)
+
+    return dados, Dcritico
+
+
+def _preparar_estagios(volumes, vazoes_extras, Sin_extras):
+    """Normaliza as listas por estágio da cascata em arrays 1-D de mesmo tamanho."""
+    volumes = np.atleast_1d(np.asarray(volumes, dtype=np.float64))
+    n = len(volumes)
+    if n < 1 or np.any(volumes <= 0):
+        raise ValueError("volumes deve conter ao menos um estágio com volume positivo")
+    extras = np.zeros(n) if vazoes_extras is None else \
+        np.broadcast_to(np.asarray(vazoes_extras, dtype=np.float64), (n,))
+    Sin_extras = np.zeros(n) if Sin_extras is None else \
+        np.broadcast_to(np.asarray(Sin_extras, dtype=np.float64), (n,))
+    if np.any(extras < 0):
+        raise ValueError("vazoes_extras não pode ser negativa")
+    return volumes / volumes[0], extras, Sin_extras
+
+
+def _substrato_estagio(D, u_max, Ks, Yx_s, Sf, Xf):
+    """
+    Resolve o substrato de um estágio com alimentação (Sf, Xf) e diluição D.
+
+    Combinando os balanços X = Xf + Yx_s*(Sf - S) e D*(X - Xf) = mu*X com
+    Monod chega-se a a*S² + b*S + c = 0. Escolhe-se a menor raiz em
+    [0, Sf]; sem raiz válida o estágio está em lavagem (S = Sf).
+    """
+    T = Xf + Yx_s * Sf
+    a = Yx_s * (D - u_max)
+    b = u_max * T - D * Yx_s * (Sf - Ks)
+    c = -D * Yx_s * Ks * Sf
+
+    # Fórmula estável para as raízes (evita cancelamento)
+    delta = np.sqrt(np.maximum(b * b - 4 * a * c, 0.0))
+    q = -0.5 * (b + np.where(b >= 0, delta, -delta))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r1 = np.where(a != 0, q / a, -c / b)
+        r2 = np.where(q != 0, c / q, np.inf)
+    tolerancia = 1e-12 * np.maximum(Sf, 1.0)
+    validas = [np.where((r >= -tolerancia) & (r <= Sf + tolerancia), r, np.inf) for r in (r1, r2)]
+    S = np.minimum(*validas)
+    return np.clip(np.where(np.isfinite(S), S, Sf), 0.0, Sf)
+
+
+def _produto_estagio(X, Di, Xf, Pf, Yx_s, Alfa, Beta, modalidade_associacao):
+    """
+    Produto na saída de um estágio pelo balanço de produto.
+
+    A parcela associada ao crescimento vem do balanço de biomassa
+    (mu*X/D = X - Xf) e é definida também em D = 0; o termo Beta/D é
+    zerado em D = 0, como em calcular_estado_estacionario, de modo que um
+    único estágio reproduz o quimiostato padrão em toda a malha.
+    """
+    if modalidade_associacao == 'Associado':
+        return Pf + Alfa * (X - Xf) / Yx_s
+    Di = np.asarray(Di)
+    beta_x_d = np.divide(Beta * X, Di, out=np.zeros(np.broadcast_shapes(np.shape(X), Di.shape)),
+                         where=Di != 0)
+    if modalidade_associacao == 'Semi Associado':
+        return Pf + Alfa * (X - Xf) + beta_x_d
+    return Pf + beta_x_d  # Não Associado
+
+
+def _estagio_cinetica(modelo, extras, Di, u_max, Ks, Yx_s, Alfa, Beta, modalidade_associacao,
+                      Sf, Xf, Pf):
+    """
+    Resolve um estágio da cascata com um modelo cinético qualquer.
+
+    O produto do estágio entra em mu (inibição) por uma função de S e X
+    obtida do balanço de produto. Fica a menor raiz S em [0, Sf); sem
+    raiz o estágio está em lavagem (S = Sf).
+
+    Retorna:
+        tuple: Arrays (S, X, P) do estágio
+    """
+    # Eixo extra das raízes candidatas (ver raizes_intervalo)
+    Di_ = np.asarray(Di)[..., None]
+    Xf_ = np.asarray(Xf)[..., None]
+    Pf_ = np.asarray(Pf)[..., None]
+
+    def produto(S, X):
+        return _produto_estagio(X, Di_, Xf_, Pf_, Yx_s, Alfa, Beta, modalidade_associacao)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        raizes = modelo.substrato_estagio(Di, Sf, Xf, Yx_s, u_max, Ks, produto, **extras)
+    Si = np.clip(np.where(np.isnan(raizes[..., 0]), Sf, raizes[..., 0]), 0.0, Sf)
+    Xi = Xf + Yx_s * (Sf - Si)
+    return Si, Xi, _produto_estagio(Xi, Di, Xf, Pf, Yx_s, Alfa, Beta, modalidade_associacao)
+
+
+def calcular_serie(Dil, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,
+                   volumes, vazoes_extras=None, Sin_extras=None, cinetica='Monod',
+                   parametros_cineticos=None):
+    """
+    Calcula o estado estacionário de N reatores em série (cascata de CSTRs).
+
+    A taxa de diluição D refere-se ao primeiro reator (D = F/V1). Cada
+    estágio i pode receber uma alimentação extra estéril de vazão
+    vazoes_extras[i]*F com substrato Sin_extras[i]. Os estágios são
+    resolvidos um a um em forma fechada (raiz da quadrática de Monod) ou,
+    para os demais modelos cinéticos, pela busca de raízes em lote de
+    cinetica.py; cada estágio é vetorizado sobre toda a malha de D.
+
+    Parâmetros:
+        Dil (array): Taxas de diluição do primeiro reator (1/h)
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação (g/L)
+        Sin (float): Concentração de substrato na alimentação principal (g/L)
+        Yx_s (float): Rendimento de biomassa por substrato (g/g)
+        Alfa (float): Coeficiente de associação
+        Beta (float): Coeficiente de não associação
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        volumes (array): Volumes dos estágios (apenas a proporção importa)
+        vazoes_extras (array | None): Vazão extra de cada estágio, em frações de F
+        Sin_extras (array | None): Substrato das alimentações extras (g/L)
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (dict | tuple | None): Parâmetros extras do modelo
+
+    Retorna:
+        tuple: Arrays (S, X, P) com forma (N estágios, len(Dil))
+    """
+    D = np.asarray(Dil, dtype=np.float64)
+    volumes, extras, Sin_extras = _preparar_estagios(volumes, vazoes_extras, Sin_extras)
+    n = len(volumes)
+    modelo = None if cinetica == 'Monod' else obter_cinetica(cinetica)
+    extras_cineticos = {} if modelo is None else modelo.completar(parametros_cineticos)
+
+    S = np.empty((n,) + D.shape)
+    X = np.empty_like(S)
+    P = np.empty_like(S)
+
+    # Corrente que chega ao estágio: começa pela alimentação principal
+    # (vazão em frações de F, substrato Sin, sem biomassa nem produto)
+    vazao, S_ant, X_ant, P_ant = 1.0, Sin, 0.0, 0.0
+    for i in range(n):
+        vazao_nova = vazao + extras[i]
+        Sf = (vazao * S_ant + extras[i] * Sin_extras[i]) / vazao_nova
+        Xf = vazao * X_ant / vazao_nova
+        Pf = vazao * P_ant / vazao_nova
+        Di = D * vazao_nova / volumes[i]
+
+        if modelo is None:
+            Si = _substrato_estagio(Di, u_max, Ks, Yx_s, Sf, Xf)
+            Xi = Xf + Yx_s * (Sf - Si)
+            Pi = _produto_estagio(Xi, Di, Xf, Pf, Yx_s, Alfa, Beta, modalidade_associacao)
+        else:
+            Si, Xi, Pi = _estagio_cinetica(modelo, extras_cineticos, Di, u_max, Ks, Yx_s,
+                                           Alfa, Beta, modalidade_associacao, Sf, Xf, Pf)
+
+        S[i], X[i], P[i] = Si, Xi, Pi
+        vazao, S_ant, X_ant, P_ant = vazao_nova, Si, Xi, Pi
+
+    return S, X, P
+
+
+def dcritico_serie(u_max, Ks, Sin, vazoes_extras=None, Sin_extras=None, cinetica='Monod',
+                   parametros_cineticos=None):
+    """
+    Calcula a taxa de diluição (D = F/V1) em que o primeiro reator lava.
+
+    Parâmetros:
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação (g/L)
+        Sin (float): Concentração de substrato na alimentação principal (g/L)
+        vazoes_extras (array | None): Vazão extra de cada estágio, em frações de F
+        Sin_extras (array | None): Substrato das alimentações extras (g/L)
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (dict | tuple | None): Parâmetros extras do modelo
+
+    Retorna:
+        float: Dcritico (1/h)
+    """
+    f1 = 0.0 if vazoes_extras is None else float(np.atleast_1d(vazoes_extras)[0])
+    s1 = 0.0 if Sin_extras is None else float(np.atleast_1d(Sin_extras)[0])
+    Sf = (Sin + f1 * s1) / (1 + f1)
+    if cinetica != 'Monod':
+        return dcritico_cinetica(cinetica, u_max, Ks, Sf, 1.0, parametros_cineticos) / (1 + f1)
+    return u_max * Sf / (Ks + Sf) / (1 + f1)
+
+
+def calcular_dados_serie(Dil_min, Dil_max, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,
+                         step, volumes, vazoes_extras=None, Sin_extras=None, tolerancia=None,
+                         max_pontos=2000, dtype=np.float64, cinetica='Monod',
+                         parametros_cineticos=None):
+    """
+    Calcula os valores de diluição, biomassa, substrato e produto
+    na saída de uma cascata de reatores em série.
+
+    Parâmetros:
+        Dil_min (float): Diluição mínima do primeiro reator (1/h)
+        Dil_max (float): Diluição máxima do primeiro reator (1/h)
+        u_max (float): Velocidade máxima específica de crescimento (1/h)
+        Ks (float): Constante de saturação (g/L)
+        Sin (float): Concentração de substrato na entrada (g/L)
+        Yx_s (float): Rendimento de biomassa por substrato (g/g)
+        Alfa (float): Coeficiente de associação
+        Beta (float): Coeficiente de não associação
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        step (float): Variação de D na malha uniforme (1/h)
+        volumes (tuple): Volumes dos estágios (apenas a proporção importa)
+        vazoes_extras (tuple | None): Vazão extra de cada estágio, em frações de F
+        Sin_extras (tuple | None): Substrato das alimentações extras (g/L)
+        tolerancia (float | None): Se informada, usa a malha adaptativa com
+            este erro relativo de interpolação em vez da malha uniforme
+        max_pontos (int): Número máximo de pontos da malha adaptativa
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+        cinetica (str): Modelo cinético (ver cinetica.CINETICAS)
+        parametros_cineticos (tuple | None): Pares (nome, valor) dos
+            parâmetros extras do modelo
+
+    Retorna:
+        ResultadoEstacionario: Colunas de Diluição e, para a saída da
+            cascata e para cada estágio, Biomassa, Substrato e Produto
+    """
+    Dcritico = dcritico_serie(u_max, Ks, Sin, vazoes_extras, Sin_extras, cinetica,
+                              parametros_cineticos)
+    Dil, curvas = _malha_diluicao(
+        lambda D: np.vstack(calcular_serie(D, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,
+                                           volumes, vazoes_extras, Sin_extras, cinetica,
+                                           parametros_cineticos)),
+        Dil_min, Dil_max, step, tolerancia, max_pontos, Dcritico)
+    # Linhas das curvas empilhadas: S dos N estágios, depois X, depois P
+    n = len(_preparar_estagios(volumes, vazoes_extras, Sin_extras)[0])
+    colunas = {
+        'Diluição (1/h)': Dil,
+        'Biomassa (g/L)': lambda: curvas()[2 * n - 1],
+        'Substrato (g/L)': lambda: curvas()[n - 1],
+        'Produto (g/L)': lambda: curvas()[3 * n - 1],
+    }
+    if n > 1:
+        for i in range(n):
+            colunas[f'Biomassa estágio {i + 1} (g/L)'] = lambda i=i: curvas()[n + i]
+            colunas[f'Substrato estágio {i + 1} (g/L)'] = lambda i=i: curvas()[i]
+            colunas[f'Produto estágio {i + 1} (g/L)'] = lambda i=i: curvas()[2 * n + i]
+    dados = ResultadoEstacionario(colunas, dtype)
+
+    return dados, Dcritico
+
+
+# Cache compartilhado pelo processo para as curvas de estado estacionário;
+# em passo 1e-6 uma curva passa de 10 MB, daí o orçamento em bytes
+cache_estacionario = CacheResultados(max_entradas=256, ttl=3600, max_bytes=256 * 2**20)
+
+calcular_dados_padrao_cache = memorizar(cache_estacionario)(calcular_dados_padrao)
+calcular_dados_reciclo_cache = memorizar(cache_estacionario)(calcular_dados_reciclo)
+calcular_dados_serie_cache = memorizar(cache_estacionario)(calcular_dados_serie)
@@ -0,0 +1,104 @@
+"""
+Produtividade volumétrica e taxa de diluição ótima.
+
+Produtividades de biomassa (D*X) e de produto (D*P) para os reatores
+padrão (E = 1) e com reciclo (E = 1 + A - A*B). O D que maximiza a
+produtividade é obtido em forma fechada, de modo que tabelas de operação
+ótima para milhares de conjuntos de parâmetros saem em uma única chamada
+vetorizada.
+"""
+import numpy as np
+
+from .modelo import calcular_estado_estacionario, rendimento_aparente
+
+
+def calcular_produtividade(Dil, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E=1.0,
+                           m_s=0.0):
+    """
+    Calcula as produtividades volumétricas de biomassa e de produto.
+
+    A produtividade de produto é calculada diretamente como taxa de
+    formação (X*(Alfa*D + Beta) no caso semi associado, Beta*X no não
+    associado), o que dá o limite correto em D = 0.
+
+    Parâmetros:
+        Dil (array): Taxas de diluição (1/h)
+        u_max, Ks, Sin, Yx_s, Alfa, Beta (float | array): Parâmetros do modelo
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float | array): Fator de reciclo (adm)
+        m_s (float | array): Coeficiente de manutenção (g/g.h); d_otimo
+            ignora a manutenção, cuja produtividade ótima não tem forma fechada
+
+    Retorna:
+        tuple: Arrays (D*X, D*P) em g/(L.h)
+    """
+    D = np.asarray(Dil, dtype=np.float64)
+    S, X, _ = calcular_estado_estacionario(D, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                                           modalidade_associacao, E, m_s=m_s)
+    prod_X = D * X
+    if modalidade_associacao == 'Associado':
+        prod_P = Alfa * D * (Sin - S)
+        if np.any(m_s):
+            # Só o substrato convertido em biomassa gera produto associado
+            prod_P = prod_P * rendimento_aparente(D, Yx_s, m_s, E) / Yx_s
+    elif modalidade_associacao == 'Semi Associado':
+        prod_P = X * (Alfa * D + Beta)
+    else:  # Não Associado
+        prod_P = Beta * X
+    return prod_X, prod_P
+
+
+def d_otimo(u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E=1.0, alvo='Produto'):
+    """
+    Calcula o D que maximiza a produtividade, em forma fechada.
+
+    Com z = D*E, a produtividade é proporcional a (Sin - S(z))*(Alfa*z/E + Beta),
+    com S(z) = Ks*z/(u_max - z). Igualando a derivada a zero:
+
+        z* = u_max - sqrt(Ks*u_max*(u_max + Beta*E/Alfa) / (Ks + Sin))
+
+    Beta = 0 recupera o caso associado e a produtividade de biomassa
+    (z* = u_max*(1 - sqrt(Ks/(Ks + Sin)))). Se z* <= 0 (ex.: produto não
+    associado) o máximo fica na fronteira D = 0. Com E <= 0 (o reciclo
+    devolve mais biomassa do que sai) não há estado estacionário e o
+    resultado é NaN; com E -> 0+ o ótimo D = z*/E cresce sem limite.
+
+    Todos os parâmetros aceitam arrays (um valor por conjunto de parâmetros).
+
+    Parâmetros:
+        u_max, Ks, Sin, Yx_s, Alfa, Beta (float | array): Parâmetros do modelo
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        E (float | array): Fator de reciclo (adm)
+        alvo (str): 'Produto' (D*P) ou 'Biomassa' (D*X)
+
+    Retorna:
+        dict: D ótimo, produtividade máxima e Biomassa, Substrato e Produto no ótimo
+    """
+    u_max, Ks, Sin, Yx_s, Alfa, Beta, E = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (u_max, Ks, Sin, Yx_s, Alfa, Beta, E)))
+
+    if alvo == 'Biomassa' or modalidade_associacao == 'Associado':
+        razao = np.zeros_like(u_max)
+    elif modalidade_associacao == 'Semi Associado':
+        razao = np.divide(Beta * E, Alfa, out=np.full_like(u_max, np.inf), where=Alfa > 0)
+    else:  # Não Associado: produtividade = Beta*X, máxima em D = 0
+        razao = np.full_like(u_max, np.inf)
+
+    with np.errstate(invalid='ignore'):
+        z = u_max - np.sqrt(Ks * u_max * (u_max + razao) / (Ks + Sin))
+    z = np.where(np.isfinite(z) & (z > 0), z, 0.0)
+    with np.errstate(divide='ignore', over='ignore'):
+        D = np.divide(z, E, out=np.full_like(z, np.nan), where=E > 0)
+    D[~np.isfinite(D)] = np.nan
+
+    prod_X, prod_P = calcular_produtividade(D, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                                            modalidade_associacao, E)
+    S, X, P = calcular_estado_estacionario(D, u_max, Ks, Sin, Yx_s, Alfa, Beta,
+                                           modalidade_associacao, E)
+    return {
+        'D ótimo (1/h)': D,
+        'Produtividade máxima (g/L.h)': prod_X if alvo == 'Biomassa' else prod_P,
+        'Biomassa (g/L)': X,
+        'Substrato (g/L)': S,
+        'Produto (g/L)': P,
+    }
@@ -0,0 +1,87 @@
+"""
+Redução de pontos para exibição (Largest-Triangle-Three-Buckets).
+
+Com passos de D muito finos as curvas têm muito mais pontos do que a tela
+consegue mostrar. O LTTB divide a curva em baldes e, em cada balde,
+mantém o ponto que forma o maior triângulo com o ponto escolhido no balde
+anterior e a média do balde seguinte: picos e a região íngreme logo abaixo
+do Dcritico são preservados, enquanto trechos planos perdem pontos.
+
+Várias curvas sobre o mesmo eixo (X, S e P, ou vários cenários) são
+reduzidas juntas: a área de cada triângulo é somada sobre as curvas,
+normalizadas pela sua amplitude, de modo que todas compartilham os mesmos
+índices. A redução só afeta a exibição; os dados completos continuam
+disponíveis para a tabela e a exportação.
+"""
+import numpy as np
+
+# Orçamento padrão de pontos por gráfico (~ largura em pixels)
+MAX_PONTOS = 2000
+
+
+def lttb(x, y, max_pontos=MAX_PONTOS):
+    """
+    Escolhe os índices dos pontos mantidos pelo LTTB.
+
+    O primeiro e o último ponto são sempre mantidos. O custo é O(n) no
+    número de pontos da curva e o laço em Python percorre apenas os
+    max_pontos baldes, de modo que o tempo de renderização fica limitado
+    pelo orçamento e não pelo passo de D.
+
+    Parâmetros:
+        x (array): Abscissas crescentes, forma (n,)
+        y (array): Ordenadas, forma (n,) ou (k, n) para k curvas
+        max_pontos (int): Número máximo de pontos mantidos (>= 3)
+
+    Retorna:
+        array: Índices crescentes dos pontos mantidos
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    if max_pontos < 3:
+        raise ValueError("max_pontos deve ser >= 3")
+    if n <= max_pontos:
+        return np.arange(n)
+
+    Y = np.atleast_2d(np.asarray(y, dtype=np.float64))
+    # Normaliza cada curva pela amplitude para que todas pesem igual
+    escala = np.ptp(Y, axis=1, keepdims=True)
+    escala[~np.isfinite(escala) | (escala == 0)] = 1.0
+    Y = np.nan_to_num(Y / escala)
+
+    # Limites dos baldes internos (primeiro e último pontos ficam de fora)
+    limites = np.floor(np.linspace(1, n - 1, max_pontos - 1)).astype(np.intp)
+    # Média de cada balde, usada como terceiro vértice do balde anterior
+    media_x = np.add.reduceat(x[1:n - 1], limites[:-1] - 1) / np.diff(limites)
+    media_Y = np.add.reduceat(Y[:, 1:n - 1], limites[:-1] - 1, axis=1) / np.diff(limites)
+    media_x = np.append(media_x, x[-1])
+    media_Y = np.column_stack([media_Y, Y[:, -1]])
+
+    indices = np.empty(max_pontos, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(max_pontos - 2):
+        inicio, fim = limites[i], limites[i + 1]
+        # Dobro da área do triângulo (a, ponto do balde, média do próximo balde)
+        area = np.abs((x[a] - media_x[i + 1]) * (Y[:, inicio:fim] - Y[:, [a]])
+                      - (x[a] - x[inicio:fim]) * (media_Y[:, [i + 1]] - Y[:, [a]])).sum(axis=0)
+        a = inicio + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def reduzir_curvas(x, curvas, max_pontos=MAX_PONTOS):
+    """
+    Reduz várias curvas com o mesmo eixo x aos mesmos pontos (LTTB).
+
+    Parâmetros:
+        x (array): Abscissas crescentes, forma (n,)
+        curvas (sequence): Arrays (n,) a reduzir juntos
+        max_pontos (int): Número máximo de pontos mantidos
+
+    Retorna:
+        tuple: x reduzido seguido das curvas reduzidas, na mesma ordem
+    """
+    curvas = [np.asarray(c) for c in curvas]
+    idx = lttb(x, np.vstack(curvas), max_pontos)
+    return (np.asarray(x)[idx],) + tuple(c[idx] for c in curvas)
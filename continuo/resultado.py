@@ -0,0 +1,151 @@
+"""
+Representação colunar compacta dos resultados.
+
+ResultadoEstacionario guarda cada coluna como um array contíguo (float64
+ou float32) e se comporta como um dicionário somente leitura
+(dados['Biomassa (g/L)']). Colunas podem ser declaradas como funções sem
+argumentos e só são calculadas no primeiro acesso. A conversão para
+pandas ou Arrow reaproveita a memória dos arrays, sem cópia.
+"""
+import threading
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class ResultadoEstacionario(Mapping):
+    """
+    Tabela colunar (nome -> array 1-D) com colunas preguiçosas.
+
+    Parâmetros:
+        colunas (dict): nome -> array ou função sem argumentos que o produz
+        dtype (type): np.float64 (padrão) ou np.float32
+    """
+
+    def __init__(self, colunas, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self._colunas = dict(colunas)
+        self._ordens = {}
+        self._selecoes = {}
+        # O mesmo resultado é compartilhado pelas sessões (cache do processo)
+        self._trava = threading.Lock()
+
+    def __getstate__(self):
+        # Enviado a outros processos (varredura): sem a trava e sem os caches
+        return {'dtype': self.dtype, '_colunas': self._colunas}
+
+    def __setstate__(self, estado):
+        self.__init__(estado['_colunas'], estado['dtype'])
+
+    def __getitem__(self, nome):
+        valor = self._colunas[nome]
+        if callable(valor):
+            valor = valor()
+        if not (isinstance(valor, np.ndarray) and valor.dtype == self.dtype
+                and valor.flags.c_contiguous and not valor.flags.writeable):
+            valor = np.ascontiguousarray(valor, dtype=self.dtype)
+            # Resultados podem ser compartilhados (cache): somente leitura
+            valor.setflags(write=False)
+            self._colunas[nome] = valor
+        return valor
+
+    def __iter__(self):
+        return iter(self._colunas)
+
+    def __len__(self):
+        return len(self._colunas)
+
+    def __repr__(self):
+        return f'ResultadoEstacionario({list(self._colunas)}, linhas={self.n_linhas})'
+
+    @property
+    def n_linhas(self):
+        """Número de linhas (pontos de D) da tabela."""
+        return len(self[next(iter(self._colunas))]) if self._colunas else 0
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelas colunas já calculadas (bytes)."""
+        return sum(v.nbytes for v in self._colunas.values() if isinstance(v, np.ndarray))
+
+    def ordem(self, nome, decrescente=False):
+        """
+        Permutação que ordena a coluna (estável), calculada uma vez e
+        reaproveitada nas consultas seguintes.
+
+        Parâmetros:
+            nome (str): Coluna de ordenação
+            decrescente (bool): Ordem decrescente; empates mantêm a ordem
+                original das linhas, como na crescente
+
+        Retorna:
+            array: Índices das linhas na ordem pedida da coluna
+        """
+        chave = (nome, bool(decrescente))
+        with self._trava:
+            ordem = self._ordens.get(chave)
+        if ordem is None:
+            # Calculada fora da trava; se duas sessões calcularem juntas, fica a primeira
+            valores = self[nome]
+            ordem = np.argsort(-valores if decrescente else valores, kind='stable')
+            ordem.setflags(write=False)
+            with self._trava:
+                ordem = self._ordens.setdefault(chave, ordem)
+        return ordem
+
+    def selecao(self, chave, calcular, max_entradas=8):
+        """
+        Índices de uma consulta (filtros e ordenação) guardados por chave.
+
+        As colunas são somente leitura, então o resultado de uma consulta
+        não muda; só as últimas max_entradas chaves são mantidas. Seguro
+        entre threads (sessões que compartilham o resultado).
+
+        Parâmetros:
+            chave (tuple): Identificação hashable da consulta
+            calcular (callable): Produz os índices quando a chave é nova
+            max_entradas (int): Consultas guardadas
+
+        Retorna:
+            array: Índices (somente leitura)
+        """
+        with self._trava:
+            indices = self._selecoes.get(chave)
+        if indices is None:
+            indices = calcular()
+            indices.setflags(write=False)
+        with self._trava:
+            # Reinsere no fim (mais recente) e remove as mais antigas
+            self._selecoes.pop(chave, None)
+            while len(self._selecoes) >= max_entradas:
+                self._selecoes.pop(next(iter(self._selecoes)))
+            self._selecoes[chave] = indices
+        return indices
+
+    def para_dict(self):
+        """Retorna um dict nome -> array com todas as colunas calculadas."""
+        return {nome: self[nome] for nome in self}
+
+    def para_pandas(self):
+        """Converte em pandas.DataFrame sem copiar os arrays."""
+        import pandas as pd
+        return pd.DataFrame(self.para_dict(), copy=False)
+
+    def para_arrow(self):
+        """Converte em pyarrow.Table sem copiar os arrays."""
+        import pyarrow as pa
+        return pa.table({nome: pa.array(valor) for nome, valor in self.para_dict().items()})
+
+
+def preguicoso(funcao):
+    """
+    Memoriza uma função sem argumentos: calcula na primeira chamada e
+    reaproveita depois. Útil para colunas que saem de um mesmo cálculo.
+    """
+    resultado = []
+
+    def envoltorio():
+        if not resultado:
+            resultado.append(funcao())
+        return resultado[0]
+    return envoltorio
@@ -0,0 +1,96 @@
+"""
+Consultas paginadas sobre a tabela de resultados.
+
+A tabela completa (ResultadoEstacionario) fica no servidor; a página
+recebe apenas as linhas visíveis e, se pedidas, as estatísticas. Filtros
+e ordenação são resolvidos aqui com operações vetorizadas sobre índices.
+A primeira consulta de cada combinação de ordenação e filtros custa O(n)
+(máscaras e permutação); os índices ficam guardados no próprio resultado,
+e as reexecuções seguintes (trocar de página, por exemplo) só fatiam a
+página.
+"""
+import numpy as np
+
+
+def consultar(dados, ordenar_por=None, decrescente=False, filtros=None):
+    """
+    Seleciona e ordena as linhas da tabela.
+
+    Parâmetros:
+        dados (ResultadoEstacionario): Tabela completa
+        ordenar_por (str | None): Coluna de ordenação; None mantém a ordem original
+        decrescente (bool): Ordem decrescente (estável: empates na ordem original)
+        filtros (dict | None): coluna -> (mínimo, máximo); qualquer limite
+            pode ser None (sem limite). Limites inclusivos.
+
+    Retorna:
+        array: Índices das linhas selecionadas, na ordem pedida
+    """
+    filtros = filtros or {}
+    chave = (ordenar_por, bool(decrescente), tuple(sorted(filtros.items())))
+    return dados.selecao(chave, lambda: _selecionar(dados, ordenar_por, decrescente, filtros))
+
+
+def _selecionar(dados, ordenar_por, decrescente, filtros):
+    """Calcula a seleção de consultar (máscara dos filtros + permutação)."""
+    mascara = None
+    for coluna, (minimo, maximo) in filtros.items():
+        valores = dados[coluna]
+        if minimo is not None:
+            mascara = (valores >= minimo) if mascara is None else mascara & (valores >= minimo)
+        if maximo is not None:
+            mascara = (valores <= maximo) if mascara is None else mascara & (valores <= maximo)
+
+    if ordenar_por is None:
+        indices = np.arange(dados.n_linhas) if mascara is None else np.flatnonzero(mascara)
+        return indices[::-1] if decrescente else indices
+    indices = dados.ordem(ordenar_por, decrescente)
+    return indices if mascara is None else indices[mascara[indices]]
+
+
+def n_paginas(indices, tamanho):
+    """Número de páginas (ao menos 1) para a seleção com o tamanho de página dado."""
+    return max(1, -(-len(indices) // tamanho))
+
+
+def pagina(dados, indices, numero, tamanho=100, colunas=None):
+    """
+    Extrai uma página da seleção.
+
+    Parâmetros:
+        dados (ResultadoEstacionario): Tabela completa
+        indices (array): Seleção retornada por consultar
+        numero (int): Página desejada, começando em 1 (limitada às existentes)
+        tamanho (int): Linhas por página
+        colunas (list | None): Colunas a incluir; None = todas
+
+    Retorna:
+        dict: coluna -> array com as linhas da página
+    """
+    numero = min(max(int(numero), 1), n_paginas(indices, tamanho))
+    selecao = indices[(numero - 1) * tamanho:numero * tamanho]
+    return {nome: dados[nome][selecao] for nome in (colunas or dados)}
+
+
+def resumo(dados, indices, colunas=None):
+    """
+    Estatísticas das linhas selecionadas, calculadas no servidor.
+
+    Parâmetros:
+        dados (ResultadoEstacionario): Tabela completa
+        indices (array): Seleção retornada por consultar
+        colunas (list | None): Colunas resumidas; None = todas
+
+    Retorna:
+        dict: 'Coluna', 'Mínimo', 'Máximo', 'Média' e 'Desvio padrão',
+            uma entrada por coluna
+    """
+    colunas = list(colunas or dados)
+    estatisticas = {'Coluna': colunas, 'Mínimo': [], 'Máximo': [], 'Média': [], 'Desvio padrão': []}
+    for nome in colunas:
+        valores = dados[nome][indices] if len(indices) else np.full(1, np.nan)
+        estatisticas['Mínimo'].append(float(np.min(valores)))
+        estatisticas['Máximo'].append(float(np.max(valores)))
+        estatisticas['Média'].append(float(np.mean(valores)))
+        estatisticas['Desvio padrão'].append(float(np.std(valores)))
+    return estatisticas
@@ -0,0 +1,159 @@
+"""
+Varredura de parâmetros em lote para as curvas de estado estacionário.
+
+Avalia o modelo sobre a grade cartesiana de parâmetros
+(u_max x Ks x Sin x Yx_s x Alfa x Beta x A x B x m_s) e o eixo de diluição D.
+As combinações são divididas em blocos de tamanho limitado; cada bloco é
+calculado por broadcasting em uma única chamada do NumPy, e os blocos
+podem ser distribuídos entre processos, com um número limitado de blocos
+em andamento por vez.
+"""
+from collections import deque
+
+import numpy as np
+
+from .modelo import calcular_estado_estacionario, fator_reciclo
+from .resultado import ResultadoEstacionario
+
+# Ordem dos eixos da grade de parâmetros
+PARAMETROS = ('u_max', 'Ks', 'Sin', 'Yx_s', 'Alfa', 'Beta', 'A', 'B', 'm_s')
+
+# Eixos opcionais e seus valores padrão: sem reciclo (A = 0, E = 1, o
+# modelo se reduz ao padrão) e sem manutenção
+OPCIONAIS = {'A': 0.0, 'B': 1.0, 'm_s': 0.0}
+
+# Número máximo de pontos (combinações x D) avaliados por bloco
+PONTOS_POR_BLOCO = 2_000_000
+
+# Colunas da tabela da varredura
+COLUNAS = (*PARAMETROS, 'Diluição (1/h)', 'Biomassa (g/L)', 'Substrato (g/L)', 'Produto (g/L)')
+
+
+def _eixos(parametros):
+    """Converte os valores da grade em arrays 1-D na ordem de PARAMETROS."""
+    faltando = set(PARAMETROS) - set(OPCIONAIS) - set(parametros)
+    if faltando:
+        raise ValueError(f"Parâmetros ausentes na varredura: {sorted(faltando)}")
+    desconhecidos = set(parametros) - set(PARAMETROS)
+    if desconhecidos:
+        raise ValueError(f"Parâmetros desconhecidos: {sorted(desconhecidos)}")
+    return [np.atleast_1d(np.asarray(parametros.get(nome, OPCIONAIS.get(nome)), dtype=np.float64))
+            for nome in PARAMETROS]
+
+
+def _calcular_bloco(tarefa):
+    """
+    Calcula um bloco de combinações [inicio, fim) da grade.
+
+    Função de nível de módulo para poder ser enviada a outros processos.
+    """
+    eixos, Dil, modalidade_associacao, inicio, fim, dtype = tarefa
+    formas = tuple(len(eixo) for eixo in eixos)
+    indices = np.unravel_index(np.arange(inicio, fim), formas)
+    valores = [eixo[idx] for eixo, idx in zip(eixos, indices)]
+    u_max, Ks, Sin, Yx_s, Alfa, Beta, A, B, m_s = (v[:, None] for v in valores)
+
+    S, X, P = calcular_estado_estacionario(
+        Dil[None, :], u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao,
+        fator_reciclo(A, B), m_s=m_s)
+
+    n_D = len(Dil)
+    tabela = {nome: np.repeat(v, n_D) for nome, v in zip(PARAMETROS, valores)}
+    tabela['Diluição (1/h)'] = np.tile(Dil, fim - inicio)
+    tabela['Biomassa (g/L)'] = X.ravel()
+    tabela['Substrato (g/L)'] = S.ravel()
+    tabela['Produto (g/L)'] = P.ravel()
+    return ResultadoEstacionario(tabela, dtype)
+
+
+def _tarefas(parametros, Dil, modalidade_associacao, pontos_por_bloco, dtype):
+    eixos = _eixos(parametros)
+    Dil = np.ascontiguousarray(Dil, dtype=np.float64)
+    total = int(np.prod([len(eixo) for eixo in eixos]))
+    combinacoes_por_bloco = max(1, pontos_por_bloco // max(len(Dil), 1))
+    for inicio in range(0, total, combinacoes_por_bloco):
+        fim = min(inicio + combinacoes_por_bloco, total)
+        yield eixos, Dil, modalidade_associacao, inicio, fim, dtype
+
+
+def em_ordem(executor, funcao, tarefas, janela):
+    """
+    Aplica funcao às tarefas no executor e devolve os resultados em ordem,
+    com no máximo janela tarefas enviadas e ainda não consumidas.
+
+    Ao contrário de Executor.map, o gerador de tarefas é consumido aos
+    poucos: a memória não cresce com o tamanho da grade. Usado também por
+    ajuste.ajustar_lote.
+
+    Parâmetros:
+        executor (Executor): Pool de processos ou threads
+        funcao (callable): Função de nível de módulo aplicada a cada tarefa
+        tarefas (iterable): Tarefas, consumidas sob demanda
+        janela (int): Máximo de tarefas em andamento
+
+    Retorna:
+        generator: Resultados na ordem das tarefas
+    """
+    pendentes = deque()
+    for tarefa in tarefas:
+        pendentes.append(executor.submit(funcao, tarefa))
+        if len(pendentes) >= janela:
+            yield pendentes.popleft().result()
+    while pendentes:
+        yield pendentes.popleft().result()
+
+
+def varrer_blocos(parametros, Dil, modalidade_associacao, pontos_por_bloco=PONTOS_POR_BLOCO,
+                  processos=1, dtype=np.float64):
+    """
+    Gera a tabela da varredura bloco a bloco, com memória limitada.
+
+    Parâmetros:
+        parametros (dict): Valores de cada eixo da grade (escalar ou lista);
+            A, B e m_s são opcionais (padrão: sem reciclo e sem manutenção)
+        Dil (array): Taxas de diluição (1/h)
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        pontos_por_bloco (int): Máximo de pontos (combinações x D) por bloco
+        processos (int): Número de processos; 1 calcula no processo atual;
+            com mais de um, no máximo 2*processos blocos ficam em andamento
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+
+    Retorna:
+        generator: ResultadoEstacionario de cada bloco, em ordem
+    """
+    tarefas = _tarefas(parametros, Dil, modalidade_associacao, pontos_por_bloco, dtype)
+    if processos <= 1:
+        for tarefa in tarefas:
+            yield _calcular_bloco(tarefa)
+        return
+    # Importado só aqui: concurrent.futures pesa na inicialização da página
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        yield from em_ordem(executor, _calcular_bloco, tarefas, 2 * processos)
+
+
+def varrer(parametros, Dil, modalidade_associacao, pontos_por_bloco=PONTOS_POR_BLOCO,
+           processos=1, dtype=np.float64):
+    """
+    Avalia o modelo em toda a grade de parâmetros e retorna uma tabela única.
+
+    Uma linha por combinação de parâmetros e valor de D (formato "tidy").
+    Para grades que não cabem em memória, use varrer_blocos.
+
+    Parâmetros:
+        parametros (dict): Valores de cada eixo da grade (escalar ou lista)
+        Dil (array): Taxas de diluição (1/h)
+        modalidade_associacao (str): 'Associado', 'Semi Associado' ou 'Não Associado'
+        pontos_por_bloco (int): Máximo de pontos (combinações x D) por bloco
+        processos (int): Número de processos
+        dtype (type): Tipo das colunas (np.float64 ou np.float32)
+
+    Retorna:
+        ResultadoEstacionario: Colunas de COLUNAS (parâmetros, Diluição,
+            Biomassa, Substrato e Produto); vazia se algum eixo é vazio
+    """
+    blocos = list(varrer_blocos(parametros, Dil, modalidade_associacao,
+                                pontos_por_bloco, processos, dtype))
+    return ResultadoEstacionario({coluna: np.concatenate([bloco[coluna] for bloco in blocos]
+                                                         or [np.empty(0)])
+                                  for coluna in COLUNAS}, dtype)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from continuo import AJUSTAVEIS, ajustar, ajustar_lote, calcular_estado_estacionario, lineweaver_burk
+
+VERDADEIROS = dict(u_max=0.4, Ks=1.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+SIN = 10.0
+
+
+def _medidas(n_conjuntos=1, ruido=0.0, semente=0):
+    rng = np.random.default_rng(semente)
+    D = np.tile(np.linspace(0.03, 0.34, 12), (n_conjuntos, 1))
+    p = VERDADEIROS
+    S, X, P = calcular_estado_estacionario(D, p['u_max'], p['Ks'], SIN, p['Yx_s'], p['Alfa'],
+                                           p['Beta'], 'Semi Associado')
+    # Ruído aditivo proporcional ao maior valor de cada curva: a mesma
+    # ponderação que ajustar supõe (resíduos relativos à escala da curva)
+    perturbar = lambda v: v + ruido * v.max(axis=1, keepdims=True) * rng.standard_normal(v.shape)  # noqa: E731
+    return D, perturbar(S), perturbar(X), perturbar(P)
+
+
+def test_recupera_os_parametros_sem_ruido():
+    D, S, X, P = _medidas()
+    ajuste = ajustar(D, S, X, P, SIN, 'Semi Associado')
+    assert ajuste['Convergiu'][0] == 1
+    for nome in AJUSTAVEIS:
+        assert ajuste[nome][0] == pytest.approx(VERDADEIROS[nome], rel=1e-6)
+
+
+def test_intervalos_de_confianca_cobrem_o_valor_verdadeiro():
+    # 400 conjuntos com ruído de 2 %: a cobertura do IC de 95 % fica perto de 95 %
+    D, S, X, P = _medidas(400, ruido=0.02, semente=1)
+    ajuste = ajustar(D, S, X, P, SIN, 'Semi Associado')
+    assert np.all(ajuste['Convergiu'] == 1)
+    for nome in AJUSTAVEIS:
+        cobertura = np.mean((ajuste[f'{nome} IC inf'] <= VERDADEIROS[nome])
+                            & (VERDADEIROS[nome] <= ajuste[f'{nome} IC sup']))
+        assert 0.9 <= cobertura <= 0.99, nome
+
+
+def test_lineweaver_burk_exato_sem_ruido():
+    D, S, _, _ = _medidas()
+    u_max, Ks = lineweaver_burk(D[0], S[0])
+    assert u_max == pytest.approx(VERDADEIROS['u_max'])
+    assert Ks == pytest.approx(VERDADEIROS['Ks'])
+
+
+def test_lote_em_blocos_e_processos_igual_ao_ajuste_unico():
+    D, S, X, P = _medidas(30, ruido=0.01, semente=2)
+    dados = {'D': D, 'S': S, 'X': X, 'P': P}
+    unico = ajustar(D, S, X, P, SIN, 'Semi Associado')
+    em_blocos = ajustar_lote(dados, SIN, 'Semi Associado', conjuntos_por_bloco=7)
+    paralelo = ajustar_lote(dados, SIN, 'Semi Associado', conjuntos_por_bloco=4, processos=2)
+    for resultado in (em_blocos, paralelo):
+        np.testing.assert_array_equal(resultado['Conjunto'], np.arange(30))
+        for nome in AJUSTAVEIS:
+            np.testing.assert_allclose(resultado[nome], unico[nome], rtol=1e-9)
+
+
+def test_lote_vazio():
+    vazio = ajustar_lote([], SIN, 'Semi Associado')
+    assert vazio.n_linhas == 0
+    assert set(AJUSTAVEIS) <= set(vazio)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from continuo import CacheResultados, ResultadoEstacionario, memorizar
+from continuo.cache import tamanho_bytes
+
+MB = 2**20
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_lru_remove_a_entrada_menos_usada():
+    cache = CacheResultados(max_entradas=2)
+    for chave in ('a', 'b'):
+        cache.obter(chave, lambda: 0)
+    cache.obter('a', lambda: 0)  # 'a' passa a ser a mais recente
+    cache.obter('c', lambda: 0)
+    assert cache.estatisticas()['entradas'] == 2
+    chamadas = []
+    cache.obter('b', lambda: chamadas.append(1))
+    assert chamadas == [1]
+
+
+def test_ttl_expira():
+    relogio = Relogio()
+    cache = CacheResultados(ttl=10, relogio=relogio)
+    cache.obter('a', lambda: 1)
+    relogio.agora = 11
+    assert cache.obter('a', lambda: 2) == 2
+
+
+def test_orcamento_em_bytes():
+    cache = CacheResultados(max_entradas=100, max_bytes=3 * MB)
+    for i in range(10):
+        cache.obter(i, lambda: np.zeros(MB // 8))
+    assert cache.nbytes() <= 3 * MB
+    assert len(cache) == 3
+
+
+def test_resultado_maior_que_o_orcamento_nao_e_guardado():
+    cache = CacheResultados(max_bytes=MB)
+    valor = cache.obter('grande', lambda: np.zeros(MB))
+    assert valor.nbytes == 8 * MB
+    assert len(cache) == 0
+
+
+def test_colunas_preguicosas_contam_depois_de_calculadas():
+    cache = CacheResultados(max_entradas=100, max_bytes=3 * MB)
+
+    def resultado():
+        return ResultadoEstacionario({'x': lambda: np.ones(MB // 8)})
+
+    guardados = [cache.obter(i, resultado) for i in range(5)]
+    assert len(cache) == 5  # nada calculado ainda
+    for dados in guardados:
+        dados['x']
+    cache.obter(0, resultado)  # acesso seguinte já mede as colunas calculadas
+    assert cache.nbytes() <= 3 * MB
+
+
+def test_tamanho_bytes_de_estruturas_aninhadas():
+    dados = ResultadoEstacionario({'x': np.zeros(10), 'y': lambda: np.zeros(5)})
+    assert tamanho_bytes((dados, 1.0)) == 80
+    assert tamanho_bytes({'a': [np.zeros(2), b'abc']}) == 19
+
+
+def test_memorizar_congela_os_arrays():
+    cache = CacheResultados()
+    funcao = memorizar(cache)(lambda n: np.arange(n))
+    assert funcao(3) is funcao(3)
+    with pytest.raises(ValueError):
+        funcao(3)[0] = 1
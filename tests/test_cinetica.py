@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from continuo import (
+    CINETICAS,
+    calcular_estado_estacionario,
+    calcular_serie,
+    dcritico_cinetica,
+    dcritico_padrao,
+    estados_estacionarios,
+)
+
+MODALIDADES = ('Associado', 'Semi Associado', 'Não Associado')
+ARGUMENTOS = (0.4, 1.0, 10.0, 0.5, 1.83, 0.155)  # u_max, Ks, Sin, Yx_s, Alfa, Beta
+D = np.linspace(0.0, 0.45, 181)
+
+
+def _pelo_registro(modalidade, E=1.0, m_s=0.0, **opcoes):
+    """Monod resolvido pelas raízes do registro, sem o caminho rápido."""
+    u_max, Ks, Sin, Yx_s, Alfa, Beta = ARGUMENTOS
+    S, _, _ = estados_estacionarios(D, *ARGUMENTOS, modalidade, E, m_s=m_s, **opcoes)
+    S = np.fmin.reduce(S, axis=-1)
+    return np.where(np.isnan(S), Sin, S)
+
+
+@pytest.mark.parametrize('m_s', [0.0, 0.02])
+@pytest.mark.parametrize('E', [1.0, 0.7])
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_monod_do_registro_igual_ao_caminho_rapido(modalidade, E, m_s):
+    S, _, _ = calcular_estado_estacionario(D, *ARGUMENTOS, modalidade, E, m_s=m_s)
+    np.testing.assert_allclose(_pelo_registro(modalidade, E, m_s), S, rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_moser_com_n_1_reproduz_monod(modalidade):
+    # Mesma lei de Monod, mas pelo solver genérico do registro
+    rapido = calcular_estado_estacionario(D, *ARGUMENTOS, modalidade)
+    generico = calcular_estado_estacionario(D, *ARGUMENTOS, modalidade, cinetica='Moser',
+                                            parametros_cineticos={'n': 1.0})
+    for obtido, esperado in zip(generico, rapido):
+        np.testing.assert_allclose(obtido, esperado, rtol=1e-9, atol=1e-9)
+
+    serie_rapida = calcular_serie(D, *ARGUMENTOS, modalidade, [1.0, 0.5, 2.0])
+    serie_generica = calcular_serie(D, *ARGUMENTOS, modalidade, [1.0, 0.5, 2.0], cinetica='Moser',
+                                    parametros_cineticos={'n': 1.0})
+    for obtido, esperado in zip(serie_generica, serie_rapida):
+        np.testing.assert_allclose(obtido, esperado, rtol=1e-7, atol=1e-7)
+
+
+def test_dcritico_do_registro():
+    u_max, Ks, Sin = ARGUMENTOS[:3]
+    assert dcritico_cinetica('Monod', u_max, Ks, Sin) == pytest.approx(dcritico_padrao(u_max, Ks, Sin))
+
+
+@pytest.mark.parametrize('cinetica', sorted(CINETICAS))
+def test_estado_estacionario_satisfaz_mu_igual_a_d(cinetica):
+    modelo = CINETICAS[cinetica]
+    extras = modelo.completar(None)
+    S, X, P = calcular_estado_estacionario(D, *ARGUMENTOS, 'Semi Associado', cinetica=cinetica)
+    crescimento = X > 1e-9
+    mu = modelo.mu(S, X, P, ARGUMENTOS[0], ARGUMENTOS[1], **extras)
+    np.testing.assert_allclose(mu[crescimento], D[crescimento], rtol=1e-6, atol=1e-9)
+    assert np.all(X >= 0.0) and np.all(S <= ARGUMENTOS[2])
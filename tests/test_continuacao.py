@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_estado_estacionario, continuar_estacionario, derivadas
+from continuo.cinetica import obter_cinetica
+
+MODALIDADES = ('Associado', 'Semi Associado', 'Não Associado')
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=50.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+KI = 10.0
+
+
+def _argumentos(p):
+    return p['u_max'], p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'], p['Beta']
+
+
+def _ramo(resultado):
+    ramo = resultado['ramos']['Com crescimento']
+    colunas = [np.asarray(ramo[nome]) for nome in
+               ('Diluição (1/h)', 'Substrato (g/L)', 'Biomassa (g/L)', 'Produto (g/L)', 'Estável')]
+    # Linhas de NaN separam ramos desconexos; em D = 0 o autovalor -D é nulo
+    # e, com Beta > 0, P não tem estado estacionário
+    validos = colunas[0] > 0
+    return [coluna[validos] for coluna in colunas]
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_monod_igual_ao_quimiostato(modalidade):
+    resultado = continuar_estacionario(0.5, *_argumentos(PARAMETROS), modalidade)
+    D, S, X, P, estavel = _ramo(resultado)
+    esperado = calcular_estado_estacionario(D, *_argumentos(PARAMETROS), modalidade)
+    for obtido, referencia in zip((S, X, P), esperado):
+        np.testing.assert_allclose(obtido, referencia, rtol=1e-6, atol=1e-6)
+    # Um só ramo, estável até a transcrítica (autovalor 0 no último ponto)
+    assert resultado['convergiu']
+    assert [b['Tipo'] for b in resultado['bifurcacoes']] == ['Transcrítica']
+    assert np.all(estavel[D < D[-1]] == 1)
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_pontos_anulam_os_balancos(modalidade):
+    resultado = continuar_estacionario(0.5, *_argumentos(PARAMETROS), modalidade,
+                                       cinetica='Haldane', parametros_cineticos=(('Ki', KI),))
+    D, S, X, P, _ = _ramo(resultado)
+    p = dict(PARAMETROS, E=1.0, m_s=0.0, Ki=KI, D=D)
+    taxas = derivadas(0.0, np.column_stack([X, S, P]), p, modalidade, obter_cinetica('Haldane'))
+    np.testing.assert_allclose(taxas, 0.0, atol=1e-6 * PARAMETROS['Sin'])
+
+
+def test_haldane_dobra_e_bistabilidade():
+    p = PARAMETROS
+    resultado = continuar_estacionario(0.5, *_argumentos(p), 'Semi Associado', cinetica='Haldane',
+                                       parametros_cineticos=(('Ki', KI),))
+    tipos = {b['Tipo']: b for b in resultado['bifurcacoes']}
+    assert set(tipos) == {'Ponto limite', 'Transcrítica'}
+    # A dobra fica no máximo de mu: S = sqrt(Ks*Ki), D = mu(S)
+    S_dobra = np.sqrt(p['Ks'] * KI)
+    D_dobra = p['u_max'] * S_dobra / (p['Ks'] + S_dobra + S_dobra ** 2 / KI)
+    assert tipos['Ponto limite']['Substrato (g/L)'] == pytest.approx(S_dobra, rel=1e-6)
+    assert tipos['Ponto limite']['Diluição (1/h)'] == pytest.approx(D_dobra, rel=1e-6)
+    # Antes da dobra o ramo é estável; depois dela (S maior) é instável
+    D, S, _, _, estavel = _ramo(resultado)
+    assert np.all(estavel[S < S_dobra * (1 - 1e-3)] == 1)
+    assert np.all(estavel[S > S_dobra * (1 + 1e-3)] == 0)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_estado_estacionario, fator_reciclo, simular_dinamico
+
+MODALIDADES = ('Associado', 'Semi Associado', 'Não Associado')
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=10.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+TEMPO = np.linspace(0.0, 40.0, 81)
+
+
+def _argumentos(p):
+    return p['u_max'], p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'], p['Beta']
+
+
+def test_sem_biomassa_solucao_analitica():
+    # X0 = 0: S e P relaxam exponencialmente para Sin e 0
+    D = np.array([0.05, 0.1, 0.3])
+    r = simular_dinamico(TEMPO, 0.0, 2.0, 4.0, D, *_argumentos(PARAMETROS), 'Semi Associado')
+    decaimento = np.exp(-D[:, None] * TEMPO)
+    Sin = PARAMETROS['Sin']
+    np.testing.assert_array_equal(r['Biomassa (g/L)'], 0.0)
+    np.testing.assert_allclose(r['Substrato (g/L)'], Sin + (2.0 - Sin) * decaimento, rtol=1e-5)
+    np.testing.assert_allclose(r['Produto (g/L)'], 4.0 * decaimento, rtol=1e-5, atol=1e-8)
+
+
+def test_massa_conservada():
+    # Sem reciclo e sem manutenção, Z = X + Yx_s*S obedece a
+    # dZ/dt = D*(Yx_s*Sin - Z), qualquer que seja mu
+    p = PARAMETROS
+    D, X0, S0 = 0.2, 0.1, 1.0
+    r = simular_dinamico(TEMPO, X0, S0, 0.0, D, *_argumentos(p), 'Associado', rtol=1e-8)
+    Z = r['Biomassa (g/L)'][0] + p['Yx_s'] * r['Substrato (g/L)'][0]
+    alvo = p['Yx_s'] * p['Sin']
+    np.testing.assert_allclose(Z, alvo + (X0 + p['Yx_s'] * S0 - alvo) * np.exp(-D * TEMPO),
+                               rtol=1e-6)
+
+
+@pytest.mark.parametrize('A', [0.0, 0.5])
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_converge_ao_estado_estacionario(modalidade, A):
+    B = 1.5
+    E = fator_reciclo(A, B)
+    D = np.array([0.05, 0.15, 0.25, 0.32]) / E
+    t = np.linspace(0.0, 600.0, 7)
+    r = simular_dinamico(t, 0.5, PARAMETROS['Sin'], 0.0, D, *_argumentos(PARAMETROS), modalidade,
+                         A=A, B=B)
+    S, X, P = calcular_estado_estacionario(D, *_argumentos(PARAMETROS), modalidade, E)
+    np.testing.assert_allclose(r['Substrato (g/L)'][:, -1], S, rtol=1e-4)
+    np.testing.assert_allclose(r['Biomassa (g/L)'][:, -1], X, rtol=1e-4)
+    np.testing.assert_allclose(r['Produto (g/L)'][:, -1], P, rtol=1e-4)
+
+
+def test_lavagem_acima_de_dcritico():
+    r = simular_dinamico(np.linspace(0.0, 300.0, 4), 1.0, 5.0, 1.0, 0.5,
+                         *_argumentos(PARAMETROS), 'Associado')
+    assert r['Biomassa (g/L)'][0, -1] < 1e-6
+    assert r['Substrato (g/L)'][0, -1] == pytest.approx(PARAMETROS['Sin'], rel=1e-5)
+
+
+def test_lote_igual_a_um_por_vez():
+    # Cada cenário tem o próprio passo: integrar juntos não muda o resultado
+    # (a menos do arredondamento das somas vetorizadas)
+    D = np.array([0.05, 0.2, 0.35])
+    u_max = np.array([0.4, 0.5, 0.6])
+    p = dict(PARAMETROS)
+    lote = simular_dinamico(TEMPO, 0.2, 3.0, 0.0, D, u_max, *_argumentos(p)[1:], 'Semi Associado')
+    for i in range(len(D)):
+        um = simular_dinamico(TEMPO, 0.2, 3.0, 0.0, D[i], u_max[i], *_argumentos(p)[1:],
+                              'Semi Associado')
+        for coluna in ('Biomassa (g/L)', 'Substrato (g/L)', 'Produto (g/L)'):
+            np.testing.assert_allclose(lote[coluna][i], um[coluna][0], rtol=1e-13)
+
+
+def test_degrau_de_diluicao():
+    # D muda de 0.1 para 0.2 em t = 100: cada patamar atinge seu estado estacionário
+    def D(t, idx):
+        return np.where(t < 100.0, 0.1, 0.2)
+
+    t = np.array([0.0, 100.0, 400.0])
+    r = simular_dinamico(t, 0.5, PARAMETROS['Sin'], 0.0, D, *_argumentos(PARAMETROS), 'Associado')
+    for coluna, D_patamar in ((1, 0.1), (2, 0.2)):
+        S, X, _ = calcular_estado_estacionario(np.array([D_patamar]), *_argumentos(PARAMETROS),
+                                               'Associado')
+        assert r['Substrato (g/L)'][0, coluna] == pytest.approx(S[0], rel=1e-3)
+        assert r['Biomassa (g/L)'][0, coluna] == pytest.approx(X[0], rel=1e-3)
+
+
+def test_t_eval_invalido():
+    with pytest.raises(ValueError):
+        simular_dinamico([0.0, 0.0], 0.5, 1.0, 0.0, 0.1, *_argumentos(PARAMETROS), 'Associado')
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_estado_estacionario
+from continuo.incerteza import NIVEIS_RESUMO, amostrar_parametros, bandas_incerteza
+
+ESPECIFICACAO = dict(u_max=('normal', 0.4, 0.03), Ks=('lognormal', 1.0, 0.3), Sin=10.0,
+                     Yx_s=('uniforme', 0.45, 0.55), Alfa=1.83, Beta=0.155)
+DIL = np.linspace(0.0, 0.45, 46)
+QUANTIS = (0.05, 0.5, 0.95)
+NOMES = (('Biomassa', 1), ('Substrato', 0), ('Produto', 2))
+
+
+def _amostras(n, semente, por_bloco):
+    # As mesmas amostras que bandas_incerteza sorteia, bloco a bloco
+    rng = np.random.default_rng(semente)
+    blocos = []
+    for inicio in range(0, n, por_bloco):
+        p = amostrar_parametros(ESPECIFICACAO, min(por_bloco, n - inicio), rng)
+        blocos.append(calcular_estado_estacionario(
+            DIL[:, None], p['u_max'][None], p['Ks'][None], p['Sin'][None], p['Yx_s'][None],
+            p['Alfa'][None], p['Beta'][None], 'Semi Associado'))
+    return [np.concatenate([b[i] for b in blocos], axis=1) for i in range(3)]
+
+
+def test_bloco_unico_da_quantis_exatos():
+    bandas = bandas_incerteza(DIL, ESPECIFICACAO, 'Semi Associado', 2000, QUANTIS, semente=1)
+    curvas = _amostras(2000, 1, 2000)
+    for nome, i in NOMES:
+        exatos = np.quantile(curvas[i], QUANTIS, axis=1)
+        for q, linha in zip(QUANTIS, exatos):
+            np.testing.assert_allclose(bandas[f'{nome} p{100 * q:g} (g/L)'], linha, rtol=1e-12)
+
+
+def test_blocos_perto_dos_quantis_exatos():
+    # 200 amostras por bloco, 100 blocos: os resumos são incorporados várias
+    # vezes; o erro fica na posição do quantil, da ordem de 1/NIVEIS_RESUMO
+    n, por_bloco = 20_000, 200
+    bandas = bandas_incerteza(DIL, ESPECIFICACAO, 'Semi Associado', n, QUANTIS, semente=2,
+                              pontos_por_bloco=por_bloco * len(DIL))
+    curvas = _amostras(n, 2, por_bloco)
+    for nome, i in NOMES:
+        for q in QUANTIS:
+            banda = bandas[f'{nome} p{100 * q:g} (g/L)']
+            # Fração das amostras abaixo do valor da banda, em cada D
+            abaixo = np.mean(curvas[i] < banda[:, None], axis=1)
+            acima = np.mean(curvas[i] <= banda[:, None], axis=1)
+            folga = 2.0 / NIVEIS_RESUMO
+            assert np.all((abaixo <= q + folga) & (acima >= q - folga))
+
+
+def test_parametros_fixos_dao_a_curva_deterministica():
+    fixos = {nome: (v[1] if isinstance(v, tuple) else v) for nome, v in ESPECIFICACAO.items()}
+    bandas = bandas_incerteza(DIL, fixos, 'Associado', 500, QUANTIS, semente=0)
+    S, X, P = calcular_estado_estacionario(DIL, 0.4, 1.0, 10.0, 0.45, 1.83, 0.155, 'Associado')
+    for q in QUANTIS:
+        np.testing.assert_allclose(bandas[f'Biomassa p{100 * q:g} (g/L)'], X, rtol=1e-12)
+        np.testing.assert_allclose(bandas[f'Substrato p{100 * q:g} (g/L)'], S, rtol=1e-12)
+
+
+def test_distribuicoes():
+    n = 200_000
+    p = amostrar_parametros(ESPECIFICACAO, n, rng=3)
+    assert np.mean(p['u_max']) == pytest.approx(0.4, rel=1e-2)
+    assert np.std(p['u_max']) == pytest.approx(0.03, rel=2e-2)
+    # Lognormal parametrizada pela média e desvio da própria variável
+    assert np.mean(p['Ks']) == pytest.approx(1.0, rel=1e-2)
+    assert np.std(p['Ks']) == pytest.approx(0.3, rel=2e-2)
+    assert p['Yx_s'].min() >= 0.45 and p['Yx_s'].max() < 0.55
+    np.testing.assert_array_equal(p['Sin'], 10.0)
+    assert np.all(p['A'] == 0.0) and np.all(p['m_s'] == 0.0)
+
+    matriz = np.array([[0.01, 0.004], [0.004, 0.04]])
+    p = amostrar_parametros(ESPECIFICACAO, n, rng=4,
+                            covariancia=(('u_max', 'Ks'), (0.4, 1.0), matriz))
+    np.testing.assert_allclose(np.cov(p['u_max'], p['Ks']), matriz, rtol=5e-2)
+
+
+def test_truncamento_e_erros():
+    p = amostrar_parametros(dict(ESPECIFICACAO, u_max=('normal', 0.0, 1.0)), 1000, rng=5)
+    assert p['u_max'].min() == 0.0
+    with pytest.raises(ValueError):
+        amostrar_parametros({'u_max': 0.4}, 10)
+    with pytest.raises(ValueError):
+        amostrar_parametros(dict(ESPECIFICACAO, Ks=('gama', 1.0, 0.1)), 10)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_dados_padrao, calcular_dados_reciclo, dcritico_padrao
+from continuo.malha import malha_adaptativa
+
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=10.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+COLUNAS = ('Biomassa (g/L)', 'Substrato (g/L)', 'Produto (g/L)')
+
+
+def _argumentos(p):
+    return p['u_max'], p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'], p['Beta']
+
+
+def _curvas(reciclo, modalidade, step, tolerancia=None):
+    if reciclo:
+        # E = 0.75: a lavagem (mu(Sin) = D*E) fica abaixo de u_max/E
+        dados, _ = calcular_dados_reciclo(0.5, 1.5, 0.0, 0.6, *_argumentos(PARAMETROS), modalidade,
+                                          step, tolerancia)
+        return dados, dcritico_padrao(PARAMETROS['u_max'], PARAMETROS['Ks'], PARAMETROS['Sin']) / 0.75
+    return calcular_dados_padrao(0.0, 0.45, *_argumentos(PARAMETROS), modalidade, step, tolerancia)
+
+
+@pytest.mark.parametrize('reciclo', [False, True])
+@pytest.mark.parametrize('tolerancia', [1e-2, 1e-3])
+@pytest.mark.parametrize('modalidade', ('Associado', 'Semi Associado', 'Não Associado'))
+def test_reproduz_a_malha_uniforme(modalidade, tolerancia, reciclo):
+    step = 1e-5
+    uniforme, _ = _curvas(reciclo, modalidade, step)
+    adaptativa, Dlavagem = _curvas(reciclo, modalidade, step, tolerancia)
+    Du, Da = np.asarray(uniforme['Diluição (1/h)']), np.asarray(adaptativa['Diluição (1/h)'])
+    assert len(Da) * 100 <= len(Du)
+    # A quina da lavagem é um nó da malha
+    assert np.any(np.isclose(Da, Dlavagem, rtol=1e-12))
+    # O primeiro intervalo (Beta/D singular em D = 0) não é refinado
+    k = Du >= Da[1]
+    for coluna in COLUNAS:
+        f = np.asarray(uniforme[coluna])[k]
+        interpolada = np.interp(Du[k], Da, np.asarray(adaptativa[coluna]))
+        assert np.max(np.abs(interpolada - f)) <= 1.5 * tolerancia * np.ptp(f)
+
+
+def test_orcamento_de_pontos():
+    def avaliar(D):
+        return np.abs(np.sin(40 * D))
+
+    for max_pontos in (5, 50, 300):
+        D, F = malha_adaptativa(avaliar, 0.0, 1.0, 1e-9, max_pontos)
+        assert len(D) <= max_pontos
+        np.testing.assert_array_equal(F, avaliar(D))
+        assert D[0] == 0.0 and D[-1] == 1.0 and np.all(np.diff(D) > 0)
+
+
+def test_largura_minima():
+    # Degrau: sem limite o refinamento perseguiria a descontinuidade
+    def avaliar(D):
+        return np.vstack([D > 0.3, D])
+
+    D, F = malha_adaptativa(avaliar, 0.0, 1.0, 1e-6, 10_000, largura_minima=1e-4)
+    assert np.min(np.diff(D)) >= 0.5e-4
+    assert F.shape == (2, len(D))
+    assert np.min(np.abs(D - 0.3)) < 1e-4
+
+
+def test_curva_linear_nao_e_refinada():
+    D, _ = malha_adaptativa(lambda D: 3 * D + 1, 0.0, 1.0, 1e-6, 1000, pontos_iniciais=17)
+    np.testing.assert_allclose(D, np.linspace(0.0, 1.0, 17))
+
+
+def test_nos_entram_na_malha():
+    D, _ = malha_adaptativa(lambda D: D, 0.0, 1.0, 1e-3, 100, pontos_iniciais=3,
+                            nos=[0.123, -1.0, 2.0, np.nan])
+    np.testing.assert_array_equal(D, [0.0, 0.123, 0.5, 1.0])
+    D, _ = malha_adaptativa(lambda D: D, 0.0, 1.0, 1e-3, 5, nos=[0.123])
+    assert len(D) == 5 and 0.123 in D
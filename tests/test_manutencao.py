@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_estado_estacionario, derivadas, rendimento_aparente
+
+MODALIDADES = ('Associado', 'Semi Associado', 'Não Associado')
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=10.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+DIL = np.linspace(0.0, 0.45, 91)
+
+
+def _argumentos(p):
+    return p['u_max'], p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'], p['Beta']
+
+
+def test_rendimento_aparente_de_pirt():
+    D, Yx_s, m_s = DIL[1:], 0.5, 0.03
+    np.testing.assert_allclose(1 / rendimento_aparente(D, Yx_s, m_s), 1 / Yx_s + m_s / D)
+    assert rendimento_aparente(0.0, Yx_s, m_s) == 0.0
+    np.testing.assert_array_equal(rendimento_aparente(DIL, Yx_s, 0.0), Yx_s)
+
+
+@pytest.mark.parametrize('E', [1.0, 0.8])
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_estado_estacionario_anula_os_balancos(modalidade, E):
+    m_s = 0.03
+    D = DIL[1:]
+    S, X, P = calcular_estado_estacionario(D, *_argumentos(PARAMETROS), modalidade, E, m_s=m_s)
+    assert np.any(X > 0)
+    p = dict(PARAMETROS, E=E, m_s=m_s, D=D)
+    taxas = derivadas(0.0, np.column_stack([X, S, P]), p, modalidade)
+    np.testing.assert_allclose(taxas, 0.0, atol=1e-12)
+
+
+def test_manutencao_reduz_a_biomassa_em_d_baixo():
+    _, sem, _ = calcular_estado_estacionario(DIL, *_argumentos(PARAMETROS), 'Associado')
+    _, com, _ = calcular_estado_estacionario(DIL, *_argumentos(PARAMETROS), 'Associado', m_s=0.03)
+    crescimento = sem > 0
+    assert np.all(com[crescimento] < sem[crescimento])
+    assert com[0] == 0.0
+    # A perda relativa diminui com D (m_s/D)
+    perda = 1 - com[crescimento][1:] / sem[crescimento][1:]
+    assert np.all(np.diff(perda) < 0)
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_m_s_em_lote_igual_a_um_por_vez(modalidade):
+    # Valores de m_s misturados (inclusive 0) avaliados de uma vez por
+    # broadcasting, como na varredura
+    m_s = np.array([0.0, 0.01, 0.03])
+    lote = calcular_estado_estacionario(DIL[None, :], *_argumentos(PARAMETROS), modalidade,
+                                        m_s=m_s[:, None])
+    for i, valor in enumerate(m_s):
+        um = calcular_estado_estacionario(DIL, *_argumentos(PARAMETROS), modalidade, m_s=valor)
+        for obtido, referencia in zip(lote, um):
+            np.testing.assert_allclose(obtido[i], referencia, rtol=1e-14)
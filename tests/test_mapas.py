@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_estado_estacionario, fator_reciclo
+from continuo import mapas
+from continuo.mapas import ler_mapa, mapa_A_B, mapa_D_Sin
+
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+MODALIDADES = ('Associado', 'Semi Associado', 'Não Associado')
+
+
+def _celulas(mapa, n=200, semente=0):
+    ny, nx = mapa['lavagem'].shape
+    rng = np.random.default_rng(semente)
+    return rng.integers(0, ny, n), rng.integers(0, nx, n)
+
+
+def _produtividade_produto(D, X, P, Alfa, Beta, modalidade):
+    if modalidade == 'Associado':
+        return D * P
+    if modalidade == 'Semi Associado':
+        return X * (Alfa * D + Beta)
+    return Beta * X
+
+
+@pytest.mark.parametrize('cinetica, extras', [('Monod', None), ('Haldane', (('Ki', 10.0),))])
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_d_sin_igual_ao_calculo_ponto_a_ponto(modalidade, cinetica, extras, monkeypatch):
+    # Faixas pequenas: a grade dos modelos sem forma fechada é avaliada em várias faixas
+    monkeypatch.setattr(mapas, 'PONTOS_POR_FAIXA', 500)
+    p = PARAMETROS
+    mapa = mapa_D_Sin(0.0, 0.5, 1.0, 50.0, p['u_max'], p['Ks'], p['Yx_s'], p['Alfa'], p['Beta'],
+                      modalidade, n_D=120, n_Sin=90, cinetica=cinetica, parametros_cineticos=extras,
+                      dtype=np.float64)
+    (_, D), (_, Sin) = mapa['eixo_x'], mapa['eixo_y']
+    i, j = _celulas(mapa)
+    S, X, P = calcular_estado_estacionario(D[j], p['u_max'], p['Ks'], Sin[i], p['Yx_s'], p['Alfa'],
+                                           p['Beta'], modalidade, cinetica=cinetica,
+                                           parametros_cineticos=extras)
+    camadas = mapa['camadas']
+    np.testing.assert_allclose(camadas['Biomassa (g/L)'][i, j], X, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(camadas['Substrato (g/L)'][i, j], S, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(camadas['Produto (g/L)'][i, j], P, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(camadas['Produtividade de biomassa (g/L.h)'][i, j], D[j] * X,
+                               rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(camadas['Produtividade de produto (g/L.h)'][i, j],
+                               _produtividade_produto(D[j], X, P, p['Alfa'], p['Beta'], modalidade),
+                               rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(mapa['lavagem'][i, j], ~(X > 0))
+
+
+def test_fronteira_separa_a_lavagem():
+    p = PARAMETROS
+    mapa = mapa_D_Sin(0.0, 0.5, 1.0, 50.0, p['u_max'], p['Ks'], p['Yx_s'], p['Alfa'], p['Beta'],
+                      'Associado', n_D=200, n_Sin=150, E=0.8)
+    (_, D), (_, Sin) = mapa['eixo_x'], mapa['eixo_y']
+    Dcritico, Sin_fronteira = mapa['fronteira']
+    np.testing.assert_array_equal(Sin_fronteira, Sin)
+    np.testing.assert_allclose(Dcritico, p['u_max'] * Sin / (p['Ks'] + Sin) / 0.8)
+    # Abaixo da fronteira há crescimento; acima, lavagem
+    abaixo = D[None, :] < Dcritico[:, None] * (1 - 1e-9)
+    np.testing.assert_array_equal(mapa['lavagem'], ~abaixo)
+
+
+def test_a_b_igual_ao_calculo_ponto_a_ponto():
+    p, D, Sin = PARAMETROS, 0.3, 10.0
+    mapa = mapa_A_B(0.0, 1.0, 0.5, 3.0, D, p['u_max'], p['Ks'], Sin, p['Yx_s'], p['Alfa'],
+                    p['Beta'], 'Semi Associado', n_A=80, n_B=70, dtype=np.float64)
+    (_, A), (_, B) = mapa['eixo_x'], mapa['eixo_y']
+    i, j = _celulas(mapa)
+    E = fator_reciclo(A[j], B[i])
+    _, X, _ = calcular_estado_estacionario(np.full(len(i), D), p['u_max'], p['Ks'], Sin, p['Yx_s'],
+                                           p['Alfa'], p['Beta'], 'Semi Associado', E)
+    X = np.where(E > 0, X, 0.0)
+    np.testing.assert_allclose(mapa['camadas']['Biomassa (g/L)'][i, j], X, rtol=1e-12, atol=1e-12)
+    # E <= 0 entra na máscara; na fronteira, D*E = mu(Sin)
+    assert np.all(mapa['lavagem'][fator_reciclo(A[None, :], B[:, None]) <= 0])
+    A_f, B_f = mapa['fronteira']
+    validos = np.isfinite(B_f)
+    np.testing.assert_allclose(D * fator_reciclo(A_f[validos], B_f[validos]),
+                               p['u_max'] * Sin / (p['Ks'] + Sin))
+
+
+def test_ler_mapa_celula_mais_proxima():
+    p = PARAMETROS
+    mapa = mapa_D_Sin(0.0, 0.5, 1.0, 50.0, p['u_max'], p['Ks'], p['Yx_s'], p['Alfa'], p['Beta'],
+                      'Associado', n_D=11, n_Sin=50)
+    valores = ler_mapa(mapa, 0.26, 20.4)
+    assert valores['Diluição (1/h)'] == pytest.approx(0.25)
+    assert valores['Sin (g/L)'] == pytest.approx(20.0)
+    i, j = 19, 5
+    assert valores['Biomassa (g/L)'] == pytest.approx(float(mapa['camadas']['Biomassa (g/L)'][i, j]))
+    assert valores['Lavagem'] == bool(mapa['lavagem'][i, j])
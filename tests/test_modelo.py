@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_dados_padrao, calcular_dados_reciclo, fator_reciclo
+
+MODALIDADES = ('Associado', 'Semi Associado', 'Não Associado')
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=10.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+
+
+def _argumentos(p):
+    return p['u_max'], p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'], p['Beta']
+
+
+def _laco_original(Dil, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade_associacao, E=1.0):
+    # O laço ponto a ponto que calcular_dados_padrao/_reciclo substituíram
+    # (E = 1 no padrão: multiplicar e dividir por 1.0 é exato)
+    Substrato, Biomassa, Produto = [], [], []
+    for d in Dil:
+        s = (Ks * d * E) / (u_max - d * E)
+        b = Yx_s * (Sin - s) / E
+        if modalidade_associacao == 'Associado':
+            p = Alfa * (Sin - s)
+        elif modalidade_associacao == 'Semi Associado':
+            p = b * (Alfa + Beta / d)
+        else:  # Não Associado
+            p = b * (Beta / d)
+        Substrato.append(s)
+        Biomassa.append(b)
+        Produto.append(p)
+    return np.array(Substrato), np.array(Biomassa), np.array(Produto)
+
+
+def _colunas(dados):
+    return [np.asarray(dados[nome]) for nome in
+            ('Diluição (1/h)', 'Substrato (g/L)', 'Biomassa (g/L)', 'Produto (g/L)')]
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_padrao_igual_ao_laco_bit_a_bit(modalidade):
+    dados, Dcritico = calcular_dados_padrao(0.001, 0.5, *_argumentos(PARAMETROS), modalidade, 0.001)
+    D, S, X, P = _colunas(dados)
+    np.testing.assert_array_equal(D, np.arange(0.001, 0.5, 0.001))
+    # Até Dcritico o laço dava o estado com crescimento; depois, S > Sin
+    abaixo = D < Dcritico
+    esperado = _laco_original(D[abaixo], *_argumentos(PARAMETROS), modalidade)
+    for obtido, referencia in zip((S, X, P), esperado):
+        np.testing.assert_array_equal(obtido[abaixo], referencia)
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_reciclo_igual_ao_laco(modalidade):
+    A, B = 0.5, 1.5
+    E = fator_reciclo(A, B)
+    dados, Dcritico = calcular_dados_reciclo(A, B, 0.001, 0.6, *_argumentos(PARAMETROS), modalidade,
+                                             0.001)
+    D, S, X, P = _colunas(dados)
+    abaixo = S < PARAMETROS['Sin']
+    esperado = _laco_original(D[abaixo], *_argumentos(PARAMETROS), modalidade, E)
+    for obtido, referencia in zip((S, X, P), esperado):
+        np.testing.assert_allclose(obtido[abaixo], referencia, rtol=1e-13)
+    assert Dcritico == pytest.approx(PARAMETROS['u_max'] / E)
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_singularidades_mascaradas(modalidade):
+    # D = 0 (Beta/D) e D = u_max (divisão por zero) sem inf, nan nem avisos
+    with np.errstate(all='raise'):
+        dados, _ = calcular_dados_padrao(0.0, 0.6, *_argumentos(PARAMETROS), modalidade, 0.1)
+        D, S, X, P = _colunas(dados)
+    assert 0.0 in D and PARAMETROS['u_max'] in np.round(D, 12)
+    for coluna in (S, X, P):
+        assert np.all(np.isfinite(coluna))
+    lavagem = D >= PARAMETROS['u_max'] - 1e-12
+    np.testing.assert_array_equal(S[lavagem], PARAMETROS['Sin'])
+    np.testing.assert_array_equal(X[lavagem], 0.0)
+    np.testing.assert_array_equal(P[lavagem], 0.0)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_produtividade, d_otimo, fator_reciclo
+
+ARGUMENTOS = (0.4, 1.0, 10.0, 0.5, 1.83, 0.155)  # u_max, Ks, Sin, Yx_s, Alfa, Beta
+
+
+@pytest.mark.parametrize('E', [1.0, fator_reciclo(0.5, 1.5)])
+@pytest.mark.parametrize('alvo', ['Biomassa', 'Produto'])
+@pytest.mark.parametrize('modalidade', ['Associado', 'Semi Associado', 'Não Associado'])
+def test_forma_fechada_igual_ao_maximo_na_malha(modalidade, alvo, E):
+    otimo = d_otimo(*ARGUMENTOS, modalidade, E, alvo=alvo)
+    D = np.linspace(0.0, ARGUMENTOS[0] / E, 400_001)
+    prod_X, prod_P = calcular_produtividade(D, *ARGUMENTOS, modalidade, E)
+    prod = prod_X if alvo == 'Biomassa' else prod_P
+    assert float(otimo['D ótimo (1/h)']) == pytest.approx(D[np.argmax(prod)], abs=2 * (D[1] - D[0]))
+    assert float(otimo['Produtividade máxima (g/L.h)']) == pytest.approx(np.max(prod), rel=1e-8)
+    assert float(otimo['Produtividade máxima (g/L.h)']) >= np.max(prod) * (1 - 1e-12)
+
+
+def test_vetorizado_sobre_conjuntos_de_parametros():
+    u_max = np.array([0.3, 0.4, 0.5])
+    otimo = d_otimo(u_max, *ARGUMENTOS[1:], 'Semi Associado')
+    for i, u in enumerate(u_max):
+        individual = d_otimo(u, *ARGUMENTOS[1:], 'Semi Associado')
+        assert otimo['D ótimo (1/h)'][i] == pytest.approx(float(individual['D ótimo (1/h)']))
+
+
+@pytest.mark.parametrize('E', [0.0, -0.5, fator_reciclo(1.0, 2.5)])
+def test_sem_estado_estacionario_para_e_nao_positivo(E):
+    otimo = d_otimo(*ARGUMENTOS, 'Semi Associado', E)
+    assert np.isnan(otimo['D ótimo (1/h)'])
+    assert np.isnan(otimo['Produtividade máxima (g/L.h)'])
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_dados_padrao
+from continuo.reducao import lttb, reduzir_curvas
+
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=10.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+
+
+def _lttb_referencia(x, y, max_pontos):
+    # Algoritmo original (Steinarsson, 2013), ponto a ponto
+    n = len(x)
+    tamanho = (n - 2) / (max_pontos - 2)
+    indices, a = [0], 0
+    for i in range(max_pontos - 2):
+        inicio_media = int(np.floor((i + 1) * tamanho)) + 1
+        fim_media = min(int(np.floor((i + 2) * tamanho)) + 1, n)
+        media_x = np.mean(x[inicio_media:fim_media])
+        media_y = np.mean(y[inicio_media:fim_media])
+        inicio, fim = int(np.floor(i * tamanho)) + 1, int(np.floor((i + 1) * tamanho)) + 1
+        maior, escolhido = -1.0, inicio
+        for j in range(inicio, fim):
+            area = abs((x[a] - media_x) * (y[j] - y[a]) - (x[a] - x[j]) * (media_y - y[a]))
+            if area > maior:
+                maior, escolhido = area, j
+        indices.append(escolhido)
+        a = escolhido
+    indices.append(n - 1)
+    return np.array(indices)
+
+
+@pytest.mark.parametrize('n, max_pontos', [(1000, 50), (1001, 3), (5003, 777)])
+def test_igual_ao_algoritmo_original(n, max_pontos):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.random(n))
+    y = np.cumsum(rng.normal(size=n))
+    np.testing.assert_array_equal(lttb(x, y, max_pontos), _lttb_referencia(x, y, max_pontos))
+
+
+def test_orcamento_pontas_e_picos():
+    x = np.linspace(0.0, 1.0, 100_001)
+    y = np.sin(6 * x)
+    y[31_415], y[77_777] = 5.0, -4.0
+    idx = lttb(x, y, 500)
+    assert len(idx) == 500
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 31_415 in idx and 77_777 in idx
+
+
+def test_preserva_a_curva_perto_do_dcritico():
+    p = PARAMETROS
+    dados, Dcritico = calcular_dados_padrao(0.0, 0.45, p['u_max'], p['Ks'], p['Sin'], p['Yx_s'],
+                                            p['Alfa'], p['Beta'], 'Associado', 1e-5)
+    D = dados['Diluição (1/h)']
+    curvas = [dados[nome] for nome in ('Biomassa (g/L)', 'Substrato (g/L)', 'Produto (g/L)')]
+    D_r, *reduzidas = reduzir_curvas(D, curvas, 300)
+    assert len(D_r) == 300
+    # A quina da lavagem é mantida (a menos do passo da malha)
+    assert np.min(np.abs(D_r - Dcritico)) <= 1e-5
+    for completa, reduzida in zip(curvas, reduzidas):
+        # As curvas compartilham os índices e continuam fiéis à curva completa
+        np.testing.assert_array_equal(reduzida, completa[np.searchsorted(D, D_r)])
+        erro = np.abs(np.interp(D, D_r, reduzida) - completa)
+        assert np.max(erro) < 0.01 * np.ptp(completa)
+
+
+def test_curva_curta_e_orcamento_invalido():
+    x = np.arange(10.0)
+    np.testing.assert_array_equal(lttb(x, x ** 2, 10), np.arange(10))
+    with pytest.raises(ValueError):
+        lttb(x, x, 2)
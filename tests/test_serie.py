@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from continuo import calcular_estado_estacionario, calcular_serie, dcritico_padrao
+
+MODALIDADES = ('Associado', 'Semi Associado', 'Não Associado')
+PARAMETROS = dict(u_max=0.4, Ks=1.0, Sin=10.0, Yx_s=0.5, Alfa=1.83, Beta=0.155)
+
+
+def _argumentos(p):
+    return p['u_max'], p['Ks'], p['Sin'], p['Yx_s'], p['Alfa'], p['Beta']
+
+
+@pytest.mark.parametrize('cinetica', ['Monod', 'Haldane'])
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_um_estagio_igual_ao_quimiostato(modalidade, cinetica):
+    # Toda a faixa do controle deslizante: de D = 0 até além de u_max,
+    # passando por Dcritico < D < u_max (lavagem)
+    D = np.unique(np.concatenate([np.linspace(0.0, 0.45, 451), [0.37, 0.399, 0.4]]))
+    S, X, P = calcular_serie(D, *_argumentos(PARAMETROS), modalidade, [1.0], cinetica=cinetica)
+    esperado = calcular_estado_estacionario(D, *_argumentos(PARAMETROS), modalidade,
+                                            cinetica=cinetica)
+    for obtido, referencia in zip((S[0], X[0], P[0]), esperado):
+        np.testing.assert_allclose(obtido, referencia, rtol=1e-7, atol=1e-9)
+
+
+@pytest.mark.parametrize('modalidade', MODALIDADES)
+def test_lavagem_entre_dcritico_e_u_max(modalidade):
+    p = PARAMETROS
+    D = np.linspace(dcritico_padrao(p['u_max'], p['Ks'], p['Sin']) + 1e-4, p['u_max'] - 1e-4, 50)
+    S, X, P = calcular_estado_estacionario(D, *_argumentos(p), modalidade)
+    np.testing.assert_array_equal(S, p['Sin'])
+    np.testing.assert_array_equal(X, 0.0)
+    np.testing.assert_array_equal(P, 0.0)
+
+
+def test_semi_associado_em_d_zero():
+    p = PARAMETROS
+    _, X, P = calcular_serie(np.array([0.0]), *_argumentos(p), 'Semi Associado', [1.0])
+    assert P[0, 0] == pytest.approx(p['Alfa'] * X[0, 0])
+
+
+def test_estagios_iguais_aumentam_a_conversao():
+    D = np.linspace(0.01, 0.3, 30)
+    S, X, _ = calcular_serie(D, *_argumentos(PARAMETROS), 'Associado', [1.0, 1.0, 1.0])
+    assert np.all(np.diff(S, axis=0) <= 1e-12)
+    assert np.all(np.diff(X, axis=0) >= -1e-12)
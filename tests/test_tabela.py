@@ -0,0 +1,75 @@
+import pickle
+import threading
+
+import numpy as np
+
+from continuo import ResultadoEstacionario, consultar, n_paginas, pagina, resumo
+
+
+def _tabela(n=1000, semente=0):
+    rng = np.random.default_rng(semente)
+    # Poucos valores distintos: muitos empates
+    return ResultadoEstacionario({'a': rng.integers(0, 10, n).astype(float),
+                                  'b': rng.random(n)})
+
+
+def test_ordenacao_estavel_nos_dois_sentidos():
+    dados = _tabela()
+    a = dados['a']
+    crescente = consultar(dados, 'a')
+    decrescente = consultar(dados, 'a', decrescente=True)
+    np.testing.assert_array_equal(crescente, np.argsort(a, kind='stable'))
+    np.testing.assert_array_equal(decrescente, np.lexsort((np.arange(len(a)), -a)))
+    # Empates na ordem original das linhas também em ordem decrescente
+    for valor in np.unique(a):
+        linhas = decrescente[a[decrescente] == valor]
+        assert np.all(np.diff(linhas) > 0)
+
+
+def test_filtros_e_pagina_iguais_a_selecao_direta():
+    dados = _tabela()
+    indices = consultar(dados, 'b', True, {'a': (2, 5), 'b': (None, 0.8)})
+    mascara = (dados['a'] >= 2) & (dados['a'] <= 5) & (dados['b'] <= 0.8)
+    esperado = np.flatnonzero(mascara)[np.argsort(-dados['b'][mascara], kind='stable')]
+    np.testing.assert_array_equal(indices, esperado)
+
+    ultima = n_paginas(indices, 100)
+    np.testing.assert_array_equal(pagina(dados, indices, ultima, 100)['b'],
+                                  dados['b'][esperado[(ultima - 1) * 100:]])
+    assert resumo(dados, indices)['Máximo'][1] == dados['b'][esperado[0]]
+
+
+def test_selecao_reaproveitada_entre_reexecucoes():
+    dados = _tabela()
+    filtros = {'a': (1, None)}
+    assert consultar(dados, 'a', True, filtros) is consultar(dados, 'a', True, dict(filtros))
+    assert not consultar(dados, 'a', True, filtros).flags.writeable
+
+
+def test_consultas_concorrentes_no_mesmo_resultado():
+    dados = _tabela(20_000)
+    erros = []
+
+    def sessao(k):
+        try:
+            for i in range(200):
+                limite = float((i + k) % 12)
+                indices = consultar(dados, ('a', 'b')[i % 2], bool(i % 3), {'a': (limite, None)})
+                assert np.all(dados['a'][indices] >= limite)
+        except Exception as erro:  # noqa: BLE001
+            erros.append(erro)
+
+    threads = [threading.Thread(target=sessao, args=(k,)) for k in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not erros
+
+
+def test_resultado_serializavel():
+    dados = _tabela()
+    consultar(dados, 'a', True)
+    copia = pickle.loads(pickle.dumps(dados))
+    np.testing.assert_array_equal(copia['a'], dados['a'])
+    np.testing.assert_array_equal(consultar(copia, 'a', True), consultar(dados, 'a', True))
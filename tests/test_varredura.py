@@ -0,0 +1,52 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from continuo import calcular_estado_estacionario, fator_reciclo
+from continuo.varredura import COLUNAS, PARAMETROS, varrer, varrer_blocos
+
+GRADE = dict(u_max=[0.3, 0.4], Ks=[0.5, 1.0, 2.0], Sin=[10.0, 50.0], Yx_s=0.5,
+             Alfa=[1.83, 2.0], Beta=0.155, A=[0.0, 0.5], B=1.5, m_s=[0.0, 0.02])
+DIL = np.linspace(0.0, 0.6, 61)
+
+
+@pytest.mark.parametrize('modalidade', ('Associado', 'Semi Associado', 'Não Associado'))
+def test_grade_igual_ao_calculo_direto(modalidade):
+    tabela = varrer(GRADE, DIL, modalidade, pontos_por_bloco=500)
+    eixos = [np.atleast_1d(GRADE[nome]) for nome in PARAMETROS]
+    combinacoes = list(itertools.product(*eixos))
+    assert len(tabela['Diluição (1/h)']) == len(combinacoes) * len(DIL)
+    for i, (u_max, Ks, Sin, Yx_s, Alfa, Beta, A, B, m_s) in enumerate(combinacoes):
+        linhas = slice(i * len(DIL), (i + 1) * len(DIL))
+        np.testing.assert_array_equal(tabela['Ks'][linhas], Ks)
+        np.testing.assert_array_equal(tabela['Diluição (1/h)'][linhas], DIL)
+        S, X, P = calcular_estado_estacionario(DIL, u_max, Ks, Sin, Yx_s, Alfa, Beta, modalidade,
+                                               fator_reciclo(A, B), m_s=m_s)
+        np.testing.assert_allclose(tabela['Substrato (g/L)'][linhas], S, rtol=1e-12)
+        np.testing.assert_allclose(tabela['Biomassa (g/L)'][linhas], X, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(tabela['Produto (g/L)'][linhas], P, rtol=1e-12, atol=1e-15)
+
+
+def test_blocos_nao_mudam_o_resultado():
+    inteira = varrer(GRADE, DIL, 'Semi Associado')
+    for pontos_por_bloco in (1, 61, 1000):
+        blocos = list(varrer_blocos(GRADE, DIL, 'Semi Associado', pontos_por_bloco))
+        assert all(len(bloco['Diluição (1/h)']) <= max(pontos_por_bloco, len(DIL)) for bloco in blocos)
+        for coluna in COLUNAS:
+            np.testing.assert_array_equal(np.concatenate([bloco[coluna] for bloco in blocos]),
+                                          inteira[coluna])
+
+
+def test_parametro_ausente_ou_desconhecido():
+    with pytest.raises(ValueError):
+        varrer({nome: v for nome, v in GRADE.items() if nome != 'Ks'}, DIL, 'Associado')
+    with pytest.raises(ValueError):
+        varrer(dict(GRADE, Kd=1.0), DIL, 'Associado')
+
+
+def test_processos_igual_a_serial():
+    serial = varrer(GRADE, DIL, 'Associado', pontos_por_bloco=200)
+    paralelo = varrer(GRADE, DIL, 'Associado', pontos_por_bloco=200, processos=2)
+    for coluna in COLUNAS:
+        np.testing.assert_array_equal(paralelo[coluna], serial[coluna])